@@ -9,19 +9,23 @@
 #             actionsFreqsAngles: returns (jr,lz,jz,Or,Op,Oz,ar,ap,az)
 #
 ###############################################################################
-import copy
+import math
+import warnings
 
 import numpy
 from scipy import integrate, optimize
 
 from ..potential import _dim, epifreq, omegac, vcirc
-from ..potential.planarPotential import _evaluateplanarPotentials
-from ..potential.Potential import _evaluatePotentials
+from ..potential.Potential import _check_c, _evaluatePotentials
 from ..potential.Potential import flatten as flatten_potential
-from ..util import quadpack
+from ..util import galpyWarning, multi, quadpack
+from . import actionAngleSpherical_c, actionAngleSpherical_numba
 from .actionAngle import UnboundError, actionAngle
+from .actionAngleSpherical_c import _ext_loaded as ext_loaded
 
 _EPS = 10.0**-15.0
+_TOL = 10.0**-12.0  # absolute and relative tolerance for the rperi and rap roots
+_NGL = 10  # number of Gauss-Legendre points for fixed_quad=True
 
 
 class actionAngleSpherical(actionAngle):
@@ -39,6 +43,10 @@ class actionAngleSpherical(actionAngle):
             Distance scale for translation into internal units (default from configuration file).
         vo : float or Quantity, optional
             Velocity scale for translation into internal units (default from configuration file).
+        c : bool, optional
+            If True, use C to compute the actions and peri- and apocenters (default: False); frequencies and angles are always computed in Python.
+        numba : bool, optional
+            If True and numba is installed, use numba-compiled integrands and peri- and apocenter solver for an IsochronePotential, PlummerPotential, HernquistPotential, NFWPotential, or KeplerPotential (default: False); compiling these takes a few seconds once per process and potential type, so this only pays off when evaluating many phase-space points.
         _gamma : float, optional
             Replace Lz by Lz+gamma Jz in effective potential when using this class as part of actionAngleAdiabatic (internal use).
 
@@ -58,15 +66,64 @@ class actionAngleSpherical(actionAngle):
             self._2dpot = [p.toPlanar() for p in self._pot]
         else:
             self._2dpot = self._pot.toPlanar()
-        # The following for if we ever implement this code in C
-        self._c = False
-        ext_loaded = False
-        if ext_loaded and (("c" in kwargs and kwargs["c"]) or not "c" in kwargs):
-            self._c = True  # pragma: no cover
+        # Flat list of the planar potentials, for fast evaluation
+        self._2dpot_list = (
+            self._2dpot if isinstance(self._2dpot, list) else [self._2dpot]
+        )
+        # Integrands, numba-compiled versions when requested and available for
+        # this potential
+        if kwargs.get("numba", False):
+            numba_integrands = actionAngleSpherical_numba.parse_potential(
+                self._2dpot_list
+            )
+        else:
+            numba_integrands = None
+        if numba_integrands is None:
+            self._integrands = {
+                "Jr": _JrSphericalIntegrand,
+                "Jr_quad": _JrSphericalIntegrand,
+                "TrSmall": _TrSphericalIntegrandSmall,
+                "TrLarge": _TrSphericalIntegrandLarge,
+                "ISmall": _ISphericalIntegrandSmall,
+                "ILarge": _ISphericalIntegrandLarge,
+            }
+            self._potargs = (self._evaluate_2dpot,)
+        else:
+            self._integrands, self._potargs = numba_integrands
+        self._compiled_integrands = not numba_integrands is None
+        if ext_loaded and "c" in kwargs and kwargs["c"]:
+            self._c = _dim(self._pot) == 3 and _check_c(self._pot)
+            if not self._c:
+                warnings.warn(
+                    "C module not used because potential does not have a C implementation",
+                    galpyWarning,
+                )  # pragma: no cover
         else:
             self._c = False
         # gamma for when we use this as part of the adiabatic approx.
         self._gamma = kwargs.get("_gamma", 0.0)
+        # Minimum of the potential, Phi(0), used to bracket the pericenter
+        # (None if not finite)
+        with numpy.errstate(all="ignore"):
+            try:
+                potmin = self._evaluate_2dpot(0.0)
+            except Exception:
+                potmin = numpy.nan
+        self._potmin = potmin if numpy.isfinite(potmin) else None
+        # Compiled peri- and apocenter solver and its extra arguments
+        if self._compiled_integrands:
+            self._compiled_rperi_rap = self._integrands["RperiRap"]
+            self._compiled_rperi_rap_args = (
+                *self._potargs,
+                self._gamma,
+                numpy.nan if self._potmin is None else self._potmin,
+                _EPS,
+                _TOL,
+            )
+        else:
+            self._compiled_rperi_rap = None
+        # Gauss-Legendre nodes and weights for fixed_quad=True
+        self._glx, self._glw = numpy.polynomial.legendre.leggauss(_NGL)
         # Check the units
         self._check_consistent_units()
         return None
@@ -85,8 +142,12 @@ class actionAngleSpherical(actionAngle):
             b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument
         fixed_quad: bool, optional
             if True, use n=10 fixed_quad integration
+        numcores: int, optional
+            number of cores to use for multiprocessing over the objects (default: 1)
+        c: bool, optional
+            True/False to override the object-wide setting for whether or not to use the C implementation
         **kwargs: dict, optional
-            scipy.integrate.quadrature or .fixed_quad keywords
+            scipy.integrate.quad or galpy.util.quadpack.quadrature keywords
 
         Returns
         -------
@@ -98,7 +159,9 @@ class actionAngleSpherical(actionAngle):
         - 2013-12-28 - Written - Bovy (IAS)
         """
         fixed_quad = kwargs.pop("fixed_quad", False)
+        numcores = kwargs.pop("numcores", 1)
         extra_Jz = kwargs.pop("_Jz", None)
+        use_c = self._use_c(kwargs)
         if len(args) == 5:  # R,vR.vT, z, vz
             R, vR, vT, z, vz = args
         elif len(args) == 6:  # R,vR.vT, z, vz, phi
@@ -110,41 +173,36 @@ class actionAngleSpherical(actionAngle):
             vT = self._eval_vT
             z = self._eval_z
             vz = self._eval_vz
-        if isinstance(R, float):
-            R = numpy.array([R])
-            vR = numpy.array([vR])
-            vT = numpy.array([vT])
-            z = numpy.array([z])
-            vz = numpy.array([vz])
-        if self._c:  # pragma: no cover
-            pass
-        else:
-            r = numpy.sqrt(R**2.0 + z**2.0)
-            vr = (R * vR + z * vz) / r
-            Lz = R * vT
-            Lx = -z * vT
-            Ly = z * vR - R * vz
-            L2 = Lx * Lx + Ly * Ly + Lz * Lz
-            E = (
-                _evaluateplanarPotentials(self._2dpot, r)
-                + vR**2.0 / 2.0
-                + vT**2.0 / 2.0
-                + vz**2.0 / 2.0
+        R, vR, vT, z, vz = numpy.atleast_1d(R, vR, vT, z, vz)
+        r, vr, vtheta, vt, Lz, L2, L, E = self._calc_kinematics(
+            R, vR, vT, z, vz, extra_Jz=extra_Jz
+        )
+        # Actions
+        Jphi = Lz
+        Jz = L - numpy.fabs(Lz)
+        if use_c:
+            Jr, err = actionAngleSpherical_c.actionAngleSpherical_c(self._pot, r, E, L)
+            if err == 0:
+                return (Jr, Jphi, Jz)
+            else:  # pragma: no cover
+                raise UnboundError("Orbit seems to be unbound")
+        # Circular velocity, used to detect circular orbits and turning points
+        vc = vcirc(self._2dpot, r, use_physical=False)
+        # Jr requires some more work
+        if fixed_quad:
+            rperi, rap = self._calc_rperi_rap_batch(
+                r, vr, vt, E, L, vc, numcores=numcores
             )
-            L = numpy.sqrt(L2)
-            vt = L / r
-            if self._gamma != 0.0 and not extra_Jz is None:
-                L += self._gamma * extra_Jz
-                E += L**2.0 / 2.0 / r**2.0 - vt**2.0 / 2.0
-            # Actions
-            Jphi = Lz
-            Jz = L - numpy.fabs(Lz)
-            # Jr requires some more work
-            Jr = []
-            for ii in range(len(r)):
-                rperi, rap = self._calc_rperi_rap(r[ii], vr[ii], vt[ii], E[ii], L[ii])
-                Jr.append(self._calc_jr(rperi, rap, E[ii], L[ii], fixed_quad, **kwargs))
-            return (numpy.array(Jr), Jphi, Jz)
+            Jr = self._calc_jr_vec(rperi, rap, E, L)
+            return (Jr, Jphi, Jz)
+        Jr = self._map_orbits(
+            lambda ii: self._calc_jr_orbit(
+                r[ii], vr[ii], vt[ii], E[ii], L[ii], vc[ii], fixed_quad, **kwargs
+            ),
+            len(r),
+            numcores,
+        )
+        return (Jr, Jphi, Jz)
 
     def _actionsFreqs(self, *args, **kwargs):
         """
@@ -160,8 +218,10 @@ class actionAngleSpherical(actionAngle):
             b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument
         fixed_quad: bool, optional
             if True, use n=10 fixed_quad integration
+        numcores: int, optional
+            number of cores to use for multiprocessing over the objects (default: 1)
         **kwargs: dict, optional
-            scipy.integrate.quadrature or .fixed_quad keywords
+            scipy.integrate.quad or galpy.util.quadpack.quadrature keywords
 
         Returns
         -------
@@ -173,6 +233,8 @@ class actionAngleSpherical(actionAngle):
         - 2013-12-28 - Written - Bovy (IAS)
         """
         fixed_quad = kwargs.pop("fixed_quad", False)
+        numcores = kwargs.pop("numcores", 1)
+        kwargs.pop("c", None)  # frequencies and angles are only done in Python
         if len(args) == 5:  # R,vR.vT, z, vz
             R, vR, vT, z, vz = args
         elif len(args) == 6:  # R,vR.vT, z, vz, phi
@@ -184,61 +246,27 @@ class actionAngleSpherical(actionAngle):
             vT = self._eval_vT
             z = self._eval_z
             vz = self._eval_vz
-        if isinstance(R, float):
-            R = numpy.array([R])
-            vR = numpy.array([vR])
-            vT = numpy.array([vT])
-            z = numpy.array([z])
-            vz = numpy.array([vz])
-        if self._c:  # pragma: no cover
-            pass
+        R, vR, vT, z, vz = numpy.atleast_1d(R, vR, vT, z, vz)
+        r, vr, vtheta, vt, Lz, L2, L, E = self._calc_kinematics(R, vR, vT, z, vz)
+        # Circular velocity, used to detect circular orbits and turning points
+        vc = vcirc(self._2dpot, r, use_physical=False)
+        # Actions
+        Jphi = Lz
+        Jz = L - numpy.fabs(Lz)
+        # Jr requires some more work
+        if fixed_quad:
+            Jr, Or, Oz = self._calc_jr_or_op_vec(r, vr, vt, E, L, vc, numcores=numcores)
         else:
-            r = numpy.sqrt(R**2.0 + z**2.0)
-            vr = (R * vR + z * vz) / r
-            Lz = R * vT
-            Lx = -z * vT
-            Ly = z * vR - R * vz
-            L2 = Lx * Lx + Ly * Ly + Lz * Lz
-            E = (
-                _evaluateplanarPotentials(self._2dpot, r)
-                + vR**2.0 / 2.0
-                + vT**2.0 / 2.0
-                + vz**2.0 / 2.0
+            Jr, Or, Oz = self._map_orbits(
+                lambda ii: self._calc_jr_or_op_orbit(
+                    r[ii], vr[ii], vt[ii], E[ii], L[ii], vc[ii], fixed_quad, **kwargs
+                ),
+                len(r),
+                numcores,
+                nout=3,
             )
-            L = numpy.sqrt(L2)
-            vt = L / r
-            # Actions
-            Jphi = Lz
-            Jz = L - numpy.fabs(Lz)
-            # Jr requires some more work
-            Jr = []
-            Or = []
-            Op = []
-            for ii in range(len(r)):
-                rperi, rap = self._calc_rperi_rap(r[ii], vr[ii], vt[ii], E[ii], L[ii])
-                Jr.append(self._calc_jr(rperi, rap, E[ii], L[ii], fixed_quad, **kwargs))
-                # Radial period
-                if Jr[-1] < 10.0**-9.0:  # Circular orbit
-                    Or.append(epifreq(self._2dpot, r[ii], use_physical=False))
-                    Op.append(omegac(self._2dpot, r[ii], use_physical=False))
-                    continue
-                Rmean = (
-                    numpy.exp((numpy.log(rperi) + numpy.log(rap)) / 2.0)
-                    if rperi > 0.0
-                    else rap / 2.0
-                )
-                Or.append(
-                    self._calc_or(Rmean, rperi, rap, E[ii], L[ii], fixed_quad, **kwargs)
-                )
-                Op.append(
-                    self._calc_op(
-                        Or[-1], Rmean, rperi, rap, E[ii], L[ii], fixed_quad, **kwargs
-                    )
-                )
-            Op = numpy.array(Op)
-            Oz = copy.copy(Op)
-            Op[vT < 0.0] *= -1.0
-            return (numpy.array(Jr), Jphi, Jz, numpy.array(Or), Op, Oz)
+        Op = numpy.where(vT < 0.0, -1.0, 1.0) * Oz
+        return (Jr, Jphi, Jz, Or, Op, Oz)
 
     def _actionsFreqsAngles(self, *args, **kwargs):
         """
@@ -254,8 +282,10 @@ class actionAngleSpherical(actionAngle):
             b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument
         fixed_quad: bool, optional
             if True, use n=10 fixed_quad integration
+        numcores: int, optional
+            number of cores to use for multiprocessing over the objects (default: 1)
         **kwargs: dict, optional
-            scipy.integrate.quadrature or .fixed_quad keywords
+            scipy.integrate.quad or galpy.util.quadpack.quadrature keywords
 
         Returns
         -------
@@ -267,6 +297,8 @@ class actionAngleSpherical(actionAngle):
         - 2013-12-29 - Written - Bovy (IAS)
         """
         fixed_quad = kwargs.pop("fixed_quad", False)
+        numcores = kwargs.pop("numcores", 1)
+        kwargs.pop("c", None)  # frequencies and angles are only done in Python
         if len(args) == 5:  # R,vR.vT, z, vz pragma: no cover
             raise OSError("You need to provide phi when calculating angles")
         elif len(args) == 6:  # R,vR.vT, z, vz, phi
@@ -279,119 +311,43 @@ class actionAngleSpherical(actionAngle):
             z = self._eval_z
             vz = self._eval_vz
             phi = self._eval_phi
-        if isinstance(R, float):
-            R = numpy.array([R])
-            vR = numpy.array([vR])
-            vT = numpy.array([vT])
-            z = numpy.array([z])
-            vz = numpy.array([vz])
-            phi = numpy.array([phi])
-        if self._c:  # pragma: no cover
-            pass
-        else:
-            r = numpy.sqrt(R**2.0 + z**2.0)
-            vr = (R * vR + z * vz) / r
-            vtheta = (z * vR - R * vz) / r
-            Lz = R * vT
-            Lx = -z * vT
-            Ly = z * vR - R * vz
-            L2 = Lx * Lx + Ly * Ly + Lz * Lz
-            E = (
-                _evaluateplanarPotentials(self._2dpot, r)
-                + vR**2.0 / 2.0
-                + vT**2.0 / 2.0
-                + vz**2.0 / 2.0
-            )
-            L = numpy.sqrt(L2)
-            vt = L / r
-            # Actions
-            Jphi = Lz
-            Jz = L - numpy.fabs(Lz)
-            # Jr requires some more work
-            Jr = []
-            Or = []
-            Op = []
-            ar = []
-            az = []
-            # Calculate the longitude of the ascending node
-            asc = self._calc_long_asc(z, R, vtheta, phi, Lz, L)
-            for ii in range(len(r)):
-                rperi, rap = self._calc_rperi_rap(r[ii], vr[ii], vt[ii], E[ii], L[ii])
-                Jr.append(self._calc_jr(rperi, rap, E[ii], L[ii], fixed_quad, **kwargs))
-                # Radial period
-                Rmean = (
-                    numpy.exp((numpy.log(rperi) + numpy.log(rap)) / 2.0)
-                    if rperi > 0
-                    else rap / 2.0
-                )
-                if Jr[-1] < 10.0**-9.0:  # Circular orbit
-                    Or.append(epifreq(self._2dpot, r[ii], use_physical=False))
-                    Op.append(omegac(self._2dpot, r[ii], use_physical=False))
-                else:
-                    Or.append(
-                        self._calc_or(
-                            Rmean, rperi, rap, E[ii], L[ii], fixed_quad, **kwargs
-                        )
-                    )
-                    Op.append(
-                        self._calc_op(
-                            Or[-1],
-                            Rmean,
-                            rperi,
-                            rap,
-                            E[ii],
-                            L[ii],
-                            fixed_quad,
-                            **kwargs,
-                        )
-                    )
-                # Angles
-                ar.append(
-                    self._calc_angler(
-                        Or[-1],
-                        r[ii],
-                        Rmean,
-                        rperi,
-                        rap,
-                        E[ii],
-                        L[ii],
-                        vr[ii],
-                        fixed_quad,
-                        **kwargs,
-                    )
-                )
-                az.append(
-                    self._calc_anglez(
-                        Or[-1],
-                        Op[-1],
-                        ar[-1],
-                        z[ii],
-                        r[ii],
-                        Rmean,
-                        rperi,
-                        rap,
-                        E[ii],
-                        L[ii],
-                        Lz[ii],
-                        vr[ii],
-                        vtheta[ii],
-                        phi[ii],
-                        fixed_quad,
-                        **kwargs,
-                    )
-                )
-            Op = numpy.array(Op)
-            Oz = copy.copy(Op)
-            Op[vT < 0.0] *= -1.0
-            ap = copy.copy(asc)
-            ar = numpy.array(ar)
-            az = numpy.array(az)
-            ap[vT < 0.0] -= az[vT < 0.0]
-            ap[vT >= 0.0] += az[vT >= 0.0]
-            ar = ar % (2.0 * numpy.pi)
-            ap = ap % (2.0 * numpy.pi)
-            az = az % (2.0 * numpy.pi)
-            return (numpy.array(Jr), Jphi, Jz, numpy.array(Or), Op, Oz, ar, ap, az)
+        R, vR, vT, z, vz, phi = numpy.atleast_1d(R, vR, vT, z, vz, phi)
+        r, vr, vtheta, vt, Lz, L2, L, E = self._calc_kinematics(R, vR, vT, z, vz)
+        # Circular velocity, used to detect circular orbits and turning points
+        vc = vcirc(self._2dpot, r, use_physical=False)
+        # Actions
+        Jphi = Lz
+        Jz = L - numpy.fabs(Lz)
+        # Calculate the longitude of the ascending node
+        asc = self._calc_long_asc(z, R, vtheta, phi, Lz, L)
+        # Jr, frequencies, and angles require some more work
+        Jr, Or, Op, ar, az = self._map_orbits(
+            lambda ii: self._calc_jr_or_op_angles_orbit(
+                r[ii],
+                vr[ii],
+                vt[ii],
+                z[ii],
+                vtheta[ii],
+                phi[ii],
+                E[ii],
+                L[ii],
+                Lz[ii],
+                vc[ii],
+                fixed_quad,
+                **kwargs,
+            ),
+            len(r),
+            numcores,
+            nout=5,
+        )
+        sign = numpy.where(vT < 0.0, -1.0, 1.0)
+        Oz = Op
+        Op = sign * Oz
+        ap = asc + sign * az
+        ar = ar % (2.0 * numpy.pi)
+        ap = ap % (2.0 * numpy.pi)
+        az = az % (2.0 * numpy.pi)
+        return (Jr, Jphi, Jz, Or, Op, Oz, ar, ap, az)
 
     def _EccZmaxRperiRap(self, *args, **kwargs):
         """
@@ -405,6 +361,10 @@ class actionAngleSpherical(actionAngle):
                 1) floats: phase-space value for single object (phi is optional) (each can be a Quantity)
                 2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
             b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument
+        numcores: int, optional
+            number of cores to use for multiprocessing over the objects (default: 1)
+        c: bool, optional
+            True/False to override the object-wide setting for whether or not to use the C implementation
 
         Returns
         -------
@@ -416,6 +376,8 @@ class actionAngleSpherical(actionAngle):
         - 2017-12-22 - Written - Bovy (UofT)
         """
         extra_Jz = kwargs.pop("_Jz", None)
+        numcores = kwargs.pop("numcores", 1)
+        use_c = self._use_c(kwargs)
         if len(args) == 5:  # R,vR.vT, z, vz
             R, vR, vT, z, vz = args
         elif len(args) == 6:  # R,vR.vT, z, vz, phi
@@ -427,256 +389,431 @@ class actionAngleSpherical(actionAngle):
             vT = self._eval_vT
             z = self._eval_z
             vz = self._eval_vz
-        if isinstance(R, float):
-            R = numpy.array([R])
-            vR = numpy.array([vR])
-            vT = numpy.array([vT])
-            z = numpy.array([z])
-            vz = numpy.array([vz])
-        if self._c:  # pragma: no cover
-            pass
+        R, vR, vT, z, vz = numpy.atleast_1d(R, vR, vT, z, vz)
+        r, vr, vtheta, vt, Lz, L2, L, E = self._calc_kinematics(
+            R, vR, vT, z, vz, extra_Jz=extra_Jz
+        )
+        if use_c:
+            rperi, rap, err = actionAngleSpherical_c.actionAngleRperiRapSpherical_c(
+                self._pot, r, E, L
+            )
+            if err != 0:  # pragma: no cover
+                raise UnboundError("Orbit seems to be unbound")
         else:
-            r = numpy.sqrt(R**2.0 + z**2.0)
-            vr = (R * vR + z * vz) / r
-            Lz = R * vT
-            Lx = -z * vT
-            Ly = z * vR - R * vz
-            L2 = Lx * Lx + Ly * Ly + Lz * Lz
-            L = numpy.sqrt(L2)
-            E = (
-                _evaluateplanarPotentials(self._2dpot, r)
-                + vR**2.0 / 2.0
-                + vT**2.0 / 2.0
-                + vz**2.0 / 2.0
+            # Circular velocity, used to detect circular orbits and turning points
+            vc = vcirc(self._2dpot, r, use_physical=False)
+            rperi, rap = self._calc_rperi_rap_batch(
+                r, vr, vt, E, L, vc, numcores=numcores
             )
-            vt = L / r
-            if self._gamma != 0.0 and not extra_Jz is None:
-                L += self._gamma * extra_Jz
-                E += L**2.0 / 2.0 / r**2.0 - vt**2.0 / 2.0
-            rperi, rap = [], []
-            for ii in range(len(r)):
-                trperi, trap = self._calc_rperi_rap(r[ii], vr[ii], vt[ii], E[ii], L[ii])
-                rperi.append(trperi)
-                rap.append(trap)
-            rperi = numpy.array(rperi)
-            rap = numpy.array(rap)
-            return (
-                (rap - rperi) / (rap + rperi),
-                rap * numpy.sqrt(1.0 - Lz**2.0 / L2),
-                rperi,
-                rap,
+        return (
+            (rap - rperi) / (rap + rperi),
+            rap * numpy.sqrt(1.0 - Lz * Lz / L2),
+            rperi,
+            rap,
+        )
+
+    def _use_c(self, kwargs):
+        # Whether to use C, popping the per-call c= override from kwargs
+        c = kwargs.pop("c", None)
+        if c is None:
+            return self._c
+        use_c = bool(c) and ext_loaded and _dim(self._pot) == 3 and _check_c(self._pot)
+        if c and not use_c:
+            warnings.warn(
+                "C module not used because potential does not have a C implementation",
+                galpyWarning,
+            )  # pragma: no cover
+        return use_c
+
+    def _calc_kinematics(self, R, vR, vT, z, vz, extra_Jz=None):
+        """Compute r, vr, vtheta, vt, Lz, L^2, L, and E for all phase-space points in one go"""
+        r = numpy.sqrt(R * R + z * z)
+        vr = (R * vR + z * vz) / r
+        Ly = z * vR - R * vz
+        vtheta = Ly / r
+        Lz = R * vT
+        # Lx^2+Lz^2 = (z^2+R^2) vT^2; r vT is |Lz| exactly when z=0
+        rvT = r * vT
+        L2 = rvT * rvT + Ly * Ly
+        E = self._evaluate_2dpot(r) + (vR * vR + vT * vT + vz * vz) / 2.0
+        L = numpy.sqrt(L2)
+        vt = L / r
+        if self._gamma != 0.0 and not extra_Jz is None:
+            L += self._gamma * extra_Jz
+            E += L * L / 2.0 / r / r - vt * vt / 2.0
+        return (r, vr, vtheta, vt, Lz, L2, L, E)
+
+    def _evaluate_2dpot(self, R):
+        """Evaluate the planar potential, bypassing the checks in _evaluateplanarPotentials"""
+        out = 0.0
+        for pot in self._2dpot_list:
+            out += pot._amp * pot._evaluate(R)
+        return out
+
+    def _calc_rperi_rap(self, r, vr, vt, E, L, vc):
+        # vc: circular velocity at r
+        if not self._compiled_rperi_rap is None:
+            rperi, rap, success = self._compiled_rperi_rap(
+                r, vr, vt, E, L, vc, *self._compiled_rperi_rap_args
             )
-
-    def _calc_rperi_rap(self, r, vr, vt, E, L):
-        if (
-            vr == 0.0
-            and numpy.fabs(vt - vcirc(self._2dpot, r, use_physical=False)) < _EPS
-        ):
+            if success:
+                return (rperi, rap)
+            # Otherwise fall through, such that the appropriate error is raised
+        args = (E, L, self._evaluate_2dpot)
+        if vr == 0.0 and math.fabs(vt - vc) < _EPS:
             # We are on a circular orbit
             rperi = r
             rap = r
-        elif vr == 0.0 and vt > vcirc(self._2dpot, r, use_physical=False):
+        elif vr == 0.0 and vt > vc:
             # We are exactly at pericenter
             rperi = r
             if self._gamma != 0.0:
-                startsign = _rapRperiAxiEq(r + 10.0**-8.0, E, L, self._2dpot)
-                startsign /= numpy.fabs(startsign)
+                startsign = _rapRperiAxiEq(r + 10.0**-8.0, *args)
+                startsign /= math.fabs(startsign)
             else:
                 startsign = 1.0
-            rend = _rapRperiAxiFindStart(
-                r, E, L, self._2dpot, rap=True, startsign=startsign
-            )
+            rend = _rapRperiAxiFindStart(r, *args, rap=True, startsign=startsign)
             rap = optimize.brentq(
-                _rapRperiAxiEq, rperi + 0.00001, rend, args=(E, L, self._2dpot)
+                _rapRperiAxiEq, rperi + 0.00001, rend, args, xtol=_TOL, rtol=_TOL
             )
-        elif vr == 0.0 and vt < vcirc(self._2dpot, r, use_physical=False):
+        elif vr == 0.0 and vt < vc:
             # We are exactly at apocenter
             rap = r
             if self._gamma != 0.0:
-                startsign = _rapRperiAxiEq(r - 10.0**-8.0, E, L, self._2dpot)
-                startsign /= numpy.fabs(startsign)
+                startsign = _rapRperiAxiEq(r - 10.0**-8.0, *args)
+                startsign /= math.fabs(startsign)
             else:
                 startsign = 1.0
-            rstart = _rapRperiAxiFindStart(r, E, L, self._2dpot, startsign=startsign)
+            rstart = _rapRperiAxiFindStart(
+                r, *args, startsign=startsign, potmin=self._potmin
+            )
             if rstart == 0.0:
                 rperi = 0.0
             else:
                 rperi = optimize.brentq(
-                    _rapRperiAxiEq, rstart, rap - 0.000001, args=(E, L, self._2dpot)
+                    _rapRperiAxiEq, rstart, rap - 0.000001, args, xtol=_TOL, rtol=_TOL
                 )
         else:
             if self._gamma != 0.0:
-                startsign = _rapRperiAxiEq(r, E, L, self._2dpot)
-                startsign /= numpy.fabs(startsign)
+                startsign = _rapRperiAxiEq(r, *args)
+                startsign /= math.fabs(startsign)
             else:
                 startsign = 1.0
-            rstart = _rapRperiAxiFindStart(r, E, L, self._2dpot, startsign=startsign)
+            rstart = _rapRperiAxiFindStart(
+                r, *args, startsign=startsign, potmin=self._potmin
+            )
             if rstart == 0.0:
                 rperi = 0.0
             else:
                 try:
                     rperi = optimize.brentq(
-                        _rapRperiAxiEq, rstart, r, (E, L, self._2dpot), maxiter=200
+                        _rapRperiAxiEq,
+                        rstart,
+                        r,
+                        args,
+                        xtol=_TOL,
+                        rtol=_TOL,
+                        maxiter=200,
                     )
                 except RuntimeError:  # pragma: no cover
                     raise UnboundError("Orbit seems to be unbound")
-            rend = _rapRperiAxiFindStart(
-                r, E, L, self._2dpot, rap=True, startsign=startsign
-            )
-            rap = optimize.brentq(_rapRperiAxiEq, r, rend, (E, L, self._2dpot))
+            rend = _rapRperiAxiFindStart(r, *args, rap=True, startsign=startsign)
+            rap = optimize.brentq(_rapRperiAxiEq, r, rend, args, xtol=_TOL, rtol=_TOL)
+        return (rperi, rap)
+
+    def _fixed_quad(self, func, a, b, args):
+        """Fixed-order Gauss-Legendre quadrature using the cached nodes and weights"""
+        return (
+            0.5
+            * (b - a)
+            * numpy.dot(self._glw, func(a + 0.5 * (b - a) * (self._glx + 1.0), *args))
+        )
+
+    def _fixed_quad_vec(self, func, a, b, args):
+        """Fixed-order Gauss-Legendre quadrature for N integrals at once; array args are repeated over the nodes"""
+        halfwidth = 0.5 * (b - a)
+        x = (a + halfwidth)[:, None] + halfwidth[:, None] * self._glx
+        args = tuple(
+            numpy.repeat(arg, _NGL) if isinstance(arg, numpy.ndarray) else arg
+            for arg in args
+        )
+        return halfwidth * numpy.dot(
+            func(x.flatten(), *args).reshape(len(halfwidth), _NGL), self._glw
+        )
+
+    def _fixed_quad_tr_i(self, small, b, E, L, rturn):
+        """Fixed-order Gauss-Legendre quadrature of both the Tr and the I integrands from 0 to b (scalar or array), sharing the integrand evaluations because the I integrand is the Tr integrand divided by r^2"""
+        t = numpy.multiply.outer(0.5 * b, self._glx + 1.0)
+        shape = t.shape
+        t = t.flatten()
+        if isinstance(b, numpy.ndarray):
+            E, L, rturn = (numpy.repeat(arg, _NGL) for arg in (E, L, rturn))
+        if small:
+            tr = self._integrands["TrSmall"](t, E, L, *self._potargs, rturn)
+            r = rturn + t * t
+        else:
+            tr = self._integrands["TrLarge"](t, E, L, *self._potargs, rturn)
+            r = rturn - t * t
+        tr = tr.reshape(shape)
+        r = r.reshape(shape)
+        return (
+            0.5 * b * numpy.dot(tr, self._glw),
+            0.5 * b * numpy.dot(tr / r / r, self._glw),
+        )
+
+    def _map_orbits(self, func, N, numcores, nout=1):
+        # Map func, returning nout values, over the orbit indices, using
+        # multiprocessing if numcores > 1; output is [nout,N] (or [N] if nout=1)
+        out = numpy.empty((nout, N))
+        if numcores > 1:
+            out[:] = numpy.array(
+                list(multi.parallel_map(func, range(N), numcores=numcores))
+            ).T
+        else:
+            for ii in range(N):
+                out[:, ii] = func(ii)
+        return out[0] if nout == 1 else out
+
+    def _calc_rperi_rap_batch(self, r, vr, vt, E, L, vc, numcores=1):
+        rperi, rap = self._map_orbits(
+            lambda ii: self._calc_rperi_rap(
+                r[ii], vr[ii], vt[ii], E[ii], L[ii], vc[ii]
+            ),
+            len(r),
+            numcores,
+            nout=2,
+        )
         return (rperi, rap)
 
+    def _calc_jr_orbit(self, r, vr, vt, E, L, vc, fixed_quad, **kwargs):
+        # Jr for a single orbit
+        rperi, rap = self._calc_rperi_rap(r, vr, vt, E, L, vc)
+        return self._calc_jr(rperi, rap, E, L, fixed_quad, **kwargs)
+
+    def _calc_jr_or_op_orbit(self, r, vr, vt, E, L, vc, fixed_quad, **kwargs):
+        # Jr, Or, and Op for a single orbit
+        rperi, rap = self._calc_rperi_rap(r, vr, vt, E, L, vc)
+        Jr = self._calc_jr(rperi, rap, E, L, fixed_quad, **kwargs)
+        # Radial period
+        if Jr < 10.0**-9.0:  # Circular orbit
+            return (
+                Jr,
+                epifreq(self._2dpot, r, use_physical=False),
+                omegac(self._2dpot, r, use_physical=False),
+            )
+        Rmean = math.sqrt(rperi * rap) if rperi > 0.0 else rap / 2.0
+        Or, Op = self._calc_or_op(Rmean, rperi, rap, E, L, fixed_quad, **kwargs)
+        return (Jr, Or, Op)
+
+    def _calc_jr_or_op_angles_orbit(
+        self, r, vr, vt, z, vtheta, phi, E, L, Lz, vc, fixed_quad, **kwargs
+    ):
+        # Jr, Or, Op, ar, and az for a single orbit
+        rperi, rap = self._calc_rperi_rap(r, vr, vt, E, L, vc)
+        Jr = self._calc_jr(rperi, rap, E, L, fixed_quad, **kwargs)
+        # Mean radius, unlike for the frequencies alone this is needed for
+        # circular orbits as well, because the angles below use it
+        Rmean = math.sqrt(rperi * rap) if rperi > 0.0 else rap / 2.0
+        # Radial period
+        if Jr < 10.0**-9.0:  # Circular orbit
+            Or = epifreq(self._2dpot, r, use_physical=False)
+            Op = omegac(self._2dpot, r, use_physical=False)
+        else:
+            Or, Op = self._calc_or_op(Rmean, rperi, rap, E, L, fixed_quad, **kwargs)
+        # Angles
+        ar = self._calc_angler(Or, r, Rmean, rperi, rap, E, L, vr, fixed_quad, **kwargs)
+        az = self._calc_anglez(
+            Or,
+            Op,
+            ar,
+            z,
+            r,
+            Rmean,
+            rperi,
+            rap,
+            E,
+            L,
+            Lz,
+            vr,
+            vtheta,
+            phi,
+            fixed_quad,
+            **kwargs,
+        )
+        return (Jr, Or, Op, ar, az)
+
+    def _calc_jr_vec(self, rperi, rap, E, L):
+        # Vectorized version of _calc_jr for fixed_quad=True
+        return (
+            self._fixed_quad_vec(
+                self._integrands["Jr"], rperi, rap, (E, L, *self._potargs)
+            )
+            / numpy.pi
+        )
+
+    def _calc_jr_or_op_vec(self, r, vr, vt, E, L, vc, numcores=1):
+        # Jr, Or, and Op for all orbits at once for fixed_quad=True
+        rperi, rap = self._calc_rperi_rap_batch(r, vr, vt, E, L, vc, numcores=numcores)
+        Jr = self._calc_jr_vec(rperi, rap, E, L)
+        Or = numpy.empty(len(r))
+        Op = numpy.empty(len(r))
+        circ = Jr < 10.0**-9.0  # Circular orbits
+        if numpy.any(circ):
+            Or[circ] = epifreq(self._2dpot, r[circ], use_physical=False)
+            Op[circ] = omegac(self._2dpot, r[circ], use_physical=False)
+        ncirc = ~circ
+        if numpy.any(ncirc):
+            rperi, rap, E, L = rperi[ncirc], rap[ncirc], E[ncirc], L[ncirc]
+            Rmean = numpy.where(rperi > 0.0, numpy.sqrt(rperi * rap), rap / 2.0)
+            Or[ncirc], Op[ncirc] = self._calc_or_op_vec(Rmean, rperi, rap, E, L)
+        return (Jr, Or, Op)
+
+    def _calc_or_op_vec(self, Rmean, rperi, rap, E, L):
+        # Vectorized version of _calc_or_op for fixed_quad=True
+        Tr = numpy.zeros(len(Rmean))
+        I = numpy.zeros(len(Rmean))
+        indx = Rmean > rperi
+        Tr_indx, I_indx = self._fixed_quad_tr_i(
+            True,
+            numpy.sqrt(Rmean[indx] - rperi[indx]),
+            E[indx],
+            L[indx],
+            rperi[indx],
+        )
+        Tr[indx] += Tr_indx
+        I[indx] += I_indx
+        indx = Rmean < rap
+        Tr_indx, I_indx = self._fixed_quad_tr_i(
+            False,
+            numpy.sqrt(rap[indx] - Rmean[indx]),
+            E[indx],
+            L[indx],
+            rap[indx],
+        )
+        Tr[indx] += Tr_indx
+        I[indx] += I_indx
+        Tr = 2.0 * Tr
+        Or = 2.0 * numpy.pi / Tr
+        I *= 2 * L
+        return (Or, I * Or / 2.0 / numpy.pi)
+
+    def _adaptive_quad(self, integrand, a, b, args, **kwargs):
+        """Adaptive quadrature of one of the Tr/I integrands: QUADPACK for compiled integrands, vectorized Gaussian quadrature otherwise or when QUADPACK runs into trouble near the turning points"""
+        if self._compiled_integrands:
+            out = integrate.quad(
+                self._integrands[integrand + "_quad"],
+                a,
+                b,
+                args=args,
+                full_output=1,
+                **kwargs,
+            )
+            if len(out) == 3 and math.isfinite(out[0]):  # no warning message
+                return out[0]
+        return quadpack.quadrature(
+            self._integrands[integrand], a, b, args=args, **kwargs
+        )[0]
+
     def _calc_jr(self, rperi, rap, E, L, fixed_quad, **kwargs):
         if fixed_quad:
             return (
-                integrate.fixed_quad(
-                    _JrSphericalIntegrand,
-                    rperi,
-                    rap,
-                    args=(E, L, self._2dpot),
-                    n=10,
-                    **kwargs,
-                )[0]
+                self._fixed_quad(
+                    self._integrands["Jr"], rperi, rap, (E, L, *self._potargs)
+                )
                 / numpy.pi
             )
         else:
             return (
                 numpy.array(
                     integrate.quad(
-                        _JrSphericalIntegrand,
+                        self._integrands["Jr_quad"],
                         rperi,
                         rap,
-                        args=(E, L, self._2dpot),
+                        args=(E, L, *self._potargs),
                         **kwargs,
                     )
                 )
             )[0] / numpy.pi
 
-    def _calc_or(self, Rmean, rperi, rap, E, L, fixed_quad, **kwargs):
+    def _calc_or_op(self, Rmean, rperi, rap, E, L, fixed_quad, **kwargs):
+        # Radial and azimuthal frequency
         Tr = 0.0
+        I = 0.0
         if Rmean > rperi and not fixed_quad:
-            Tr += numpy.array(
-                quadpack.quadrature(
-                    _TrSphericalIntegrandSmall,
-                    0.0,
-                    numpy.sqrt(Rmean - rperi),
-                    args=(E, L, self._2dpot, rperi),
-                    **kwargs,
-                )
-            )[0]
-        elif Rmean > rperi and fixed_quad:
-            Tr += integrate.fixed_quad(
-                _TrSphericalIntegrandSmall,
+            Tr += self._adaptive_quad(
+                "TrSmall",
                 0.0,
-                numpy.sqrt(Rmean - rperi),
-                args=(E, L, self._2dpot, rperi),
-                n=10,
+                math.sqrt(Rmean - rperi),
+                (E, L, *self._potargs, rperi),
                 **kwargs,
-            )[0]
-        if Rmean < rap and not fixed_quad:
-            Tr += numpy.array(
-                quadpack.quadrature(
-                    _TrSphericalIntegrandLarge,
-                    0.0,
-                    numpy.sqrt(rap - Rmean),
-                    args=(E, L, self._2dpot, rap),
-                    **kwargs,
-                )
-            )[0]
-        elif Rmean < rap and fixed_quad:
-            Tr += integrate.fixed_quad(
-                _TrSphericalIntegrandLarge,
+            )
+            I += self._adaptive_quad(
+                "ISmall",
                 0.0,
-                numpy.sqrt(rap - Rmean),
-                args=(E, L, self._2dpot, rap),
-                n=10,
+                math.sqrt(Rmean - rperi),
+                (E, L, *self._potargs, rperi),
                 **kwargs,
-            )[0]
-        Tr = 2.0 * Tr
-        return 2.0 * numpy.pi / Tr
-
-    def _calc_op(self, Or, Rmean, rperi, rap, E, L, fixed_quad, **kwargs):
-        # Azimuthal period
-        I = 0.0
-        if Rmean > rperi and not fixed_quad:
-            I += numpy.array(
-                quadpack.quadrature(
-                    _ISphericalIntegrandSmall,
-                    0.0,
-                    numpy.sqrt(Rmean - rperi),
-                    args=(E, L, self._2dpot, rperi),
-                    **kwargs,
-                )
-            )[0]
+            )
         elif Rmean > rperi and fixed_quad:
-            I += integrate.fixed_quad(
-                _ISphericalIntegrandSmall,
+            Tr_small, I_small = self._fixed_quad_tr_i(
+                True, math.sqrt(Rmean - rperi), E, L, rperi
+            )
+            Tr += Tr_small
+            I += I_small
+        if Rmean < rap and not fixed_quad:
+            Tr += self._adaptive_quad(
+                "TrLarge",
                 0.0,
-                numpy.sqrt(Rmean - rperi),
-                args=(E, L, self._2dpot, rperi),
-                n=10,
+                math.sqrt(rap - Rmean),
+                (E, L, *self._potargs, rap),
                 **kwargs,
-            )[0]
-        if Rmean < rap and not fixed_quad:
-            I += numpy.array(
-                quadpack.quadrature(
-                    _ISphericalIntegrandLarge,
-                    0.0,
-                    numpy.sqrt(rap - Rmean),
-                    args=(E, L, self._2dpot, rap),
-                    **kwargs,
-                )
-            )[0]
-        elif Rmean < rap and fixed_quad:
-            I += integrate.fixed_quad(
-                _ISphericalIntegrandLarge,
+            )
+            I += self._adaptive_quad(
+                "ILarge",
                 0.0,
-                numpy.sqrt(rap - Rmean),
-                args=(E, L, self._2dpot, rap),
-                n=10,
+                math.sqrt(rap - Rmean),
+                (E, L, *self._potargs, rap),
                 **kwargs,
-            )[0]
+            )
+        elif Rmean < rap and fixed_quad:
+            Tr_large, I_large = self._fixed_quad_tr_i(
+                False, math.sqrt(rap - Rmean), E, L, rap
+            )
+            Tr += Tr_large
+            I += I_large
+        Tr = 2.0 * Tr
+        Or = 2.0 * numpy.pi / Tr
         I *= 2 * L
-        return I * Or / 2.0 / numpy.pi
+        return (Or, I * Or / 2.0 / numpy.pi)
 
     def _calc_long_asc(self, z, R, vtheta, phi, Lz, L):
         i = numpy.arccos(Lz / L)
         sinu = z / R / numpy.tan(i)
-        pindx = (sinu > 1.0) * (sinu < (1.0 + 10.0**-7.0))
-        sinu[pindx] = 1.0
-        pindx = (sinu < -1.0) * numpy.isfinite(sinu)
-        sinu[pindx] = -1.0
+        sinu[(sinu > 1.0) & (sinu < 1.0 + 10.0**-7.0)] = 1.0
+        sinu[(sinu < -1.0) & numpy.isfinite(sinu)] = -1.0
         u = numpy.arcsin(sinu)
-        vzindx = vtheta > 0.0
-        u[vzindx] = numpy.pi - u[vzindx]
+        u = numpy.where(vtheta > 0.0, numpy.pi - u, u)
         # For non-inclined orbits, we set Omega=0 by convention
-        u[True ^ numpy.isfinite(u)] = phi[True ^ numpy.isfinite(u)]
+        bad = ~numpy.isfinite(u)
+        u[bad] = phi[bad]
         return phi - u
 
     def _calc_angler(self, Or, r, Rmean, rperi, rap, E, L, vr, fixed_quad, **kwargs):
         if r < Rmean:
             if r > rperi and not fixed_quad:
-                wr = (
-                    Or
-                    * quadpack.quadrature(
-                        _TrSphericalIntegrandSmall,
-                        0.0,
-                        numpy.sqrt(r - rperi),
-                        args=(E, L, self._2dpot, rperi),
-                        **kwargs,
-                    )[0]
+                wr = Or * self._adaptive_quad(
+                    "TrSmall",
+                    0.0,
+                    math.sqrt(r - rperi),
+                    (E, L, *self._potargs, rperi),
+                    **kwargs,
                 )
             elif r > rperi and fixed_quad:
-                wr = (
-                    Or
-                    * integrate.fixed_quad(
-                        _TrSphericalIntegrandSmall,
-                        0.0,
-                        numpy.sqrt(r - rperi),
-                        args=(E, L, self._2dpot, rperi),
-                        n=10,
-                        **kwargs,
-                    )[0]
+                wr = Or * self._fixed_quad(
+                    self._integrands["TrSmall"],
+                    0.0,
+                    math.sqrt(r - rperi),
+                    (E, L, *self._potargs, rperi),
                 )
             else:
                 wr = 0.0
@@ -684,27 +821,19 @@ class actionAngleSpherical(actionAngle):
                 wr = 2 * numpy.pi - wr
         else:
             if r < rap and not fixed_quad:
-                wr = (
-                    Or
-                    * quadpack.quadrature(
-                        _TrSphericalIntegrandLarge,
-                        0.0,
-                        numpy.sqrt(rap - r),
-                        args=(E, L, self._2dpot, rap),
-                        **kwargs,
-                    )[0]
+                wr = Or * self._adaptive_quad(
+                    "TrLarge",
+                    0.0,
+                    math.sqrt(rap - r),
+                    (E, L, *self._potargs, rap),
+                    **kwargs,
                 )
             elif r < rap and fixed_quad:
-                wr = (
-                    Or
-                    * integrate.fixed_quad(
-                        _TrSphericalIntegrandLarge,
-                        0.0,
-                        numpy.sqrt(rap - r),
-                        args=(E, L, self._2dpot, rap),
-                        n=10,
-                        **kwargs,
-                    )[0]
+                wr = Or * self._fixed_quad(
+                    self._integrands["TrLarge"],
+                    0.0,
+                    math.sqrt(rap - r),
+                    (E, L, *self._potargs, rap),
                 )
             else:
                 wr = numpy.pi
@@ -734,11 +863,11 @@ class actionAngleSpherical(actionAngle):
         **kwargs,
     ):
         # First calculate psi
-        i = numpy.arccos(Lz / L)
-        sinpsi = z / r / numpy.sin(i)
-        if numpy.isfinite(sinpsi):
-            sinpsi = 1.0 if sinpsi > 1.0 else (-1.0 if sinpsi < -1.0 else sinpsi)
-            psi = numpy.arcsin(sinpsi)
+        i = math.acos(Lz / L)
+        sinpsi = z / r / math.sin(i)
+        if math.isfinite(sinpsi):
+            sinpsi = max(-1.0, min(1.0, sinpsi))
+            psi = math.asin(sinpsi)
             if vtheta > 0.0:
                 psi = numpy.pi - psi
         else:
@@ -748,53 +877,37 @@ class actionAngleSpherical(actionAngle):
         dpsi = Op / Or * 2.0 * numpy.pi  # this is the full I integral
         if r < Rmean:
             if not fixed_quad:
-                wz = (
-                    L
-                    * quadpack.quadrature(
-                        _ISphericalIntegrandSmall,
-                        0.0,
-                        numpy.sqrt(r - rperi),
-                        args=(E, L, self._2dpot, rperi),
-                        **kwargs,
-                    )[0]
+                wz = L * self._adaptive_quad(
+                    "ISmall",
+                    0.0,
+                    numpy.sqrt(r - rperi),
+                    (E, L, *self._potargs, rperi),
+                    **kwargs,
                 )
             elif fixed_quad:
-                wz = (
-                    L
-                    * integrate.fixed_quad(
-                        _ISphericalIntegrandSmall,
-                        0.0,
-                        numpy.sqrt(r - rperi),
-                        args=(E, L, self._2dpot, rperi),
-                        n=10,
-                        **kwargs,
-                    )[0]
+                wz = L * self._fixed_quad(
+                    self._integrands["ISmall"],
+                    0.0,
+                    numpy.sqrt(r - rperi),
+                    (E, L, *self._potargs, rperi),
                 )
             if vr < 0.0:
                 wz = dpsi - wz
         else:
             if not fixed_quad:
-                wz = (
-                    L
-                    * quadpack.quadrature(
-                        _ISphericalIntegrandLarge,
-                        0.0,
-                        numpy.sqrt(rap - r),
-                        args=(E, L, self._2dpot, rap),
-                        **kwargs,
-                    )[0]
+                wz = L * self._adaptive_quad(
+                    "ILarge",
+                    0.0,
+                    numpy.sqrt(rap - r),
+                    (E, L, *self._potargs, rap),
+                    **kwargs,
                 )
             elif fixed_quad:
-                wz = (
-                    L
-                    * integrate.fixed_quad(
-                        _ISphericalIntegrandLarge,
-                        0.0,
-                        numpy.sqrt(rap - r),
-                        args=(E, L, self._2dpot, rap),
-                        n=10,
-                        **kwargs,
-                    )[0]
+                wz = L * self._fixed_quad(
+                    self._integrands["ILarge"],
+                    0.0,
+                    numpy.sqrt(rap - r),
+                    (E, L, *self._potargs, rap),
                 )
             if vr < 0.0:
                 wz = dpsi / 2.0 + wz
@@ -805,37 +918,37 @@ class actionAngleSpherical(actionAngle):
         return wz
 
 
-def _JrSphericalIntegrand(r, E, L, pot):
+def _JrSphericalIntegrand(r, E, L, evalpot):
     """The J_r integrand"""
-    return numpy.sqrt(2.0 * (E - _evaluateplanarPotentials(pot, r)) - L**2.0 / r**2.0)
+    return numpy.sqrt(2.0 * (E - evalpot(r)) - L * L / r / r)
 
 
-def _TrSphericalIntegrandSmall(t, E, L, pot, rperi):
-    r = rperi + t**2.0  # part of the transformation
-    return 2.0 * t / _JrSphericalIntegrand(r, E, L, pot)
+def _TrSphericalIntegrandSmall(t, E, L, evalpot, rperi):
+    r = rperi + t * t  # part of the transformation
+    return 2.0 * t / _JrSphericalIntegrand(r, E, L, evalpot)
 
 
-def _TrSphericalIntegrandLarge(t, E, L, pot, rap):
-    r = rap - t**2.0  # part of the transformation
-    return 2.0 * t / _JrSphericalIntegrand(r, E, L, pot)
+def _TrSphericalIntegrandLarge(t, E, L, evalpot, rap):
+    r = rap - t * t  # part of the transformation
+    return 2.0 * t / _JrSphericalIntegrand(r, E, L, evalpot)
 
 
-def _ISphericalIntegrandSmall(t, E, L, pot, rperi):
-    r = rperi + t**2.0  # part of the transformation
-    return 2.0 * t / _JrSphericalIntegrand(r, E, L, pot) / r**2.0
+def _ISphericalIntegrandSmall(t, E, L, evalpot, rperi):
+    r = rperi + t * t  # part of the transformation
+    return 2.0 * t / _JrSphericalIntegrand(r, E, L, evalpot) / r / r
 
 
-def _ISphericalIntegrandLarge(t, E, L, pot, rap):
-    r = rap - t**2.0  # part of the transformation
-    return 2.0 * t / _JrSphericalIntegrand(r, E, L, pot) / r**2.0
+def _ISphericalIntegrandLarge(t, E, L, evalpot, rap):
+    r = rap - t * t  # part of the transformation
+    return 2.0 * t / _JrSphericalIntegrand(r, E, L, evalpot) / r / r
 
 
-def _rapRperiAxiEq(R, E, L, pot):
+def _rapRperiAxiEq(R, E, L, evalpot):
     """The vr=0 equation that needs to be solved to find apo- and pericenter"""
-    return E - _evaluateplanarPotentials(pot, R) - L**2.0 / 2.0 / R**2.0
+    return E - evalpot(R) - L * L / 2.0 / R / R
 
 
-def _rapRperiAxiFindStart(R, E, L, pot, rap=False, startsign=1.0):
+def _rapRperiAxiFindStart(R, E, L, evalpot, rap=False, startsign=1.0, potmin=None):
     """
     Find adequate start or end points to solve for rap and rperi
 
@@ -847,12 +960,14 @@ def _rapRperiAxiFindStart(R, E, L, pot, rap=False, startsign=1.0):
         energy
     L : float
         angular momentum
-    pot : Potential object or list thereof
-        Potential
+    evalpot : callable
+        Function that evaluates the (planar) potential at R
     rap : bool, optional
         if True, find the rap end-point (default is False)
     startsign : float, optional
         set to -1 if the function is not positive (due to gamma in the modified adiabatic approximation) (default is 1.0)
+    potmin : float, optional
+        minimum of the potential; if given, the search for rperi starts at the lower bound L/sqrt(2(E-potmin)) (default is None)
 
     Returns
     -------
@@ -865,9 +980,12 @@ def _rapRperiAxiFindStart(R, E, L, pot, rap=False, startsign=1.0):
     """
     if rap:
         rtry = 2.0 * R
+    elif startsign > 0.0 and not potmin is None and E > potmin:
+        # E-potmin >= L^2/2/rperi^2, so this is <= rperi
+        rtry = L / math.sqrt(2.0 * (E - potmin))
     else:
         rtry = R / 2.0
-    while startsign * _rapRperiAxiEq(rtry, E, L, pot) > 0.0 and rtry > 0.000000001:
+    while startsign * _rapRperiAxiEq(rtry, E, L, evalpot) > 0.0 and rtry > 0.000000001:
         if rap:
             if rtry > 100.0:  # pragma: no cover
                 raise UnboundError("Orbit seems to be unbound")
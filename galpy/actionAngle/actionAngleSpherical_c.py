@@ -0,0 +1,159 @@
+import ctypes
+import ctypes.util
+
+import numpy
+from numpy.ctypeslib import ndpointer
+
+from ..util import _load_extension_libs
+
+_lib, _ext_loaded = _load_extension_libs.load_libgalpy()
+
+
+def actionAngleSpherical_c(pot, r, E, L, order=10):
+    """
+    Use C to calculate the radial action in a spherical potential
+
+    Parameters
+    ----------
+    pot : Potential or list of such instances
+        Gravitational potential to compute actions in
+    r : numpy.ndarray
+        Spherical radius.
+    E : numpy.ndarray
+        Energy.
+    L : numpy.ndarray
+        Total angular momentum.
+    order : int, optional
+        Order of the Gauss-Legendre integration (default: 10)
+
+    Returns
+    -------
+    tuple:
+       (jr,err) with radial action (numpy.ndarray) and error (non-zero if error occurred)
+    """
+    # Parse the potential
+    from ..orbit.integrateFullOrbit import _parse_pot
+    from ..orbit.integratePlanarOrbit import _prep_tfuncs
+
+    npot, pot_type, pot_args, pot_tfuncs = _parse_pot(pot, potforactions=True)
+    pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+
+    # Set up result arrays
+    jr = numpy.empty(len(r))
+    err = ctypes.c_int(0)
+
+    # Set up the C code
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    actionAngleSpherical_actionsFunc = _lib.actionAngleSpherical_actions
+    actionAngleSpherical_actionsFunc.argtypes = [
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_void_p,
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.POINTER(ctypes.c_int),
+    ]
+
+    # Array requirements
+    r = numpy.require(r, dtype=numpy.float64, requirements=["C", "W"])
+    E = numpy.require(E, dtype=numpy.float64, requirements=["C", "W"])
+    L = numpy.require(L, dtype=numpy.float64, requirements=["C", "W"])
+    jr = numpy.require(jr, dtype=numpy.float64, requirements=["C", "W"])
+
+    # Run the C code
+    actionAngleSpherical_actionsFunc(
+        len(r),
+        r,
+        E,
+        L,
+        ctypes.c_int(npot),
+        pot_type,
+        pot_args,
+        pot_tfuncs,
+        ctypes.c_int(order),
+        jr,
+        ctypes.byref(err),
+    )
+
+    return (jr, err.value)
+
+
+def actionAngleRperiRapSpherical_c(pot, r, E, L):
+    """
+    Use C to calculate the peri- and apocenter radius in a spherical potential
+
+    Parameters
+    ----------
+    pot : Potential or list of such instances
+        Gravitational potential to compute the peri- and apocenter in
+    r : numpy.ndarray
+        Spherical radius.
+    E : numpy.ndarray
+        Energy.
+    L : numpy.ndarray
+        Total angular momentum.
+
+    Returns
+    -------
+    tuple
+        (rperi,rap,err)
+        rperi,rap : numpy.ndarray, shape (len(r))
+        err - non-zero if error occurred
+    """
+    # Parse the potential
+    from ..orbit.integrateFullOrbit import _parse_pot
+    from ..orbit.integratePlanarOrbit import _prep_tfuncs
+
+    npot, pot_type, pot_args, pot_tfuncs = _parse_pot(pot, potforactions=True)
+    pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+
+    # Set up result arrays
+    rperi = numpy.empty(len(r))
+    rap = numpy.empty(len(r))
+    err = ctypes.c_int(0)
+
+    # Set up the C code
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    actionAngleSpherical_RperiRapFunc = _lib.actionAngleSpherical_RperiRap
+    actionAngleSpherical_RperiRapFunc.argtypes = [
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_void_p,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.POINTER(ctypes.c_int),
+    ]
+
+    # Array requirements
+    r = numpy.require(r, dtype=numpy.float64, requirements=["C", "W"])
+    E = numpy.require(E, dtype=numpy.float64, requirements=["C", "W"])
+    L = numpy.require(L, dtype=numpy.float64, requirements=["C", "W"])
+    rperi = numpy.require(rperi, dtype=numpy.float64, requirements=["C", "W"])
+    rap = numpy.require(rap, dtype=numpy.float64, requirements=["C", "W"])
+
+    # Run the C code
+    actionAngleSpherical_RperiRapFunc(
+        len(r),
+        r,
+        E,
+        L,
+        ctypes.c_int(npot),
+        pot_type,
+        pot_args,
+        pot_tfuncs,
+        rperi,
+        rap,
+        ctypes.byref(err),
+    )
+
+    return (rperi, rap, err.value)
@@ -0,0 +1,292 @@
+###############################################################################
+#   actionAngleSpherical_numba: numba-compiled integrands and peri- and
+#                               apocenter solver for actionAngleSpherical for
+#                               common analytic spherical potentials
+###############################################################################
+import numpy
+from scipy import LowLevelCallable
+
+from ..potential import (
+    HernquistPotential,
+    IsochronePotential,
+    KeplerPotential,
+    NFWPotential,
+    PlummerPotential,
+)
+from ..potential.planarPotential import planarPotentialFromRZPotential
+from ..util._optional_deps import _NUMBA_LOADED
+
+if _NUMBA_LOADED:
+    from numba import cfunc, njit, types
+
+
+# Potentials as a function of r and a single parameter, without the amplitude
+def _isochrone(r, b):
+    return -1.0 / (b + numpy.sqrt(r * r + b * b))
+
+
+def _plummer(r, b2):
+    return -1.0 / numpy.sqrt(r * r + b2)
+
+
+def _hernquist(r, a):
+    return -1.0 / (1.0 + r / a) / 2.0 / a
+
+
+def _nfw(r, a):
+    return -numpy.log(1.0 + r / a) / r
+
+
+def _kepler(r, dummy):
+    return -1.0 / r
+
+
+# Supported potentials: exact type --> (potential function, parameter)
+_POTENTIALS = {
+    IsochronePotential: (_isochrone, lambda pot: pot.b),
+    PlummerPotential: (_plummer, lambda pot: pot._b2),
+    HernquistPotential: (_hernquist, lambda pot: pot.a),
+    NFWPotential: (_nfw, lambda pot: pot.a),
+    KeplerPotential: (_kepler, lambda pot: 0.0),
+}
+# Cache of compiled functions, such that they are only compiled once
+_compiled = {}
+
+
+def parse_potential(pots):
+    """
+    Determine whether numba-compiled integrands can be used for a potential
+
+    Parameters
+    ----------
+    pots : list of planarPotential instances
+        Planar potential
+
+    Returns
+    -------
+    tuple or None
+        (integrands,potargs) where integrands is a dictionary of compiled integrands (and of the compiled peri- and apocenter solver under the key 'RperiRap') and potargs=(amp,par) are the potential arguments to pass to them; None if the potential is not supported or numba is not available
+    """
+    if (
+        not _NUMBA_LOADED
+        or len(pots) != 1
+        or type(pots[0]) is not planarPotentialFromRZPotential
+        or type(pots[0]._Pot) not in _POTENTIALS
+    ):
+        return None
+    potfunc, par = _POTENTIALS[type(pots[0]._Pot)]
+    if potfunc not in _compiled:
+        try:
+            _compiled[potfunc] = _compile_integrands(potfunc)
+        except Exception:  # pragma: no cover
+            # Any exception, switch to regular Python integrands
+            _compiled[potfunc] = None
+    if _compiled[potfunc] is None:  # pragma: no cover
+        return None
+    return (
+        _compiled[potfunc],
+        (pots[0]._amp * pots[0]._Pot._amp, par(pots[0]._Pot)),
+    )
+
+
+def _compile_integrands(potfunc):
+    """Compile the actionAngleSpherical integrands for the potential function potfunc(r,par)"""
+    potfunc = njit(error_model="numpy")(potfunc)
+
+    @njit(error_model="numpy")
+    def jr(r, E, L, amp, par):
+        return numpy.sqrt(2.0 * (E - amp * potfunc(r, par)) - L * L / r / r)
+
+    @njit(error_model="numpy")
+    def tr_small(t, E, L, amp, par, rperi):
+        r = rperi + t * t
+        return 2.0 * t / jr(r, E, L, amp, par)
+
+    @njit(error_model="numpy")
+    def tr_large(t, E, L, amp, par, rap):
+        r = rap - t * t
+        return 2.0 * t / jr(r, E, L, amp, par)
+
+    @njit(error_model="numpy")
+    def i_small(t, E, L, amp, par, rperi):
+        r = rperi + t * t
+        return 2.0 * t / jr(r, E, L, amp, par) / r / r
+
+    @njit(error_model="numpy")
+    def i_large(t, E, L, amp, par, rap):
+        r = rap - t * t
+        return 2.0 * t / jr(r, E, L, amp, par) / r / r
+
+    # C-callable versions of the integrands for scipy.integrate.quad
+    quad_sig = types.double(types.intc, types.CPointer(types.double))
+
+    @cfunc(quad_sig, error_model="numpy")
+    def jr_cfunc(n, xx):
+        return jr(xx[0], xx[1], xx[2], xx[3], xx[4])
+
+    @cfunc(quad_sig, error_model="numpy")
+    def tr_small_cfunc(n, xx):
+        return tr_small(xx[0], xx[1], xx[2], xx[3], xx[4], xx[5])
+
+    @cfunc(quad_sig, error_model="numpy")
+    def tr_large_cfunc(n, xx):
+        return tr_large(xx[0], xx[1], xx[2], xx[3], xx[4], xx[5])
+
+    @cfunc(quad_sig, error_model="numpy")
+    def i_small_cfunc(n, xx):
+        return i_small(xx[0], xx[1], xx[2], xx[3], xx[4], xx[5])
+
+    @cfunc(quad_sig, error_model="numpy")
+    def i_large_cfunc(n, xx):
+        return i_large(xx[0], xx[1], xx[2], xx[3], xx[4], xx[5])
+
+    # vr=0 equation for the peri- and apocenter and its solution
+    @njit(error_model="numpy")
+    def rap_rperi_eq(R, E, L, amp, par):
+        return E - amp * potfunc(R, par) - L * L / 2.0 / R / R
+
+    @njit(error_model="numpy")
+    def find_start(R, E, L, amp, par, rap, startsign, potmin):
+        # Same as _rapRperiAxiFindStart, but returns -1 for unbound orbits
+        if rap:
+            rtry = 2.0 * R
+        elif startsign > 0.0 and not numpy.isnan(potmin) and E > potmin:
+            rtry = L / numpy.sqrt(2.0 * (E - potmin))
+        else:
+            rtry = R / 2.0
+        while (
+            startsign * rap_rperi_eq(rtry, E, L, amp, par) > 0.0 and rtry > 0.000000001
+        ):
+            if rap:
+                if rtry > 100.0:
+                    return -1.0
+                rtry *= 2.0
+            else:
+                rtry /= 2.0
+        if rtry < 0.000000001:
+            return 0.0
+        return rtry
+
+    @njit(error_model="numpy")
+    def brentq(xa, xb, E, L, amp, par, xtol, rtol, maxiter):
+        # Port of scipy.optimize.brentq's C implementation, returns
+        # (root,success)
+        xpre, xcur = xa, xb
+        xblk, fblk, spre, scur = 0.0, 0.0, 0.0, 0.0
+        fpre = rap_rperi_eq(xpre, E, L, amp, par)
+        fcur = rap_rperi_eq(xcur, E, L, amp, par)
+        if fpre == 0.0:
+            return (xpre, True)
+        if fcur == 0.0:
+            return (xcur, True)
+        if (fpre < 0.0) == (fcur < 0.0):
+            return (xcur, False)
+        for ii in range(maxiter):
+            if fpre != 0.0 and fcur != 0.0 and (fpre < 0.0) != (fcur < 0.0):
+                xblk = xpre
+                fblk = fpre
+                spre = scur = xcur - xpre
+            if numpy.fabs(fblk) < numpy.fabs(fcur):
+                xpre, xcur, xblk = xcur, xblk, xcur
+                fpre, fcur, fblk = fcur, fblk, fcur
+            delta = (xtol + rtol * numpy.fabs(xcur)) / 2.0
+            sbis = (xblk - xcur) / 2.0
+            if fcur == 0.0 or numpy.fabs(sbis) < delta:
+                return (xcur, True)
+            if numpy.fabs(spre) > delta and numpy.fabs(fcur) < numpy.fabs(fpre):
+                if xpre == xblk:  # interpolate
+                    stry = -fcur * (xcur - xpre) / (fcur - fpre)
+                else:  # extrapolate
+                    dpre = (fpre - fcur) / (xpre - xcur)
+                    dblk = (fblk - fcur) / (xblk - xcur)
+                    stry = (
+                        -fcur
+                        * (fblk * dblk - fpre * dpre)
+                        / (dblk * dpre * (fblk - fpre))
+                    )
+                if 2.0 * numpy.fabs(stry) < min(
+                    numpy.fabs(spre), 3.0 * numpy.fabs(sbis) - delta
+                ):  # good short step
+                    spre = scur
+                    scur = stry
+                else:  # bisect
+                    spre = sbis
+                    scur = sbis
+            else:  # bisect
+                spre = sbis
+                scur = sbis
+            xpre = xcur
+            fpre = fcur
+            if numpy.fabs(scur) > delta:
+                xcur += scur
+            else:
+                xcur += delta if sbis > 0.0 else -delta
+            fcur = rap_rperi_eq(xcur, E, L, amp, par)
+        return (xcur, False)
+
+    @njit(error_model="numpy")
+    def rperi_rap(r, vr, vt, E, L, vc, amp, par, gamma, potmin, eps, tol):
+        # Same as actionAngleSpherical._calc_rperi_rap, returns
+        # (rperi,rap,success); potmin=nan if the minimum is not finite
+        if vr == 0.0 and numpy.fabs(vt - vc) < eps:
+            # Circular orbit
+            return (r, r, True)
+        elif vr == 0.0 and vt > vc:
+            # Exactly at pericenter
+            rperi = r
+            if gamma != 0.0:
+                startsign = rap_rperi_eq(r + 10.0**-8.0, E, L, amp, par)
+                startsign /= numpy.fabs(startsign)
+            else:
+                startsign = 1.0
+            rend = find_start(r, E, L, amp, par, True, startsign, potmin)
+            if rend < 0.0:
+                return (rperi, 0.0, False)
+            rap, success = brentq(rperi + 0.00001, rend, E, L, amp, par, tol, tol, 100)
+            return (rperi, rap, success)
+        elif vr == 0.0 and vt < vc:
+            # Exactly at apocenter
+            rap = r
+            if gamma != 0.0:
+                startsign = rap_rperi_eq(r - 10.0**-8.0, E, L, amp, par)
+                startsign /= numpy.fabs(startsign)
+            else:
+                startsign = 1.0
+            rstart = find_start(r, E, L, amp, par, False, startsign, potmin)
+            if rstart == 0.0:
+                return (0.0, rap, True)
+            rperi, success = brentq(
+                rstart, rap - 0.000001, E, L, amp, par, tol, tol, 100
+            )
+            return (rperi, rap, success)
+        if gamma != 0.0:
+            startsign = rap_rperi_eq(r, E, L, amp, par)
+            startsign /= numpy.fabs(startsign)
+        else:
+            startsign = 1.0
+        rstart = find_start(r, E, L, amp, par, False, startsign, potmin)
+        if rstart == 0.0:
+            rperi = 0.0
+        else:
+            rperi, success = brentq(rstart, r, E, L, amp, par, tol, tol, 200)
+            if not success:
+                return (rperi, 0.0, False)
+        rend = find_start(r, E, L, amp, par, True, startsign, potmin)
+        if rend < 0.0:
+            return (rperi, 0.0, False)
+        rap, success = brentq(r, rend, E, L, amp, par, tol, tol, 100)
+        return (rperi, rap, success)
+
+    return {
+        "RperiRap": rperi_rap,
+        "Jr": jr,
+        "Jr_quad": LowLevelCallable(jr_cfunc.ctypes),
+        "TrSmall": tr_small,
+        "TrSmall_quad": LowLevelCallable(tr_small_cfunc.ctypes),
+        "TrLarge": tr_large,
+        "TrLarge_quad": LowLevelCallable(tr_large_cfunc.ctypes),
+        "ISmall": i_small,
+        "ISmall_quad": LowLevelCallable(i_small_cfunc.ctypes),
+        "ILarge": i_large,
+        "ILarge_quad": LowLevelCallable(i_large_cfunc.ctypes),
+    }
@@ -60,6 +60,8 @@ void calcJzAdiabatic(int,double *,double *,double *,double *,int,
 		     struct potentialArg *,int);
 void calcRapRperi(int,double *,double *,double *,double *,double *,
 		  int,struct potentialArg *);
+void calcRapRperi_rmax(int,double *,double *,double *,double *,double *,
+		       int,struct potentialArg *,double);
 void calcZmax(int,double *,double *,double *,double *,int,
 	      struct potentialArg *);
 double JRAdiabaticIntegrandSquared(double,void *);
@@ -305,6 +307,18 @@ void calcRapRperi(int ndata,
 		  double * Lz,
 		  int nargs,
 		  struct potentialArg * actionAngleArgs){
+  calcRapRperi_rmax(ndata,rperi,rap,R,ER,Lz,nargs,actionAngleArgs,37.5);
+}
+void calcRapRperi_rmax(int ndata,
+		       double * rperi,
+		       double * rap,
+		       double * R,
+		       double * ER,
+		       double * Lz,
+		       int nargs,
+		       struct potentialArg * actionAngleArgs,
+		       double rmax){
+  //rmax: largest radius up to which the apocenter is searched for
   int ii, tid, nthreads;
 #ifdef _OPENMP
   nthreads = omp_get_max_threads();
@@ -330,7 +344,7 @@ void calcRapRperi(int ndata,
   gsl_set_error_handler_off();
 #pragma omp parallel for schedule(static,chunk)				\
   private(tid,ii,iter,status,R_lo,R_hi,meps,peps)			\
-  shared(rperi,rap,JRRoot,params,s,R,ER,Lz,max_iter)
+  shared(rperi,rap,JRRoot,params,s,R,ER,Lz,max_iter,rmax)
   for (ii=0; ii < ndata; ii++){
 #ifdef _OPENMP
     tid= omp_get_thread_num();
@@ -385,7 +399,7 @@ void calcRapRperi(int ndata,
 	*(rperi+ii)= *(R+ii);
 	R_lo= *(R+ii) + 0.0000001;
 	R_hi= 1.1 * (*(R+ii) + 0.0000001);
-	while ( GSL_FN_EVAL(JRRoot+tid,R_hi) >= 0. && R_hi < 37.5) {
+	while ( GSL_FN_EVAL(JRRoot+tid,R_hi) >= 0. && R_hi < rmax) {
 	  R_lo= R_hi; //this makes sure that brent evaluates using previous
 	  R_hi*= 1.1;
 	}
@@ -459,7 +473,7 @@ void calcRapRperi(int ndata,
       //Find starting points for maximum
       R_lo= *(R+ii);
       R_hi= 1.1 * *(R+ii);
-      while ( GSL_FN_EVAL(JRRoot+tid,R_hi) > 0. && R_hi < 37.5) {
+      while ( GSL_FN_EVAL(JRRoot+tid,R_hi) > 0. && R_hi < rmax) {
 	R_lo= R_hi; //this makes sure that brent evaluates using previous
 	R_hi*= 1.1;
       }
@@ -0,0 +1,131 @@
+/*
+  C code for actions in spherical potentials
+*/
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdbool.h>
+#include <math.h>
+//Potentials
+#include <galpy_potentials.h>
+#include <integrateFullOrbit.h>
+#include <actionAngle.h>
+//Macros to export functions in DLL on different OS
+#if defined(_WIN32)
+#define EXPORT __declspec(dllexport)
+#elif defined(__GNUC__)
+#define EXPORT __attribute__((visibility("default")))
+#else
+// Just do nothing?
+#define EXPORT
+#endif
+/*
+  Function Declarations
+*/
+EXPORT void actionAngleSpherical_RperiRap(int,double *,double *,double *,
+					  int,int *,double *,tfuncs_type_arr,
+					  double *,double *,int *);
+EXPORT void actionAngleSpherical_actions(int,double *,double *,double *,
+					 int,int *,double *,tfuncs_type_arr,
+					 int,double *,int *);
+/*
+  The radial motion in a spherical potential, E = Phi(r) + vr^2/2 + L^2/2/r^2,
+  is the same as the planar radial motion in the adiabatic approximation, so
+  use the functions in actionAngleAdiabatic.c with (R,ER,Lz) -> (r,E,L)
+*/
+void calcJRAdiabatic(int,double *,double *,double *,double *,double *,
+		     int,struct potentialArg *,int);
+void calcRapRperi_rmax(int,double *,double *,double *,double *,double *,
+		       int,struct potentialArg *,double);
+/*
+  Actual functions, inlines first
+*/
+static inline int checkRperiRap(int ndata,
+				double *rperi,
+				double *rap){
+  //Non-zero if the peri- or apocenter of any object could not be found
+  int ii;
+  for (ii=0; ii < ndata; ii++)
+    if ( *(rperi+ii) == -9999.99 || *(rap+ii) == -9999.99 )
+      return -1;
+  return 0;
+}
+static inline double sphericalRmax(double r){
+  //Same cutoff as the Python implementation, which starts looking for the
+  //apocenter at 2r and doubles this until it is beyond 100, after which the
+  //orbit is considered to be unbound
+  double rmax= 2. * r;
+  while ( rmax <= 100. && rmax > 0. )
+    rmax*= 2.;
+  return rmax;
+}
+static void calcRapRperiSpherical(int ndata,
+				  double *rperi,
+				  double *rap,
+				  double *r,
+				  double *E,
+				  double *L,
+				  int npot,
+				  struct potentialArg * actionAngleArgs){
+  //Search for the apocenter out to the largest cutoff of all objects, then
+  //flag the orbits whose apocenter is beyond their own cutoff as unbound,
+  //such that the C and Python implementations agree on which orbits are bound
+  int ii;
+  double rmax= 0.;
+  for (ii=0; ii < ndata; ii++)
+    rmax= fmax(rmax,sphericalRmax(*(r+ii)));
+  calcRapRperi_rmax(ndata,rperi,rap,r,E,L,npot,actionAngleArgs,rmax);
+  for (ii=0; ii < ndata; ii++)
+    if ( *(rap+ii) != -9999.99 && *(rap+ii) > sphericalRmax(*(r+ii)) ){
+      *(rperi+ii)= -9999.99;
+      *(rap+ii)= -9999.99;
+    }
+}
+/*
+  MAIN FUNCTIONS
+ */
+void actionAngleSpherical_RperiRap(int ndata,
+				   double *r,
+				   double *E,
+				   double *L,
+				   int npot,
+				   int * pot_type,
+				   double * pot_args,
+				   tfuncs_type_arr pot_tfuncs,
+				   double *rperi,
+				   double *rap,
+				   int * err){
+  //Set up the potentials
+  struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_leapFuncArgs_Full(npot,actionAngleArgs,&pot_type,&pot_args,&pot_tfuncs);
+  //Calculate peri and apocenters
+  calcRapRperiSpherical(ndata,rperi,rap,r,E,L,npot,actionAngleArgs);
+  *err= checkRperiRap(ndata,rperi,rap);
+  free_potentialArgs(npot,actionAngleArgs);
+  free(actionAngleArgs);
+}
+void actionAngleSpherical_actions(int ndata,
+				  double *r,
+				  double *E,
+				  double *L,
+				  int npot,
+				  int * pot_type,
+				  double * pot_args,
+				  tfuncs_type_arr pot_tfuncs,
+				  int order,
+				  double *jr,
+				  int * err){
+  //Set up the potentials
+  struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_leapFuncArgs_Full(npot,actionAngleArgs,&pot_type,&pot_args,&pot_tfuncs);
+  //Calculate peri and apocenters
+  double *rperi= (double *) malloc ( ndata * sizeof(double) );
+  double *rap= (double *) malloc ( ndata * sizeof(double) );
+  calcRapRperiSpherical(ndata,rperi,rap,r,E,L,npot,actionAngleArgs);
+  *err= checkRperiRap(ndata,rperi,rap);
+  //Radial action
+  calcJRAdiabatic(ndata,jr,rperi,rap,E,L,npot,actionAngleArgs,order);
+  free_potentialArgs(npot,actionAngleArgs);
+  free(actionAngleArgs);
+  free(rperi);
+  free(rap);
+}
@@ -130,13 +130,14 @@ class _constantbetadf(anisotropicsphericaldf):
     def _vmomentdensity(self, r, n, m):
         if m % 2 == 1 or n % 2 == 1:
             return 0.0
+        Pot = _evaluatePotentials(self._pot, r, 0)
         return (
             2.0
             * numpy.pi
             * r ** (-2.0 * self._beta)
             * integrate.quad(
                 lambda v: v ** (2.0 - 2.0 * self._beta + m + n)
-                * self.fE(_evaluatePotentials(self._pot, r, 0) + 0.5 * v**2.0),
+                * self.fE(Pot + 0.5 * v**2.0),
                 0.0,
                 self._vmax_at_r(self._pot, r),
             )[0]
@@ -287,10 +288,10 @@ class constantbetadf(_constantbetadf):
         # Slight over-write of superclass method to first build f(E) interp
         # No docstring so superclass' is used
         if not hasattr(self, "_fE_interp"):
-            Es4interp = numpy.hstack(
+            Es4interp = numpy.concatenate(
                 (
                     numpy.geomspace(1e-8, 0.5, 101, endpoint=False),
-                    sorted(1.0 - numpy.geomspace(1e-4, 0.5, 101)),
+                    (1.0 - numpy.geomspace(1e-4, 0.5, 101))[::-1],
                 )
             )
             Es4interp = (Es4interp * (self._Emin - self._potInf) + self._potInf)[::-1]
@@ -384,9 +385,7 @@ def _fEintegrand_raw(r, pot, E, dmp1nudrmp1, alpha):
     out = numpy.zeros_like(r)  # Avoid JAX item assignment issues
     # print("r",r,dmp1nudrmp1(r),(_evaluatePotentials(pot,r,0)-E))
     out[:] = dmp1nudrmp1(r) / (_evaluatePotentials(pot, r, 0) - E) ** alpha
-    out[True ^ numpy.isfinite(out)] = (
-        0.0  # assume these are where denom is slightly neg.
-    )
+    out[~numpy.isfinite(out)] = 0.0  # assume these are where denom is slightly neg.
     return out
 
 
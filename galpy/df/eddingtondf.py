@@ -3,8 +3,11 @@
 import numpy
 from scipy import integrate, interpolate
 
-from ..potential import evaluateR2derivs
-from ..potential.Potential import _evaluatePotentials, _evaluateRforces
+from ..potential.Potential import (
+    _evaluatePotentials,
+    _evaluateR2derivs,
+    _evaluateRforces,
+)
 from ..util import conversion
 from .sphericaldf import isotropicsphericaldf, sphericaldf
 
@@ -65,10 +68,10 @@ class eddingtondf(isotropicsphericaldf):
         # Slight over-write of superclass method to first build f(E) interp
         # No docstring so superclass' is used
         if not hasattr(self, "_fE_interp"):
-            Es4interp = numpy.hstack(
+            Es4interp = numpy.concatenate(
                 (
                     numpy.geomspace(1e-8, 0.5, 101, endpoint=False),
-                    sorted(1.0 - numpy.geomspace(1e-4, 0.5, 101)),
+                    (1.0 - numpy.geomspace(1e-4, 0.5, 101))[::-1],
                 )
             )
             Es4interp = (Es4interp * (self._Emin - self._potInf) + self._potInf)[::-1]
@@ -102,31 +105,28 @@ class eddingtondf(isotropicsphericaldf):
         Eint = conversion.parse_energy(E, vo=self._vo)
         out = numpy.zeros_like(Eint)
         indx = (Eint < self._potInf) * (Eint >= self._Emin)
+        # Radii where the potential equals each energy, evaluated all at once
+        rmins = self._rphi(Eint[indx])
         # Split integral at twice the lower limit to deal with divergence at
         # the lower end and infinity at the upper end
         out[indx] = numpy.array(
             [
                 integrate.quad(
                     lambda t: _fEintegrand_smallr(
-                        t, self._pot, tE, self._dnudr, self._d2nudr2, self._rphi(tE)
+                        t, self._pot, tE, self._dnudr, self._d2nudr2, rmin
                     ),
                     0.0,
-                    numpy.sqrt(self._rphi(tE)),
+                    numpy.sqrt(rmin),
                     points=[0.0],
                 )[0]
-                for tE in Eint[indx]
-            ]
-        )
-        out[indx] += numpy.array(
-            [
-                integrate.quad(
+                + integrate.quad(
                     lambda t: _fEintegrand_larger(
                         t, self._pot, tE, self._dnudr, self._d2nudr2
                     ),
                     0.0,
-                    0.5 / self._rphi(tE),
+                    0.5 / rmin,
                 )[0]
-                for tE in Eint[indx]
+                for tE, rmin in zip(Eint[indx], rmins)
             ]
         )
         return -out / (numpy.sqrt(8.0) * numpy.pi**2.0)
@@ -136,7 +136,7 @@ def _fEintegrand_raw(r, pot, E, dnudr, d2nudr2):
     # The 'raw', i.e., direct integrand in the Eddington inversion
     Fr = _evaluateRforces(pot, r, 0)
     return (
-        (Fr * d2nudr2(r) + dnudr(r) * evaluateR2derivs(pot, r, 0, use_physical=False))
+        (Fr * d2nudr2(r) + dnudr(r) * _evaluateR2derivs(pot, r, 0))
         / Fr**2.0
         / numpy.sqrt(_evaluatePotentials(pot, r, 0) - E)
     )
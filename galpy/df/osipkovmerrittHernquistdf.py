@@ -1,11 +1,21 @@
 # Class that implements the anisotropic spherical Hernquist DF with radially
 # varying anisotropy of the Osipkov-Merritt type
+import math
+
 import numpy
+from scipy import LowLevelCallable, integrate
 
 from ..potential import HernquistPotential, evaluatePotentials
 from ..util import conversion
+from ..util._optional_deps import _NUMBA_LOADED
 from .osipkovmerrittdf import _osipkovmerrittdf
 
+if _NUMBA_LOADED:
+    from numba import cfunc, types
+
+# Cache of the compiled velocity-moment integrand, compiled on first use
+_compiled = {}
+
 
 class osipkovmerrittHernquistdf(_osipkovmerrittdf):
     """Class that implements the anisotropic spherical Hernquist DF with radially varying anisotropy of the Osipkov-Merritt type
@@ -18,7 +28,7 @@ class osipkovmerrittHernquistdf(_osipkovmerrittdf):
 
     """
 
-    def __init__(self, pot=None, ra=1.4, ro=None, vo=None):
+    def __init__(self, pot=None, ra=1.4, numba=False, ro=None, vo=None):
         """
         Initialize a Hernquist DF with Osipkov-Merritt anisotropy
 
@@ -28,6 +38,8 @@ class osipkovmerrittHernquistdf(_osipkovmerrittdf):
             Hernquist potential which determines the DF
         ra : float or Quantity, optional
             Anisotropy radius
+        numba : bool, optional
+            If True and numba is installed, use a numba-compiled integrand for the velocity moments (default: False); compiling it takes about a second once per process, so this only pays off when computing many moments.
         ro : float or Quantity, optional
             Distance scale for translation into internal units (default from configuration file).
         vo : float or Quantity, optional
@@ -41,6 +53,7 @@ class osipkovmerrittHernquistdf(_osipkovmerrittdf):
             pot, HernquistPotential
         ), "pot= must be potential.HernquistPotential"
         _osipkovmerrittdf.__init__(self, pot=pot, ra=ra, ro=ro, vo=vo)
+        self._numba = numba and _NUMBA_LOADED
         self._psi0 = -evaluatePotentials(self._pot, 0, 0, use_physical=False)
         self._GMa = self._psi0 * self._pot.a**2.0
         self._a2overra2 = self._pot.a**2.0 / self._ra2
@@ -96,7 +109,48 @@ class osipkovmerrittHernquistdf(_osipkovmerrittdf):
             fQ[Qtilde_out] = 0.0
         return self._fQnorm * fQ.reshape(Q.shape)
 
+    def _vmoment_vintegral(self, Pot, vmax, k):
+        # Use a numba-compiled integrand for quad when requested
+        if not self._numba:
+            return _osipkovmerrittdf._vmoment_vintegral(self, Pot, vmax, k)
+        if "vmoment" not in _compiled:
+            _compiled["vmoment"] = _compile_vmoment_integrand()
+        return (
+            self._fQnorm
+            * integrate.quad(
+                _compiled["vmoment"],
+                0.0,
+                vmax,
+                args=(k, Pot, self._psi0, self._a2overra2),
+            )[0]
+        )
+
     def _icmf(self, ms):
         """Analytic expression for the normalized inverse cumulative mass
         function. The argument ms is normalized mass fraction [0,1]"""
         return self._pot.a * numpy.sqrt(ms) / (1 - numpy.sqrt(ms))
+
+
+def _compile_vmoment_integrand():
+    """Compile v^k f(Q=-Pot-v^2/2) / fQnorm, with args (k,Pot,psi0,a^2/ra^2), as a LowLevelCallable for quad"""
+
+    @cfunc(types.double(types.intc, types.CPointer(types.double)), error_model="numpy")
+    def vmoment_integrand(n, xx):
+        v, k, Pot, psi0, a2overra2 = xx[0], xx[1], xx[2], xx[3], xx[4]
+        # Same as fQ
+        Qtilde = (-Pot - 0.5 * v * v) / psi0
+        if Qtilde < 0.0 or Qtilde > 1.0:
+            return 0.0
+        sqrtQtilde = math.sqrt(Qtilde)
+        fQ = (
+            sqrtQtilde
+            / (1.0 - Qtilde) ** 2.0
+            * (
+                (1.0 - 2.0 * Qtilde) * (8.0 * Qtilde**2.0 - 8.0 * Qtilde - 3.0)
+                + ((3.0 * math.asin(sqrtQtilde)) / math.sqrt(Qtilde * (1.0 - Qtilde)))
+            )
+        )
+        fQ += 8.0 * a2overra2 * sqrtQtilde * (1.0 - 2.0 * Qtilde)
+        return v**k * fQ
+
+    return LowLevelCallable(vmoment_integrand.ctypes)
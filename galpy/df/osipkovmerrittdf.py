@@ -8,6 +8,9 @@ from ..util import conversion
 from .eddingtondf import eddingtondf
 from .sphericaldf import anisotropicsphericaldf, sphericaldf
 
+# Cache of the gamma-function ratio in the velocity moments, keyed by (n,m)
+_GAMMA_CACHE = {}
+
 
 # This is the general Osipkov-Merritt superclass, implementation of general
 # formula can be found following this class
@@ -79,48 +82,25 @@ class _osipkovmerrittdf(anisotropicsphericaldf):
         def Lintegrand(t, L2lim, E):
             return self((E, numpy.sqrt(L2lim - t**2.0)), use_physical=False)
 
-        # Integrate where Q > 0
+        def rintegrand(r, E):
+            # Integrate where Q > 0
+            L2lim = 2.0 * r**2.0 * (E - _evaluatePotentials(self._pot, r, 0.0))
+            return (
+                r
+                * integrate.quad(
+                    Lintegrand,
+                    numpy.sqrt(numpy.amax([0.0, L2lim + 2.0 * E * self._ra2])),
+                    numpy.sqrt(L2lim),
+                    args=(L2lim, E),
+                )[0]
+            )
 
         out = (
             16.0
             * numpy.pi**2.0
             * numpy.array(
                 [
-                    integrate.quad(
-                        lambda r: r
-                        * integrate.quad(
-                            Lintegrand,
-                            numpy.sqrt(
-                                numpy.amax(
-                                    [
-                                        (0.0),
-                                        (
-                                            2.0
-                                            * r**2.0
-                                            * (
-                                                tE
-                                                - _evaluatePotentials(self._pot, r, 0.0)
-                                            )
-                                            + 2.0 * tE * self._ra2
-                                        ),
-                                    ]
-                                )
-                            ),
-                            numpy.sqrt(
-                                2.0
-                                * r**2.0
-                                * (tE - _evaluatePotentials(self._pot, r, 0.0))
-                            ),
-                            args=(
-                                2.0
-                                * r**2.0
-                                * (tE - _evaluatePotentials(self._pot, r, 0.0)),
-                                tE,
-                            ),
-                        )[0],
-                        0.0,
-                        self._rphi(tE),
-                    )[0]
+                    integrate.quad(rintegrand, 0.0, self._rphi(tE), args=(tE,))[0]
                     for ii, tE in enumerate(E)
                 ]
             )
@@ -139,12 +119,10 @@ class _osipkovmerrittdf(anisotropicsphericaldf):
         # x = c sqrt(1+[r/ra]^2) / sqrt( [r/ra]^2 c^2 + 1 ) for c > 0 [b > 0.5]
         # and symmetric wrt c
         c = numpy.random.uniform(size=n)
-        x = (
-            c
-            * numpy.sqrt(1 + r**2.0 / self._ra2)
-            / numpy.sqrt(r**2.0 / self._ra2 * c**2.0 + 1)
-        )
-        x *= numpy.random.choice([1.0, -1.0], size=n)
+        A = r * r / self._ra2
+        x = c * numpy.sqrt(1.0 + A) / numpy.sqrt(A * c * c + 1.0)
+        # Random sign, same random stream as numpy.random.choice([1.,-1.])
+        x *= 1.0 - 2.0 * numpy.random.randint(0, 2, size=n)
         return numpy.arccos(x)
 
     def _p_v_at_r(self, v, r):
@@ -173,21 +151,32 @@ class _osipkovmerrittdf(anisotropicsphericaldf):
     def _vmomentdensity(self, r, n, m):
         if m % 2 == 1 or n % 2 == 1:
             return 0.0
+        gamma_ratio = _GAMMA_CACHE.get((n, m))
+        if gamma_ratio is None:
+            gamma_ratio = (
+                special.gamma(m / 2.0 + 1.0)
+                * special.gamma((n + 1) / 2.0)
+                / special.gamma(0.5 * (m + n + 3.0))
+            )
+            _GAMMA_CACHE[(n, m)] = gamma_ratio
         return (
             2.0
             * numpy.pi
-            * integrate.quad(
-                lambda v: v ** (2.0 + m + n)
-                * self.fQ(-_evaluatePotentials(self._pot, r, 0) - 0.5 * v**2.0),
-                0.0,
+            * self._vmoment_vintegral(
+                _evaluatePotentials(self._pot, r, 0),
                 self._vmax_at_r(self._pot, r),
-            )[0]
-            * special.gamma(m / 2.0 + 1.0)
-            * special.gamma((n + 1) / 2.0)
-            / special.gamma(0.5 * (m + n + 3.0))
+                2.0 + m + n,
+            )
+            * gamma_ratio
             / (1 + r**2.0 / self._ra2) ** (m / 2 + 1)
         )
 
+    def _vmoment_vintegral(self, Pot, vmax, k):
+        """Integral of v^k f(Q=-Pot-v^2/2) from v=0 to vmax at the radius where the potential is Pot"""
+        return integrate.quad(lambda v: v**k * self.fQ(-Pot - 0.5 * v**2.0), 0.0, vmax)[
+            0
+        ]
+
 
 class osipkovmerrittdf(_osipkovmerrittdf):
     """Class that implements spherical DFs with Osipkov-Merritt-type orbital anisotropy
@@ -235,49 +224,44 @@ class osipkovmerrittdf(_osipkovmerrittdf):
         self._edf = eddingtondf(
             pot=self._pot, denspot=self._denspot, scale=scale, rmax=rmax, ro=ro, vo=vo
         )
-        self._edf._dnudr = (
-            (
-                lambda r: self._denspot._ddensdr(r) * (1.0 + r**2.0 / self._ra2)
-                + 2.0 * self._denspot.dens(r, 0, use_physical=False) * r / self._ra2
+        inv_ra2 = 1.0 / self._ra2
+        two_inv_ra2 = 2.0 * inv_ra2
+        if not isinstance(self._denspot, list):
+            self._edf._dnudr = (
+                lambda r: self._denspot._ddensdr(r) * (1.0 + r**2.0 * inv_ra2)
+                + two_inv_ra2 * self._denspot.dens(r, 0, use_physical=False) * r
             )
-            if not isinstance(self._denspot, list)
-            else (
-                lambda r: numpy.sum([p._ddensdr(r) for p in self._denspot])
-                * (1.0 + r**2.0 / self._ra2)
-                + 2.0
+            self._edf._d2nudr2 = (
+                lambda r: self._denspot._d2densdr2(r) * (1.0 + r**2.0 * inv_ra2)
+                + 2.0 * two_inv_ra2 * self._denspot._ddensdr(r) * r
+                + two_inv_ra2 * self._denspot.dens(r, 0, use_physical=False)
+            )
+        else:
+            # Bind the component derivatives once, rather than looking them
+            # up in a list comprehension on every evaluation
+            ddens_fns = tuple(p._ddensdr for p in self._denspot)
+            d2dens_fns = tuple(p._d2densdr2 for p in self._denspot)
+            self._edf._dnudr = (
+                lambda r: sum(f(r) for f in ddens_fns) * (1.0 + r**2.0 * inv_ra2)
+                + two_inv_ra2
                 * evaluateDensities(self._denspot, r, 0, use_physical=False)
                 * r
-                / self._ra2
-            )
-        )
-        self._edf._d2nudr2 = (
-            (
-                lambda r: self._denspot._d2densdr2(r) * (1.0 + r**2.0 / self._ra2)
-                + 4.0 * self._denspot._ddensdr(r) * r / self._ra2
-                + 2.0 * self._denspot.dens(r, 0, use_physical=False) / self._ra2
             )
-            if not isinstance(self._denspot, list)
-            else (
-                lambda r: numpy.sum([p._d2densdr2(r) for p in self._denspot])
-                * (1.0 + r**2.0 / self._ra2)
-                + 4.0
-                * numpy.sum([p._ddensdr(r) for p in self._denspot])
-                * r
-                / self._ra2
-                + 2.0
+            self._edf._d2nudr2 = (
+                lambda r: sum(f(r) for f in d2dens_fns) * (1.0 + r**2.0 * inv_ra2)
+                + 2.0 * two_inv_ra2 * sum(f(r) for f in ddens_fns) * r
+                + two_inv_ra2
                 * evaluateDensities(self._denspot, r, 0, use_physical=False)
-                / self._ra2
             )
-        )
 
     def sample(self, R=None, z=None, phi=None, n=1, return_orbit=True, rmin=0.0):
         # Slight over-write of superclass method to first build f(Q) interp
         # No docstring so superclass' is used
         if not hasattr(self, "_logfQ_interp"):
-            Qs4interp = numpy.hstack(
+            Qs4interp = numpy.concatenate(
                 (
                     numpy.geomspace(1e-8, 0.5, 101, endpoint=False),
-                    sorted(1.0 - numpy.geomspace(1e-8, 0.5, 101)),
+                    (1.0 - numpy.geomspace(1e-8, 0.5, 101))[::-1],
                 )
             )
             Qs4interp = -(
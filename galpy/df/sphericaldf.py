@@ -388,10 +388,12 @@ class sphericaldf(df):
         eta, psi = self._sample_velocity_angles(r, n=n)
         v = self._sample_v(r, eta, n=n)
         vr = v * numpy.cos(eta)
-        vtheta = v * numpy.sin(eta) * numpy.cos(psi)
-        vT = v * numpy.sin(eta) * numpy.sin(psi)
-        vR = vr * numpy.sin(theta) + vtheta * numpy.cos(theta)
-        vz = vr * numpy.cos(theta) - vtheta * numpy.sin(theta)
+        vtan = v * numpy.sin(eta)
+        vtheta = vtan * numpy.cos(psi)
+        vT = vtan * numpy.sin(psi)
+        sintheta, costheta = numpy.sin(theta), numpy.cos(theta)
+        vR = vr * sintheta + vtheta * costheta
+        vz = vr * costheta - vtheta * sintheta
         if return_orbit:
             o = Orbit(vxvv=numpy.array([R, vR, vT, z, vz, phi]).T)
             if self._roSet and self._voSet:
@@ -422,7 +424,11 @@ class sphericaldf(df):
         else:
             if not hasattr(self, "_xi_cmf_interpolator"):
                 self._xi_cmf_interpolator = self._make_cmf_interpolator()
-            xi_samples = self._xi_cmf_interpolator(rand_mass_frac)
+            # FITPACK searches for each point's knot interval starting from
+            # the previous point's, so evaluate at the sorted mass fractions
+            sindx = numpy.argsort(rand_mass_frac)
+            xi_samples = numpy.empty_like(rand_mass_frac)
+            xi_samples[sindx] = self._xi_cmf_interpolator(rand_mass_frac[sindx])
             r_samples = _xiToR(xi_samples, a=self._scale)
         return r_samples
 
@@ -482,12 +488,11 @@ class sphericaldf(df):
         """Function that gives the max velocity in the DF at r;
         typically equal to vesc, but not necessarily for finite systems
         such as King"""
+        # The potential at rmax is a constant of the DF, so only evaluate it once
+        if not hasattr(self, "_pot_at_rmax"):
+            self._pot_at_rmax = _evaluatePotentials(self._pot, self._rmax + 1e-10, 0)
         return numpy.sqrt(
-            2.0
-            * (
-                _evaluatePotentials(self._pot, self._rmax + 1e-10, 0)
-                - _evaluatePotentials(self._pot, r, 0.0)
-            )
+            2.0 * (self._pot_at_rmax - _evaluatePotentials(self._pot, r, 0.0))
         )
 
     def _make_pvr_interpolator(self, r_a_start=-3, r_a_end=3, n_r_a=120, n_v_vesc=100):
@@ -708,12 +713,12 @@ class isotropicsphericaldf(sphericaldf):
     def _vmomentdensity(self, r, n, m):
         if m % 2 == 1 or n % 2 == 1:
             return 0.0
+        Pot = _evaluatePotentials(self._pot, r, 0)
         return (
             2.0
             * numpy.pi
             * integrate.quad(
-                lambda v: v ** (2.0 + m + n)
-                * self.fE(_evaluatePotentials(self._pot, r, 0) + 0.5 * v**2.0),
+                lambda v: v ** (2.0 + m + n) * self.fE(Pot + 0.5 * v**2.0),
                 0.0,
                 self._vmax_at_r(self._pot, r),
             )[0]
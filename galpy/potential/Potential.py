@@ -624,6 +624,10 @@ class Potential(Force):
         - 2011-10-09 - Written - Bovy (IAS)
 
         """
+        return self._R2deriv_nodecorator(R, z, phi=phi, t=t)
+
+    def _R2deriv_nodecorator(self, R, z, phi=0.0, t=0.0):
+        # Separate, so it can be used in integrands without the decorator overhead
         try:
             return self._amp * self._R2deriv(R, z, phi=phi, t=t)
         except AttributeError:  # pragma: no cover
@@ -2345,20 +2349,25 @@ def evaluateR2derivs(Pot, R, z, phi=None, t=0.0):
     - 2012-07-25 - Written - Bovy (IAS)
 
     """
-    isList = isinstance(Pot, list)
     nonAxi = _isNonAxi(Pot)
     if nonAxi and phi is None:
         raise PotentialError(
             "The (list of) Potential instances is non-axisymmetric, but you did not provide phi"
         )
+    return _evaluateR2derivs(Pot, R, z, phi=phi, t=t)
+
+
+def _evaluateR2derivs(Pot, R, z, phi=None, t=0.0):
+    """Raw, undecorated function for internal use"""
+    isList = isinstance(Pot, list)
     if isList:
         out = 0.0
         for pot in Pot:
             if not pot.isDissipative:
-                out += pot.R2deriv(R, z, phi=phi, t=t, use_physical=False)
+                out += pot._R2deriv_nodecorator(R, z, phi=phi, t=t)
         return out
     elif not Pot.isDissipative:
-        return Pot.R2deriv(R, z, phi=phi, t=t, use_physical=False)
+        return Pot._R2deriv_nodecorator(R, z, phi=phi, t=t)
 
 
 @potential_positional_arg
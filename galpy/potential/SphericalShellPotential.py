@@ -58,37 +58,31 @@ class SphericalShellPotential(SphericalPotential):
 
     def _revaluate(self, r, t=0.0):
         """The potential as a function of r"""
-        if r <= self.a:
-            return -1.0 / self.a
-        else:
-            return -1.0 / r
+        return -1.0 / numpy.maximum(r, self.a)
 
     def _rforce(self, r, t=0.0):
         """The force as a function of r"""
-        if r <= self.a:
-            return 0.0
-        else:
-            return -1 / r**2.0
+        return numpy.where(r <= self.a, 0.0, -1.0 / numpy.maximum(r, self.a) ** 2.0)
 
     def _r2deriv(self, r, t=0.0):
         """The second radial derivative as a function of r"""
-        if r <= self.a:
-            return 0.0
-        else:
-            return -2.0 / r**3.0
+        return numpy.where(r <= self.a, 0.0, -2.0 / numpy.maximum(r, self.a) ** 3.0)
 
     def _rdens(self, r, t=0.0):
         """The density as a function of r"""
-        if r != self.a:
-            return 0.0
-        else:  # pragma: no cover
-            return numpy.infty
+        return numpy.where(r != self.a, 0.0, numpy.inf)
 
     def _surfdens(self, R, z, phi=0.0, t=0.0):
-        if R > self.a:
-            return 0.0
-        h = numpy.sqrt(self.a2 - R**2)
-        if z < h:
-            return 0.0
-        else:
-            return 1.0 / (2.0 * numpy.pi * self.a * h)
+        h = numpy.sqrt(numpy.maximum(self.a2 - R * R, 0.0))
+        # Substitute h=1 where h=0 (surface density is infinite there) to
+        # avoid dividing by zero
+        hpos = h > 0.0
+        return numpy.where(
+            (R > self.a) | (z < h),
+            0.0,
+            numpy.where(
+                hpos,
+                1.0 / (2.0 * numpy.pi * self.a * numpy.where(hpos, h, 1.0)),
+                numpy.inf,
+            ),
+        )
@@ -32,17 +32,32 @@
 #############################################################################
 import numpy
 
+from ._optional_deps import _NUMBA_LOADED
+
+if _NUMBA_LOADED:
+    from numba import njit
+    from numba.extending import is_jitted
+
 _MAX_DT_REDUCE = 10000.0
 
 
-def leapfrog(func, yo, t, args=(), rtol=1.49012e-12, atol=1.49012e-12):
+def leapfrog(
+    func,
+    yo,
+    t,
+    args=(),
+    rtol=1.49012e-12,
+    atol=1.49012e-12,
+    dt_fixed=False,
+    ndt_max=_MAX_DT_REDUCE,
+):
     """
     Leapfrog integration of an ODE
 
     Parameters
     ----------
     func : function
-        function of (y, *args)
+        function of (y, *args, t=t); if this is a numba-compiled function, the whole integration is done in numba
     yo : numpy.ndarray
         initial condition [q,p]
     t : numpy.ndarray
@@ -53,6 +68,10 @@ def leapfrog(func, yo, t, args=(), rtol=1.49012e-12, atol=1.49012e-12):
         relative tolerance
     atol : float, optional
         absolute tolerance
+    dt_fixed : bool, optional
+        if True, integrate with the spacing of t as the step size, rather than estimating the step size using rtol and atol
+    ndt_max : float, optional
+        maximum number of steps per interval in t when estimating the step size
 
     Returns
     -------
@@ -71,25 +90,43 @@ def leapfrog(func, yo, t, args=(), rtol=1.49012e-12, atol=1.49012e-12):
     # Estimate necessary step size
     dt = t[1] - t[0]  # assumes that the steps are equally spaced
     init_dt = dt
-    dt = _leapfrog_estimate_step(func, qo, po, dt, t[0], args, rtol, atol)
+    if not dt_fixed:
+        dt = _leapfrog_estimate_step(
+            func, qo, po, dt, t[0], args, rtol, atol, max_reduce=ndt_max
+        )
     ndt = int(init_dt / dt)
-    # Integrate
+    # Integrate, working in place on copies of the initial condition
+    qo = numpy.array(qo, dtype="float")
+    po = numpy.array(po, dtype="float")
+    if _NUMBA_LOADED and is_jitted(func):
+        # Run the whole loop in numba when func itself is numba-compiled
+        _leapfrog_numba(func, qo, po, dt, ndt, t[0], tuple(args), out)
+        return out
+    # Preallocate buffers to avoid allocating new arrays at every step
+    q12 = numpy.empty_like(qo)
+    qtmp = numpy.empty_like(qo)
+    ptmp = numpy.empty_like(po)
     to = t[0]
+    # Drift-kick-drift: each sub-step evaluates the force once, at the
+    # half-step position, so no force evaluation can be carried over between
+    # sub-steps or output steps (unlike in kick-drift-kick)
     for ii in range(1, len(t)):
         # initial half drift
-        q12 = leapfrog_leapq(qo, po, dt / 2.0)
+        numpy.copyto(q12, qo)
+        leapfrog_leapq_inplace(q12, po, dt / 2.0, qtmp)
         for jj in range(ndt - 1):  # loop over number of sub-intervals
             # kick
             force = func(q12, *args, t=to + dt / 2)
-            po = leapfrog_leapp(po, dt, force)
+            leapfrog_leapp_inplace(po, dt, force, ptmp)
             # full drift to next half step
-            q12 = leapfrog_leapq(q12, po, dt)
+            leapfrog_leapq_inplace(q12, po, dt, qtmp)
             # Get ready for next
             to += dt
         # last kick and half drift to arrive at final step
         force = func(q12, *args, t=to + dt / 2)
-        po = leapfrog_leapp(po, dt, force)
-        qo = leapfrog_leapq(q12, po, dt / 2)
+        leapfrog_leapp_inplace(po, dt, force, ptmp)
+        numpy.copyto(qo, q12)
+        leapfrog_leapq_inplace(qo, po, dt / 2, qtmp)
         to += dt
 
         out[ii, 0 : len(yo) // 2] = qo
@@ -97,6 +134,47 @@ def leapfrog(func, yo, t, args=(), rtol=1.49012e-12, atol=1.49012e-12):
     return out
 
 
+if _NUMBA_LOADED:
+
+    @njit
+    def _leapfrog_leapq_numba(q, p, dt):
+        # q += dt * p in place, element by element
+        for kk in range(len(q)):
+            q[kk] += dt * p[kk]
+
+    @njit
+    def _leapfrog_leapp_numba(p, dt, force):
+        # p += dt * force in place, element by element
+        for kk in range(len(p)):
+            p[kk] += dt * force[kk]
+
+    @njit
+    def _leapfrog_numba(func, qo, po, dt, ndt, to, args, out):
+        # Same as the loop in leapfrog, but for a numba-compiled func,
+        # with the drifts and kicks done in place; t is passed positionally
+        nq = len(qo)
+        q12 = numpy.empty(nq)
+        for ii in range(1, out.shape[0]):
+            # initial half drift
+            q12[:] = qo
+            _leapfrog_leapq_numba(q12, po, dt / 2.0)
+            for jj in range(ndt - 1):  # loop over number of sub-intervals
+                # kick
+                force = func(*((q12,) + args + (to + dt / 2,)))
+                _leapfrog_leapp_numba(po, dt, force)
+                # full drift to next half step
+                _leapfrog_leapq_numba(q12, po, dt)
+                to += dt
+            # last kick and half drift to arrive at final step
+            force = func(*((q12,) + args + (to + dt / 2,)))
+            _leapfrog_leapp_numba(po, dt, force)
+            qo[:] = q12
+            _leapfrog_leapq_numba(qo, po, dt / 2)
+            to += dt
+            out[ii, :nq] = qo
+            out[ii, nq:] = po
+
+
 def leapfrog_leapq(q, p, dt):
     return q + dt * p
 
@@ -105,14 +183,31 @@ def leapfrog_leapp(p, dt, force):
     return p + dt * force
 
 
-def _leapfrog_estimate_step(func, qo, po, dt, to, args, rtol, atol):
+def leapfrog_leapq_inplace(q, p, dt, tmp):
+    # q += dt * p, using tmp as a buffer for dt * p
+    numpy.multiply(dt, p, out=tmp)
+    q += tmp
+    return q
+
+
+def leapfrog_leapp_inplace(p, dt, force, tmp):
+    # p += dt * force, using tmp as a buffer for dt * force
+    numpy.multiply(dt, force, out=tmp)
+    p += tmp
+    return p
+
+
+def _leapfrog_estimate_step(
+    func, qo, po, dt, to, args, rtol, atol, max_reduce=_MAX_DT_REDUCE
+):
     init_dt = dt
-    qmax = numpy.amax(numpy.fabs(qo)) + numpy.zeros(len(qo))
-    pmax = numpy.amax(numpy.fabs(po)) + numpy.zeros(len(po))
-    scale = atol + rtol * numpy.array([qmax, pmax]).flatten()
+    # Tolerance scales for q and p, the same for all elements of each
+    qscale2 = (atol + rtol * numpy.amax(numpy.fabs(qo))) ** 2.0
+    pscale2 = (atol + rtol * numpy.amax(numpy.fabs(po))) ** 2.0
+    ndim = len(qo) + len(po)
     err = 2.0
     dt *= 2.0
-    while err > 1.0 and init_dt / dt < _MAX_DT_REDUCE:
+    while err > 1.0 and init_dt / dt < max_reduce:
         # Do one leapfrog step with step dt and one with dt/2.
         # dt
         q12 = leapfrog_leapq(qo, po, dt / 2.0)
@@ -128,7 +223,10 @@ def _leapfrog_estimate_step(func, qo, po, dt, to, args, rtol, atol):
         p12 = leapfrog_leapp(ptmp, dt / 2.0, force)
         q12 = leapfrog_leapq(qtmp, p12, dt / 4.0)
         # Norm
-        delta = numpy.array([numpy.fabs(q11 - q12), numpy.fabs(p11 - p12)]).flatten()
-        err = numpy.sqrt(numpy.mean((delta / scale) ** 2.0))
+        dq = q11 - q12
+        dp = p11 - p12
+        err = numpy.sqrt(
+            (numpy.dot(dq, dq) / qscale2 + numpy.dot(dp, dp) / pscale2) / ndim
+        )
         dt /= 2.0
     return dt
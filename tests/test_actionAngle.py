@@ -1338,6 +1338,170 @@ def test_actionAngleSpherical_angler_at_pericenter():
     return None
 
 
+# Test that actionAngleSpherical gives the same result for potentials with
+# special, compiled integrands and solvers as for their general versions
+def test_actionAngleSpherical_compiled_integrands():
+    pytest.importorskip("numba")
+    from galpy.actionAngle import actionAngleSpherical
+    from galpy.potential import (
+        HernquistPotential,
+        KeplerPotential,
+        NFWPotential,
+        PowerSphericalPotential,
+        TwoPowerSphericalPotential,
+    )
+
+    R, vR, vT, z, vz, phi = 1.1, 0.3, 0.8, 0.2, 0.1, 2.0
+    for pot, genpot in [
+        (
+            HernquistPotential(normalize=1.0, a=2.0),
+            TwoPowerSphericalPotential(normalize=1.0, a=2.0, alpha=1.0, beta=4.0),
+        ),
+        (
+            NFWPotential(normalize=1.0, a=2.0),
+            TwoPowerSphericalPotential(normalize=1.0, a=2.0, alpha=1.0, beta=3.0),
+        ),
+        (
+            KeplerPotential(normalize=1.0),
+            PowerSphericalPotential(normalize=1.0, alpha=3.0),
+        ),
+    ]:
+        aAS = actionAngleSpherical(pot=pot, numba=True)
+        aASg = actionAngleSpherical(pot=genpot)
+        assert aAS._compiled_integrands, "numba=True should compile the integrands"
+        assert not actionAngleSpherical(
+            pot=pot
+        )._compiled_integrands, "Integrands should only be compiled with numba=True"
+        for fixed_quad in [False, True]:
+            jo = aAS.actionsFreqsAngles(R, vR, vT, z, vz, phi, fixed_quad=fixed_quad)
+            jog = aASg.actionsFreqsAngles(R, vR, vT, z, vz, phi, fixed_quad=fixed_quad)
+            for ii in range(9):
+                assert (
+                    numpy.fabs((jo[ii] - jog[ii]) / jog[ii]) < 10.0**-8.0
+                ), f"actionAngleSpherical with compiled integrands for {type(pot).__name__} does not agree with the general potential"
+        # Also check the compiled peri- and apocenter solver
+        eo = aAS.EccZmaxRperiRap(R, vR, vT, z, vz)
+        eog = aASg.EccZmaxRperiRap(R, vR, vT, z, vz)
+        for ii in range(4):
+            assert (
+                numpy.fabs((eo[ii] - eog[ii]) / eog[ii]) < 10.0**-8.0
+            ), f"actionAngleSpherical with compiled peri- and apocenter solver for {type(pot).__name__} does not agree with the general potential"
+    return None
+
+
+# Test that actionAngleSpherical gives the same result when using multiple cores
+def test_actionAngleSpherical_numcores():
+    from galpy.actionAngle import actionAngleSpherical
+    from galpy.potential import NFWPotential
+
+    aAS = actionAngleSpherical(pot=NFWPotential(normalize=1.0, a=2.0))
+    R = numpy.linspace(0.5, 1.5, 5)
+    vR = 0.2 * numpy.ones(5)
+    vT = numpy.linspace(0.7, 1.1, 5)
+    z = 0.1 * numpy.ones(5)
+    vz = 0.2 * numpy.ones(5)
+    phi = numpy.ones(5)
+    for fixed_quad in [False, True]:
+        jo = aAS.actionsFreqsAngles(R, vR, vT, z, vz, phi, fixed_quad=fixed_quad)
+        jom = aAS.actionsFreqsAngles(
+            R, vR, vT, z, vz, phi, fixed_quad=fixed_quad, numcores=2
+        )
+        for ii in range(9):
+            assert numpy.all(
+                numpy.fabs(jo[ii] - jom[ii]) < 10.0**-10.0
+            ), "actionAngleSpherical with numcores=2 does not agree with numcores=1"
+    ecc = aAS.EccZmaxRperiRap(R, vR, vT, z, vz)
+    eccm = aAS.EccZmaxRperiRap(R, vR, vT, z, vz, numcores=2)
+    for ii in range(4):
+        assert numpy.all(
+            numpy.fabs(ecc[ii] - eccm[ii]) < 10.0**-10.0
+        ), "actionAngleSpherical with numcores=2 does not agree with numcores=1"
+    return None
+
+
+# Test that the C implementation of actionAngleSpherical agrees with Python
+def test_actionAngleSpherical_c():
+    from galpy.actionAngle import UnboundError, actionAngleSpherical
+    from galpy.actionAngle.actionAngleSpherical import ext_loaded
+    from galpy.potential import (
+        IsochronePotential,
+        NFWPotential,
+        interpSphericalPotential,
+    )
+
+    if not ext_loaded:  # would otherwise compare Python to Python
+        pytest.skip("C extension not loaded")
+    R = numpy.linspace(0.5, 1.5, 5)
+    vR = 0.2 * numpy.ones(5)
+    vT = numpy.linspace(0.7, 1.1, 5)
+    z = 0.1 * numpy.ones(5)
+    vz = 0.2 * numpy.ones(5)
+    for pot in [IsochronePotential(normalize=1.0, b=1.2), NFWPotential(normalize=1.0)]:
+        aAS = actionAngleSpherical(pot=pot, c=True)
+        # C uses fixed-order Gauss-Legendre integration, like fixed_quad=True
+        js = aAS(R, vR, vT, z, vz, fixed_quad=True)
+        jsp = aAS(R, vR, vT, z, vz, c=False, fixed_quad=True)
+        for ii in range(3):
+            assert numpy.all(
+                numpy.fabs(js[ii] - jsp[ii]) < 10.0**-8.0
+            ), "actionAngleSpherical actions in C do not agree with those in Python"
+        ecc = aAS.EccZmaxRperiRap(R, vR, vT, z, vz)
+        eccp = aAS.EccZmaxRperiRap(R, vR, vT, z, vz, c=False)
+        for ii in range(4):
+            assert numpy.all(
+                numpy.fabs(ecc[ii] - eccp[ii]) < 10.0**-8.0
+            ), "actionAngleSpherical peri- and apocenters in C do not agree with those in Python"
+    # C and Python should agree on which orbits are bound: the apocenter of
+    # the first orbit is just inside the cutoff for r=1 (128), that of the
+    # second just beyond it
+    ip = IsochronePotential(normalize=1.0, b=1.2)
+    isp = interpSphericalPotential(rforce=ip, rgrid=numpy.geomspace(0.01, 300.0, 3001))
+    for pot in [ip, isp]:
+        aAS = actionAngleSpherical(pot=pot, c=True)
+        js = aAS(1.0, 2.718, 1.0, 0.1, 0.2, fixed_quad=True)
+        jsp = aAS(1.0, 2.718, 1.0, 0.1, 0.2, c=False, fixed_quad=True)
+        for ii in range(3):
+            assert numpy.all(
+                numpy.fabs(js[ii] - jsp[ii]) < 10.0**-8.0
+            ), "actionAngleSpherical actions in C do not agree with those in Python for large apocenters"
+        ecc = aAS.EccZmaxRperiRap(1.0, 2.718, 1.0, 0.1, 0.2)
+        eccp = aAS.EccZmaxRperiRap(1.0, 2.718, 1.0, 0.1, 0.2, c=False)
+        assert eccp[3] > 100.0, "Test orbit should have a large apocenter"
+        for ii in range(4):
+            assert numpy.all(
+                numpy.fabs(ecc[ii] - eccp[ii]) < 10.0**-8.0
+            ), "actionAngleSpherical peri- and apocenters in C do not agree with those in Python for large apocenters"
+        for c in [True, False]:
+            with pytest.raises(UnboundError):
+                aAS(1.0, 2.72, 1.0, 0.1, 0.2, c=c)
+            with pytest.raises(UnboundError):
+                aAS.EccZmaxRperiRap(1.0, 2.72, 1.0, 0.1, 0.2, c=c)
+    return None
+
+
+# Test that scalar inputs of any numeric type work in actionAngleSpherical
+def test_actionAngleSpherical_scalar_types():
+    from galpy.actionAngle import actionAngleSpherical
+    from galpy.potential import IsochronePotential
+
+    aAS = actionAngleSpherical(pot=IsochronePotential(normalize=1.0, b=1.2))
+    jo = aAS.actionsFreqsAngles(1.0, 0.2, 0.9, 0.1, 0.2, 1.0)
+    for args in [
+        (1, 0.2, 0.9, 0.1, 0.2, 1),
+        tuple(numpy.float64(x) for x in (1.0, 0.2, 0.9, 0.1, 0.2, 1.0)),
+        tuple(numpy.array(x) for x in (1.0, 0.2, 0.9, 0.1, 0.2, 1.0)),
+    ]:
+        assert numpy.all(
+            numpy.fabs(numpy.array(aAS(*args[:5])) - numpy.array(jo[:3])) < 10.0**-10.0
+        ), "actionAngleSpherical actions for scalar input types do not agree"
+        joa = aAS.actionsFreqsAngles(*args)
+        for ii in range(9):
+            assert numpy.all(
+                numpy.fabs(joa[ii] - jo[ii]) < 10.0**-10.0
+            ), "actionAngleSpherical actionsFreqsAngles for scalar input types do not agree"
+    return None
+
+
 # Basic sanity checking of the actionAngleAdiabatic actions
 def test_actionAngleAdiabatic_basic_actions():
     from galpy.actionAngle import actionAngleAdiabatic
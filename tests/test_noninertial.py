@@ -1,81 +1,129 @@
 # Tests of integrating orbits in non-inertial frames
+import functools
+import math
+import numbers
+
 import numpy
 import pytest
 
 from galpy import potential
 from galpy.orbit import Orbit
 from galpy.util import coords
+from galpy.util._optional_deps import _NUMBA_LOADED
 
+if _NUMBA_LOADED:
+    import numba
 
-def test_lsrframe_scalaromegaz():
-    # Test that integrating an orbit in the LSR frame is equivalent to
-    # normal orbit integration
+# Times at which all orbits are integrated and compared; shared by all tests,
+# so made read-only
+_TS = numpy.linspace(0.0, 20.0, 1001)
+_TS.setflags(write=False)
+
+
+@pytest.fixture(scope="module")
+def disk_potentials():
+    # Halo and bar potentials shared by the LSR and linear-acceleration tests,
+    # their sum, and the circular frequency at R=1 of the halo
     lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    omega = lp.omegac(1.0)
     dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
-    framepot = potential.NonInertialFrameForce(Omega=omega)
-    dp_frame = potential.DehnenBarPotential(omegab=1.8 - omega, rb=0.5, Af=0.03)
-    diskframepot = lp + dp_frame + framepot
+    return lp, dp, lp + dp, lp.omegac(1.0)
 
-    # Now integrate the orbit of the Sun in both the inertial and the lsr frame
-    def check_orbit(method="odeint", tol=1e-9):
+
+@pytest.fixture(scope="module")
+def lsr_reference_orbits(disk_potentials):
+    # Orbit of the Sun in the inertial frame, with and without the bar,
+    # which is the reference for all test_lsrframe cases
+    lp, _, diskpot, _ = disk_potentials
+    ts = _TS
+    orbits = {}
+    for with_bar, pot in [(True, diskpot), (False, lp)]:
         o = Orbit()
         o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
-        # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.z(), o.vz(), o.phi()])
-        op.integrate(ts, diskframepot, method=method)
-        # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts)
-        op_xs = op.x(ts)
-        op_ys = op.y(ts)
-        assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
-        ), f"Integrating an orbit in the rotating LSR frame does not agree with the equivalent orbit in the inertial frame for integration method {method}"
-        assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
-        ), f"Integrating an orbit in the rotating LSR frame does not agree with the equivalent orbit in the inertial frame for integration method {method}"
+        o.integrate(ts, pot)
+        orbits[with_bar] = o
+    return ts, orbits
 
-    check_orbit(method="odeint", tol=1e-6)
-    check_orbit(method="dop853_c", tol=1e-9)
+
+@pytest.mark.parametrize("omega_shape", ["scalar", "vec"])
+@pytest.mark.parametrize("with_omegadot", [False, True])
+@pytest.mark.parametrize("method,tol", [("odeint", 1e-6), ("dop853_c", 1e-9)])
+def test_lsrframe(
+    omega_shape, with_omegadot, method, tol, disk_potentials, lsr_reference_orbits
+):
+    # Test that integrating an orbit in the LSR frame, rotating at a constant
+    # rate or acceleratingly, is equivalent to normal orbit integration
+    lp, _, _, omega = disk_potentials
+    omegadot = 0.02 if with_omegadot else 0.0
+    if omega_shape == "scalar":
+        Omega, Omegadot = omega, omegadot
+    else:
+        Omega = numpy.array([0.0, 0.0, omega])
+        Omegadot = numpy.array([0.0, 0.0, omegadot])
+    if with_omegadot:
+        framepot = potential.NonInertialFrameForce(Omega=Omega, Omegadot=Omegadot)
+        diskframepot = lp + framepot
+    else:
+        framepot = potential.NonInertialFrameForce(Omega=Omega)
+        dp_frame = potential.DehnenBarPotential(omegab=1.8 - omega, rb=0.5, Af=0.03)
+        diskframepot = lp + dp_frame + framepot
+    # Now integrate the orbit of the Sun in the lsr frame and compare to that
+    # in the inertial frame (no bar when the frame is accelerating)
+    ts, orbits = lsr_reference_orbits
+    o = orbits[not with_omegadot]
+    # Non-inertial frame
+    R0 = o.R()
+    op = Orbit(numpy.array([R0, o.vR(), o.vT() - omega * R0, o.z(), o.vz(), o.phi()]))
+    op.integrate(ts, diskframepot, method=method)
+    # Compare
+    o_Rs = o.R(ts)
+    o_phases = o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0
+    o_xs = o_Rs * numpy.cos(o_phases)
+    o_ys = o_Rs * numpy.sin(o_phases)
+    op_xs = op.x(ts)
+    op_ys = op.y(ts)
+    frame = "acceleratingly-rotating" if with_omegadot else "rotating"
+    assert (
+        max_abs_diff(o_xs, op_xs) < tol
+    ), f"Integrating an orbit in the {frame} LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
+    assert (
+        max_abs_diff(o_ys, op_ys) < tol
+    ), f"Integrating an orbit in the {frame} LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
     return None
 
 
-def test_lsrframe_scalaromegaz_2d():
+def test_lsrframe_scalaromegaz_2d(disk_potentials):
     # Test that integrating an orbit in the LSR frame is equivalent to
     # normal orbit integration in 2D
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    omega = lp.omegac(1.0)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot, omega = disk_potentials
     framepot = potential.NonInertialFrameForce(Omega=omega)
     dp_frame = potential.DehnenBarPotential(omegab=1.8 - omega, rb=0.5, Af=0.03)
     diskframepot = lp + dp_frame + framepot
 
     # Now integrate the orbit of the Sun in both the inertial and the lsr frame
+    # (the inertial-frame orbit does not depend on the method, so
+    # integrate it only once)
+    o = Orbit().toPlanar()
+    o.turn_physical_off()
+    ts = _TS
+    o.integrate(ts, diskpot)
+    o_Rs = o.R(ts)
+    o_phases = o.phi(ts) - omega * ts
+    o_xs = o_Rs * numpy.cos(o_phases)
+    o_ys = o_Rs * numpy.sin(o_phases)
+
     def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit().toPlanar()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.phi()])
+        R0 = o.R()
+        op = Orbit([R0, o.vR(), o.vT() - omega * R0, o.phi()])
         op.integrate(ts, diskframepot, method=method)
         # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts)
         op_xs = op.x(ts)
         op_ys = op.y(ts)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in the rotating LSR frame does not agree with the equivalent orbit in the inertial frame for integration method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in the rotating LSR frame does not agree with the equivalent orbit in the inertial frame for integration method {method}"
 
     check_orbit(method="odeint", tol=1e-6)
@@ -83,75 +131,39 @@ def test_lsrframe_scalaromegaz_2d():
     return None
 
 
-def test_lsrframe_vecomegaz():
-    # Test that integrating an orbit in the LSR frame is equivalent to
-    # normal orbit integration
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    omega = lp.omegac(1.0)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
-    framepot = potential.NonInertialFrameForce(Omega=numpy.array([0.0, 0.0, omega]))
-    dp_frame = potential.DehnenBarPotential(omegab=1.8 - omega, rb=0.5, Af=0.03)
-    diskframepot = lp + dp_frame + framepot
-
-    # Now integrate the orbit of the Sun in both the inertial and the lsr frame
-    def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
-        # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.z(), o.vz(), o.phi()])
-        op.integrate(ts, diskframepot, method=method)
-        # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts)
-        op_xs = op.x(ts)
-        op_ys = op.y(ts)
-        assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
-        ), f"Integrating an orbit in the rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
-        assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
-        ), f"Integrating an orbit in the rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
-
-    check_orbit(method="odeint", tol=1e-6)
-    check_orbit(method="dop853_c", tol=1e-9)
-    return None
-
-
-def test_lsrframe_vecomegaz_2d():
+def test_lsrframe_vecomegaz_2d(disk_potentials):
     # Test that integrating an orbit in the LSR frame is equivalent to
     # normal orbit integration in 2D
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    omega = lp.omegac(1.0)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot, omega = disk_potentials
     framepot = potential.NonInertialFrameForce(Omega=numpy.array([0.0, 0.0, omega]))
     dp_frame = potential.DehnenBarPotential(omegab=1.8 - omega, rb=0.5, Af=0.03)
     diskframepot = lp + dp_frame + framepot
 
     # Now integrate the orbit of the Sun in both the inertial and the lsr frame
+    # (the inertial-frame orbit does not depend on the method, so
+    # integrate it only once)
+    o = Orbit().toPlanar()
+    o.turn_physical_off()
+    ts = _TS
+    o.integrate(ts, diskpot)
+    o_Rs = o.R(ts)
+    o_phases = o.phi(ts) - omega * ts
+    o_xs = o_Rs * numpy.cos(o_phases)
+    o_ys = o_Rs * numpy.sin(o_phases)
+
     def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit().toPlanar()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.phi()])
+        R0 = o.R()
+        op = Orbit([R0, o.vR(), o.vT() - omega * R0, o.phi()])
         op.integrate(ts, diskframepot, method=method)
         # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts)
         op_xs = op.x(ts)
         op_ys = op.y(ts)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in the rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in the rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-6)
@@ -159,43 +171,6 @@ def test_lsrframe_vecomegaz_2d():
     return None
 
 
-def test_accellsrframe_scalaromegaz():
-    # Test that integrating an orbit in an LSR frame that is accelerating
-    # is equivalent to normal orbit integration
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    omega = lp.omegac(1.0)
-    omegadot = 0.02
-    diskpot = lp
-    framepot = potential.NonInertialFrameForce(Omega=omega, Omegadot=omegadot)
-    diskframepot = lp + framepot
-
-    # Now integrate the orbit of the Sun in both the inertial and the lsr frame
-    def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
-        # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.z(), o.vz(), o.phi()])
-        op.integrate(ts, diskframepot, method=method)
-        # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
-        op_xs = op.x(ts)
-        op_ys = op.y(ts)
-        assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
-        ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
-        assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
-        ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
-
-    check_orbit(method="odeint", tol=1e-6)
-    check_orbit(method="dop853_c", tol=1e-9)
-    return None
-
-
 def test_accellsrframe_scalaromegaz_2d():
     # Test that integrating an orbit in an LSR frame that is accelerating
     # is equivalent to normal orbit integration in 2D
@@ -207,64 +182,30 @@ def test_accellsrframe_scalaromegaz_2d():
     diskframepot = lp + framepot
 
     # Now integrate the orbit of the Sun in both the inertial and the lsr frame
-    def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit().toPlanar()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
-        # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.phi()])
-        op.integrate(ts, diskframepot, method=method)
-        # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
-        op_xs = op.x(ts)
-        op_ys = op.y(ts)
-        assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
-        ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
-        assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
-        ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
-
-    check_orbit(method="odeint", tol=1e-6)
-    check_orbit(method="dop853_c", tol=1e-9)
-    return None
+    # (the inertial-frame orbit does not depend on the method, so
+    # integrate it only once)
+    o = Orbit().toPlanar()
+    o.turn_physical_off()
+    ts = _TS
+    o.integrate(ts, diskpot)
+    o_Rs = o.R(ts)
+    o_phases = o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0
+    o_xs = o_Rs * numpy.cos(o_phases)
+    o_ys = o_Rs * numpy.sin(o_phases)
 
-
-def test_accellsrframe_vecomegaz():
-    # Test that integrating an orbit in an LSR frame that is accelerating
-    # is equivalent to normal orbit integration
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    omega = lp.omegac(1.0)
-    omegadot = 0.02
-    diskpot = lp
-    framepot = potential.NonInertialFrameForce(
-        Omega=numpy.array([0.0, 0.0, omega]), Omegadot=numpy.array([0.0, 0.0, omegadot])
-    )
-    diskframepot = lp + framepot
-
-    # Now integrate the orbit of the Sun in both the inertial and the lsr frame
     def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.z(), o.vz(), o.phi()])
+        R0 = o.R()
+        op = Orbit([R0, o.vR(), o.vT() - omega * R0, o.phi()])
         op.integrate(ts, diskframepot, method=method)
         # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
         op_xs = op.x(ts)
         op_ys = op.y(ts)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-6)
@@ -285,25 +226,30 @@ def test_accellsrframe_vecomegaz_2d():
     diskframepot = lp + framepot
 
     # Now integrate the orbit of the Sun in both the inertial and the lsr frame
+    # (the inertial-frame orbit does not depend on the method, so
+    # integrate it only once)
+    o = Orbit().toPlanar()
+    o.turn_physical_off()
+    ts = _TS
+    o.integrate(ts, diskpot)
+    o_Rs = o.R(ts)
+    o_phases = o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0
+    o_xs = o_Rs * numpy.cos(o_phases)
+    o_ys = o_Rs * numpy.sin(o_phases)
+
     def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit().toPlanar()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.phi()])
+        R0 = o.R()
+        op = Orbit([R0, o.vR(), o.vT() - omega * R0, o.phi()])
         op.integrate(ts, diskframepot, method=method)
         # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
         op_xs = op.x(ts)
         op_ys = op.y(ts)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-6)
@@ -324,25 +270,32 @@ def test_accellsrframe_funcomegaz():
     diskframepot = lp + framepot
 
     # Now integrate the orbit of the Sun in both the inertial and the lsr frame
+    # (the inertial-frame orbit does not depend on the method, so
+    # integrate it only once)
+    o = Orbit()
+    o.turn_physical_off()
+    ts = _TS
+    o.integrate(ts, diskpot)
+    o_Rs = o.R(ts)
+    o_phases = o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0
+    o_xs = o_Rs * numpy.cos(o_phases)
+    o_ys = o_Rs * numpy.sin(o_phases)
+
     def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.z(), o.vz(), o.phi()])
+        R0 = o.R()
+        op = Orbit(
+            numpy.array([R0, o.vR(), o.vT() - omega * R0, o.z(), o.vz(), o.phi()])
+        )
         op.integrate(ts, diskframepot, method=method)
         # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
         op_xs = op.x(ts)
         op_ys = op.y(ts)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-6)
@@ -363,25 +316,30 @@ def test_accellsrframe_funcomegaz_2d():
     diskframepot = lp + framepot
 
     # Now integrate the orbit of the Sun in both the inertial and the lsr frame
+    # (the inertial-frame orbit does not depend on the method, so
+    # integrate it only once)
+    o = Orbit().toPlanar()
+    o.turn_physical_off()
+    ts = _TS
+    o.integrate(ts, diskpot)
+    o_Rs = o.R(ts)
+    o_phases = o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0
+    o_xs = o_Rs * numpy.cos(o_phases)
+    o_ys = o_Rs * numpy.sin(o_phases)
+
     def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit().toPlanar()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.phi()])
+        R0 = o.R()
+        op = Orbit([R0, o.vR(), o.vT() - omega * R0, o.phi()])
         op.integrate(ts, diskframepot, method=method)
         # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
         op_xs = op.x(ts)
         op_ys = op.y(ts)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-6)
@@ -402,25 +360,32 @@ def test_accellsrframe_vecfuncomegaz():
     diskframepot = lp + framepot
 
     # Now integrate the orbit of the Sun in both the inertial and the lsr frame
+    # (the inertial-frame orbit does not depend on the method, so
+    # integrate it only once)
+    o = Orbit()
+    o.turn_physical_off()
+    ts = _TS
+    o.integrate(ts, diskpot)
+    o_Rs = o.R(ts)
+    o_phases = o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0
+    o_xs = o_Rs * numpy.cos(o_phases)
+    o_ys = o_Rs * numpy.sin(o_phases)
+
     def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.z(), o.vz(), o.phi()])
+        R0 = o.R()
+        op = Orbit(
+            numpy.array([R0, o.vR(), o.vT() - omega * R0, o.z(), o.vz(), o.phi()])
+        )
         op.integrate(ts, diskframepot, method=method)
         # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
         op_xs = op.x(ts)
         op_ys = op.y(ts)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-6)
@@ -441,25 +406,30 @@ def test_accellsrframe_vecfuncomegaz_2D():
     diskframepot = lp + framepot
 
     # Now integrate the orbit of the Sun in both the inertial and the lsr frame
+    # (the inertial-frame orbit does not depend on the method, so
+    # integrate it only once)
+    o = Orbit().toPlanar()
+    o.turn_physical_off()
+    ts = _TS
+    o.integrate(ts, diskpot)
+    o_Rs = o.R(ts)
+    o_phases = o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0
+    o_xs = o_Rs * numpy.cos(o_phases)
+    o_ys = o_Rs * numpy.sin(o_phases)
+
     def check_orbit(method="odeint", tol=1e-9):
-        o = Orbit().toPlanar()
-        o.turn_physical_off()
-        # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.phi()])
+        R0 = o.R()
+        op = Orbit([R0, o.vR(), o.vT() - omega * R0, o.phi()])
         op.integrate(ts, diskframepot, method=method)
         # Compare
-        o_xs = o.R(ts) * numpy.cos(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
-        o_ys = o.R(ts) * numpy.sin(o.phi(ts) - omega * ts - omegadot * ts**2.0 / 2.0)
         op_xs = op.x(ts)
         op_ys = op.y(ts)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in the acceleratingly-rotating LSR frame does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-6)
@@ -476,38 +446,36 @@ def test_arbitraryaxisrotation_nullpotential():
 
     def check_orbit(zvec=[1.0, 0.0, 1.0], omega=1.3, method="odeint", tol=1e-9):
         # Set up the rotating frame's rotation matrix
-        rotpot = potential.RotateAndTiltWrapperPotential(pot=np, zvec=zvec)
-        rot = rotpot._rot
+        rot = rot_for_zvec(tuple(zvec))
+        # and the corresponding angular frequency vector of the frame
+        Omega = numpy.array(derive_noninert_omega(omega, rot=rot))
         # Now integrate an orbit in the inertial frame
         # and then as seen by the rotating observer
-        o = Orbit([1.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+        o = Orbit(numpy.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0]))
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
+        ts = _TS
         o.integrate(ts, np, method=method)
         # Non-inertial frame
         # First compute initial condition
-        Rp, phip, zp = rotate_and_omega(
-            o.R(), o.z(), phi=o.phi(), t=0.0, rot=rot, omega=-omega
-        )
+        R0, z0, phi0 = o.R(), o.z(), o.phi()
+        Rp, phip, zp = rotate_and_omega(R0, z0, phi=phi0, t=0.0, rot=rot, omega=-omega)
         vRp, vTp, vzp = rotate_and_omega_vec(
             o.vR(),
             o.vT(),
             o.vz(),
-            o.R(),
-            o.z(),
-            phi=o.phi(),
+            R0,
+            z0,
+            phi=phi0,
             t=0.0,
             rot=rot,
             omega=-omega,
         )
-        op = Orbit([Rp, vRp, vTp, zp, vzp, phip])
+        op = Orbit(numpy.array([Rp, vRp, vTp, zp, vzp, phip]))
         op.integrate(
             ts,
             RotatingPotentialWrapperPotential(pot=np, rot=rot, omega=omega)
-            + potential.NonInertialFrameForce(
-                Omega=numpy.array(derive_noninert_omega(omega, rot=rot))
-            ),
+            + potential.NonInertialFrameForce(Omega=Omega),
             method=method,
         )
         # Compare
@@ -519,46 +487,38 @@ def test_arbitraryaxisrotation_nullpotential():
         o_vTs = o.vT(ts)
         o_vzs = o.vz(ts)
         # and that computed in the non-inertial frame converted back to inertial
-        op_xs, op_ys, op_zs = [], [], []
-        op_vRs, op_vTs, op_vzs = [], [], []
-        for ii, t in enumerate(ts):
-            xyz = rotate_and_omega(
-                op.x(t), op.y(t), phi=op.z(t), t=t, rot=rot, omega=omega, rect=True
-            )
-            op_xs.append(xyz[0])
-            op_ys.append(xyz[1])
-            op_zs.append(xyz[2])
-            vRTz = rotate_and_omega_vec(
-                op.vR(t),
-                op.vT(t),
-                op.vz(t),
-                op.R(t),
-                op.z(t),
-                phi=op.phi(t),
-                t=t,
-                rot=rot,
-                omega=omega,
-            )
-            op_vRs.append(vRTz[0])
-            op_vTs.append(vRTz[1])
-            op_vzs.append(vRTz[2])
+        op_zs = op.z(ts)
+        op_vRs, op_vTs, op_vzs = rotate_and_omega_vec(
+            op.vR(ts),
+            op.vT(ts),
+            op.vz(ts),
+            op.R(ts),
+            op_zs,
+            phi=op.phi(ts),
+            t=ts,
+            rot=rot,
+            omega=omega,
+        )
+        op_xs, op_ys, op_zs = rotate_and_omega(
+            op.x(ts), op.y(ts), phi=op_zs, t=ts, rot=rot, omega=omega, rect=True
+        )
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vRs - op_vRs)) < tol
+            max_abs_diff(o_vRs, op_vRs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vTs - op_vTs)) < tol
+            max_abs_diff(o_vTs, op_vTs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vzs - op_vzs)) < tol
+            max_abs_diff(o_vzs, op_vzs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(zvec=[0.0, 1.0, 1.0], omega=1.3, method="odeint", tol=1e-5)
@@ -569,47 +529,66 @@ def test_arbitraryaxisrotation_nullpotential():
     return None
 
 
-def test_arbitraryaxisrotation():
-    # Test that integrating an orbit in a frame rotating around an
-    # arbitrary axis works
+@pytest.fixture(scope="module")
+def bar_potentials():
+    # Disk and bar potentials shared by the arbitrary-axis, the
+    # accelerating-LSR linear-acceleration, and the Python vs. C tests, and
+    # their sum
     lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
     dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    return lp, dp, lp + dp
+
+
+@pytest.fixture(scope="module")
+def arbitraryaxis_reference_orbits(bar_potentials):
+    # Orbit in the inertial frame for each integration method, which is the
+    # reference for the arbitrary-axis rotation tests in the bar potential
+    lp, dp, diskpot = bar_potentials
+    ts = _TS
+    orbits = {}
+    for method in ["odeint", "dop853", "dop853_c"]:
+        o = Orbit()
+        o.turn_physical_off()
+        o.integrate(ts, diskpot, method=method)
+        orbits[method] = o
+    return ts, orbits
+
+
+def test_arbitraryaxisrotation(arbitraryaxis_reference_orbits, bar_potentials):
+    # Test that integrating an orbit in a frame rotating around an
+    # arbitrary axis works
+    lp, dp, diskpot = bar_potentials
+    ts, reference_orbits = arbitraryaxis_reference_orbits
 
     def check_orbit(zvec=[1.0, 0.0, 1.0], omega=1.3, method="odeint", tol=1e-9):
         # Set up the rotating frame's rotation matrix
-        rotpot = potential.RotateAndTiltWrapperPotential(pot=diskpot, zvec=zvec)
-        rot = rotpot._rot
+        rot = rot_for_zvec(tuple(zvec))
+        # and the corresponding angular frequency vector of the frame
+        Omega = numpy.array(derive_noninert_omega(omega, rot=rot))
         # Now integrate an orbit in the inertial frame
         # and then as seen by the rotating observer
-        o = Orbit()
-        o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot, method=method)
+        o = reference_orbits[method]
         # Non-inertial frame
         # First compute initial condition
-        Rp, phip, zp = rotate_and_omega(
-            o.R(), o.z(), phi=o.phi(), t=0.0, rot=rot, omega=-omega
-        )
+        R0, z0, phi0 = o.R(), o.z(), o.phi()
+        Rp, phip, zp = rotate_and_omega(R0, z0, phi=phi0, t=0.0, rot=rot, omega=-omega)
         vRp, vTp, vzp = rotate_and_omega_vec(
             o.vR(),
             o.vT(),
             o.vz(),
-            o.R(),
-            o.z(),
-            phi=o.phi(),
+            R0,
+            z0,
+            phi=phi0,
             t=0.0,
             rot=rot,
             omega=-omega,
         )
-        op = Orbit([Rp, vRp, vTp, zp, vzp, phip])
+        op = Orbit(numpy.array([Rp, vRp, vTp, zp, vzp, phip]))
         op.integrate(
             ts,
             RotatingPotentialWrapperPotential(pot=diskpot, rot=rot, omega=omega)
-            + potential.NonInertialFrameForce(
-                Omega=numpy.array(derive_noninert_omega(omega, rot=rot))
-            ),
+            + potential.NonInertialFrameForce(Omega=Omega),
             method=method,
         )
         # Compare
@@ -621,46 +600,38 @@ def test_arbitraryaxisrotation():
         o_vTs = o.vT(ts)
         o_vzs = o.vz(ts)
         # and that computed in the non-inertial frame converted back to inertial
-        op_xs, op_ys, op_zs = [], [], []
-        op_vRs, op_vTs, op_vzs = [], [], []
-        for ii, t in enumerate(ts):
-            xyz = rotate_and_omega(
-                op.x(t), op.y(t), phi=op.z(t), t=t, rot=rot, omega=omega, rect=True
-            )
-            op_xs.append(xyz[0])
-            op_ys.append(xyz[1])
-            op_zs.append(xyz[2])
-            vRTz = rotate_and_omega_vec(
-                op.vR(t),
-                op.vT(t),
-                op.vz(t),
-                op.R(t),
-                op.z(t),
-                phi=op.phi(t),
-                t=t,
-                rot=rot,
-                omega=omega,
-            )
-            op_vRs.append(vRTz[0])
-            op_vTs.append(vRTz[1])
-            op_vzs.append(vRTz[2])
+        op_zs = op.z(ts)
+        op_vRs, op_vTs, op_vzs = rotate_and_omega_vec(
+            op.vR(ts),
+            op.vT(ts),
+            op.vz(ts),
+            op.R(ts),
+            op_zs,
+            phi=op.phi(ts),
+            t=ts,
+            rot=rot,
+            omega=omega,
+        )
+        op_xs, op_ys, op_zs = rotate_and_omega(
+            op.x(ts), op.y(ts), phi=op_zs, t=ts, rot=rot, omega=omega, rect=True
+        )
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vRs - op_vRs)) < tol
+            max_abs_diff(o_vRs, op_vRs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vTs - op_vTs)) < tol
+            max_abs_diff(o_vTs, op_vTs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vzs - op_vzs)) < tol
+            max_abs_diff(o_vzs, op_vzs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(zvec=[0.0, 1.0, 1.0], omega=1.3, method="odeint", tol=1e-5)
@@ -682,32 +653,32 @@ def test_arbitraryaxisrotation_omegadot_nullpotential():
         zvec=[1.0, 0.0, 1.0], omega=1.3, omegadot=0.1, method="odeint", tol=1e-9
     ):
         # Set up the rotating frame's rotation matrix
-        rotpot = potential.RotateAndTiltWrapperPotential(pot=np, zvec=zvec)
-        rot = rotpot._rot
+        rot = rot_for_zvec(tuple(zvec))
+        # and the corresponding angular frequency vector of the frame
+        Omega = numpy.array(derive_noninert_omega(omega, rot=rot))
         # Now integrate an orbit in the inertial frame
         # and then as seen by the rotating observer
-        o = Orbit([1.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+        o = Orbit(numpy.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0]))
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
+        ts = _TS
         o.integrate(ts, np, method=method)
         # Non-inertial frame
         # First compute initial condition, no need to specify omegadot, bc t=0
-        Rp, phip, zp = rotate_and_omega(
-            o.R(), o.z(), phi=o.phi(), t=0.0, rot=rot, omega=-omega
-        )
+        R0, z0, phi0 = o.R(), o.z(), o.phi()
+        Rp, phip, zp = rotate_and_omega(R0, z0, phi=phi0, t=0.0, rot=rot, omega=-omega)
         vRp, vTp, vzp = rotate_and_omega_vec(
             o.vR(),
             o.vT(),
             o.vz(),
-            o.R(),
-            o.z(),
-            phi=o.phi(),
+            R0,
+            z0,
+            phi=phi0,
             t=0.0,
             rot=rot,
             omega=-omega,
         )
-        op = Orbit([Rp, vRp, vTp, zp, vzp, phip])
+        op = Orbit(numpy.array([Rp, vRp, vTp, zp, vzp, phip]))
         # Omegadot is just a scaled version of Omega
         op.integrate(
             ts,
@@ -715,10 +686,8 @@ def test_arbitraryaxisrotation_omegadot_nullpotential():
                 pot=np, rot=rot, omega=omega, omegadot=omegadot
             )
             + potential.NonInertialFrameForce(
-                Omega=numpy.array(derive_noninert_omega(omega, rot=rot)),
-                Omegadot=numpy.array(derive_noninert_omega(omega, rot=rot))
-                * omegadot
-                / omega,
+                Omega=Omega,
+                Omegadot=Omega * omegadot / omega,
             ),
             method=method,
         )
@@ -731,54 +700,46 @@ def test_arbitraryaxisrotation_omegadot_nullpotential():
         o_vTs = o.vT(ts)
         o_vzs = o.vz(ts)
         # and that computed in the non-inertial frame converted back to inertial
-        op_xs, op_ys, op_zs = [], [], []
-        op_vRs, op_vTs, op_vzs = [], [], []
-        for ii, t in enumerate(ts):
-            xyz = rotate_and_omega(
-                op.x(t),
-                op.y(t),
-                phi=op.z(t),
-                t=t,
-                rot=rot,
-                omega=omega,
-                omegadot=omegadot,
-                rect=True,
-            )
-            op_xs.append(xyz[0])
-            op_ys.append(xyz[1])
-            op_zs.append(xyz[2])
-            vRTz = rotate_and_omega_vec(
-                op.vR(t),
-                op.vT(t),
-                op.vz(t),
-                op.R(t),
-                op.z(t),
-                phi=op.phi(t),
-                t=t,
-                rot=rot,
-                omega=omega,
-                omegadot=omegadot,
-            )
-            op_vRs.append(vRTz[0])
-            op_vTs.append(vRTz[1])
-            op_vzs.append(vRTz[2])
+        op_zs = op.z(ts)
+        op_vRs, op_vTs, op_vzs = rotate_and_omega_vec(
+            op.vR(ts),
+            op.vT(ts),
+            op.vz(ts),
+            op.R(ts),
+            op_zs,
+            phi=op.phi(ts),
+            t=ts,
+            rot=rot,
+            omega=omega,
+            omegadot=omegadot,
+        )
+        op_xs, op_ys, op_zs = rotate_and_omega(
+            op.x(ts),
+            op.y(ts),
+            phi=op_zs,
+            t=ts,
+            rot=rot,
+            omega=omega,
+            omegadot=omegadot,
+            rect=True,
+        )
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vRs - op_vRs)) < tol
+            max_abs_diff(o_vRs, op_vRs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vTs - op_vTs)) < tol
+            max_abs_diff(o_vTs, op_vTs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vzs - op_vzs)) < tol
+            max_abs_diff(o_vzs, op_vzs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(zvec=[0.0, 1.0, 1.0], omega=1.3, method="odeint", tol=1e-5)
@@ -789,45 +750,41 @@ def test_arbitraryaxisrotation_omegadot_nullpotential():
     return None
 
 
-def test_arbitraryaxisrotation_omegadot():
+def test_arbitraryaxisrotation_omegadot(arbitraryaxis_reference_orbits, bar_potentials):
     # Test that integrating an orbit in a frame rotating around an
     # arbitrary axis works, where the frame rotation is changing in time
     # Start with a test where there is no potential, so a static
     # object should remain static
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot = bar_potentials
+    ts, reference_orbits = arbitraryaxis_reference_orbits
 
     def check_orbit(
         zvec=[1.0, 0.0, 1.0], omega=1.3, omegadot=0.03, method="odeint", tol=1e-9
     ):
         # Set up the rotating frame's rotation matrix
-        rotpot = potential.RotateAndTiltWrapperPotential(pot=diskpot, zvec=zvec)
-        rot = rotpot._rot
+        rot = rot_for_zvec(tuple(zvec))
+        # and the corresponding angular frequency vector of the frame
+        Omega = numpy.array(derive_noninert_omega(omega, rot=rot))
         # Now integrate an orbit in the inertial frame
         # and then as seen by the rotating observer
-        o = Orbit()
-        o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot, method=method)
+        o = reference_orbits[method]
         # Non-inertial frame
         # First compute initial condition, no need to specify omegadot, bc t=0
-        Rp, phip, zp = rotate_and_omega(
-            o.R(), o.z(), phi=o.phi(), t=0.0, rot=rot, omega=-omega
-        )
+        R0, z0, phi0 = o.R(), o.z(), o.phi()
+        Rp, phip, zp = rotate_and_omega(R0, z0, phi=phi0, t=0.0, rot=rot, omega=-omega)
         vRp, vTp, vzp = rotate_and_omega_vec(
             o.vR(),
             o.vT(),
             o.vz(),
-            o.R(),
-            o.z(),
-            phi=o.phi(),
+            R0,
+            z0,
+            phi=phi0,
             t=0.0,
             rot=rot,
             omega=-omega,
         )
-        op = Orbit([Rp, vRp, vTp, zp, vzp, phip])
+        op = Orbit(numpy.array([Rp, vRp, vTp, zp, vzp, phip]))
         # Omegadot is just a scaled version of Omega
         op.integrate(
             ts,
@@ -835,10 +792,8 @@ def test_arbitraryaxisrotation_omegadot():
                 pot=diskpot, rot=rot, omega=omega, omegadot=omegadot
             )
             + potential.NonInertialFrameForce(
-                Omega=numpy.array(derive_noninert_omega(omega, rot=rot)),
-                Omegadot=numpy.array(derive_noninert_omega(omega, rot=rot))
-                * omegadot
-                / omega,
+                Omega=Omega,
+                Omegadot=Omega * omegadot / omega,
             ),
             method=method,
         )
@@ -851,54 +806,46 @@ def test_arbitraryaxisrotation_omegadot():
         o_vTs = o.vT(ts)
         o_vzs = o.vz(ts)
         # and that computed in the non-inertial frame converted back to inertial
-        op_xs, op_ys, op_zs = [], [], []
-        op_vRs, op_vTs, op_vzs = [], [], []
-        for ii, t in enumerate(ts):
-            xyz = rotate_and_omega(
-                op.x(t),
-                op.y(t),
-                phi=op.z(t),
-                t=t,
-                rot=rot,
-                omega=omega,
-                omegadot=omegadot,
-                rect=True,
-            )
-            op_xs.append(xyz[0])
-            op_ys.append(xyz[1])
-            op_zs.append(xyz[2])
-            vRTz = rotate_and_omega_vec(
-                op.vR(t),
-                op.vT(t),
-                op.vz(t),
-                op.R(t),
-                op.z(t),
-                phi=op.phi(t),
-                t=t,
-                rot=rot,
-                omega=omega,
-                omegadot=omegadot,
-            )
-            op_vRs.append(vRTz[0])
-            op_vTs.append(vRTz[1])
-            op_vzs.append(vRTz[2])
+        op_zs = op.z(ts)
+        op_vRs, op_vTs, op_vzs = rotate_and_omega_vec(
+            op.vR(ts),
+            op.vT(ts),
+            op.vz(ts),
+            op.R(ts),
+            op_zs,
+            phi=op.phi(ts),
+            t=ts,
+            rot=rot,
+            omega=omega,
+            omegadot=omegadot,
+        )
+        op_xs, op_ys, op_zs = rotate_and_omega(
+            op.x(ts),
+            op.y(ts),
+            phi=op_zs,
+            t=ts,
+            rot=rot,
+            omega=omega,
+            omegadot=omegadot,
+            rect=True,
+        )
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vRs - op_vRs)) < tol
+            max_abs_diff(o_vRs, op_vRs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vTs - op_vTs)) < tol
+            max_abs_diff(o_vTs, op_vTs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vzs - op_vzs)) < tol
+            max_abs_diff(o_vzs, op_vzs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(zvec=[2.0, 0.0, 1.0], omega=-1.1, method="dop853", tol=1e-5)
@@ -921,38 +868,35 @@ def test_arbitraryaxisrotation_omegafunc_nullpotential():
         tol=1e-9,
     ):
         # Set up the rotating frame's rotation matrix
-        rotpot = potential.RotateAndTiltWrapperPotential(pot=np, zvec=zvec)
-        rot = rotpot._rot
+        rot = rot_for_zvec(tuple(zvec))
+        # and the corresponding angular frequency vector of the frame
+        Omega = numpy.array(derive_noninert_omega(omega, rot=rot))
         # Now integrate an orbit in the inertial frame
         # and then as seen by the rotating observer
-        o = Orbit([1.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+        o = Orbit(numpy.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0]))
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
+        ts = _TS
         o.integrate(ts, np, method=method)
         # Non-inertial frame
         # First compute initial condition, no need to specify omegadot, bc t=0
-        Rp, phip, zp = rotate_and_omega(
-            o.R(), o.z(), phi=o.phi(), t=0.0, rot=rot, omega=-omega
-        )
+        R0, z0, phi0 = o.R(), o.z(), o.phi()
+        Rp, phip, zp = rotate_and_omega(R0, z0, phi=phi0, t=0.0, rot=rot, omega=-omega)
         vRp, vTp, vzp = rotate_and_omega_vec(
             o.vR(),
             o.vT(),
             o.vz(),
-            o.R(),
-            o.z(),
-            phi=o.phi(),
+            R0,
+            z0,
+            phi=phi0,
             t=0.0,
             rot=rot,
             omega=-omega,
         )
-        op = Orbit([Rp, vRp, vTp, zp, vzp, phip])
+        op = Orbit(numpy.array([Rp, vRp, vTp, zp, vzp, phip]))
         # Omegadot is just a scaled version of Omega
-        Omega = numpy.array(derive_noninert_omega(omega, rot=rot))
-        Omegadot = numpy.array(derive_noninert_omega(omega, rot=rot)) * omegadot / omega
-        Omegadotdot = (
-            numpy.array(derive_noninert_omega(omega, rot=rot)) * omegadotdot / omega
-        )
+        Omegadot = Omega * omegadot / omega
+        Omegadotdot = Omega * omegadotdot / omega
         op.integrate(
             ts,
             RotatingPotentialWrapperPotential(
@@ -987,56 +931,48 @@ def test_arbitraryaxisrotation_omegafunc_nullpotential():
         o_vTs = o.vT(ts)
         o_vzs = o.vz(ts)
         # and that computed in the non-inertial frame converted back to inertial
-        op_xs, op_ys, op_zs = [], [], []
-        op_vRs, op_vTs, op_vzs = [], [], []
-        for ii, t in enumerate(ts):
-            xyz = rotate_and_omega(
-                op.x(t),
-                op.y(t),
-                phi=op.z(t),
-                t=t,
-                rot=rot,
-                omega=omega,
-                omegadot=omegadot,
-                omegadotdot=omegadotdot,
-                rect=True,
-            )
-            op_xs.append(xyz[0])
-            op_ys.append(xyz[1])
-            op_zs.append(xyz[2])
-            vRTz = rotate_and_omega_vec(
-                op.vR(t),
-                op.vT(t),
-                op.vz(t),
-                op.R(t),
-                op.z(t),
-                phi=op.phi(t),
-                t=t,
-                rot=rot,
-                omega=omega,
-                omegadot=omegadot,
-                omegadotdot=omegadotdot,
-            )
-            op_vRs.append(vRTz[0])
-            op_vTs.append(vRTz[1])
-            op_vzs.append(vRTz[2])
+        op_zs = op.z(ts)
+        op_vRs, op_vTs, op_vzs = rotate_and_omega_vec(
+            op.vR(ts),
+            op.vT(ts),
+            op.vz(ts),
+            op.R(ts),
+            op_zs,
+            phi=op.phi(ts),
+            t=ts,
+            rot=rot,
+            omega=omega,
+            omegadot=omegadot,
+            omegadotdot=omegadotdot,
+        )
+        op_xs, op_ys, op_zs = rotate_and_omega(
+            op.x(ts),
+            op.y(ts),
+            phi=op_zs,
+            t=ts,
+            rot=rot,
+            omega=omega,
+            omegadot=omegadot,
+            omegadotdot=omegadotdot,
+            rect=True,
+        )
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vRs - op_vRs)) < tol
+            max_abs_diff(o_vRs, op_vRs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vTs - op_vTs)) < tol
+            max_abs_diff(o_vTs, op_vTs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vzs - op_vzs)) < tol
+            max_abs_diff(o_vzs, op_vzs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(zvec=[0.0, 1.0, 1.0], omega=1.3, method="odeint", tol=1e-5)
@@ -1047,14 +983,15 @@ def test_arbitraryaxisrotation_omegafunc_nullpotential():
     return None
 
 
-def test_arbitraryaxisrotation_omegafunc():
+def test_arbitraryaxisrotation_omegafunc(
+    arbitraryaxis_reference_orbits, bar_potentials
+):
     # Test that integrating an orbit in a frame rotating around an
     # arbitrary axis works, where the frame rotation is changing in time
     # Start with a test where there is no potential, so a static
     # object should remain static
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot = bar_potentials
+    ts, reference_orbits = arbitraryaxis_reference_orbits
 
     def check_orbit(
         zvec=[1.0, 0.0, 1.0],
@@ -1065,38 +1002,32 @@ def test_arbitraryaxisrotation_omegafunc():
         tol=1e-9,
     ):
         # Set up the rotating frame's rotation matrix
-        rotpot = potential.RotateAndTiltWrapperPotential(pot=diskpot, zvec=zvec)
-        rot = rotpot._rot
+        rot = rot_for_zvec(tuple(zvec))
+        # and the corresponding angular frequency vector of the frame
+        Omega = numpy.array(derive_noninert_omega(omega, rot=rot))
         # Now integrate an orbit in the inertial frame
         # and then as seen by the rotating observer
-        o = Orbit()
-        o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot, method=method)
+        o = reference_orbits[method]
         # Non-inertial frame
         # First compute initial condition, no need to specify omegadot, bc t=0
-        Rp, phip, zp = rotate_and_omega(
-            o.R(), o.z(), phi=o.phi(), t=0.0, rot=rot, omega=-omega
-        )
+        R0, z0, phi0 = o.R(), o.z(), o.phi()
+        Rp, phip, zp = rotate_and_omega(R0, z0, phi=phi0, t=0.0, rot=rot, omega=-omega)
         vRp, vTp, vzp = rotate_and_omega_vec(
             o.vR(),
             o.vT(),
             o.vz(),
-            o.R(),
-            o.z(),
-            phi=o.phi(),
+            R0,
+            z0,
+            phi=phi0,
             t=0.0,
             rot=rot,
             omega=-omega,
         )
-        op = Orbit([Rp, vRp, vTp, zp, vzp, phip])
+        op = Orbit(numpy.array([Rp, vRp, vTp, zp, vzp, phip]))
         # Omegadot is just a scaled version of Omega
-        Omega = numpy.array(derive_noninert_omega(omega, rot=rot))
-        Omegadot = numpy.array(derive_noninert_omega(omega, rot=rot)) * omegadot / omega
-        Omegadotdot = (
-            numpy.array(derive_noninert_omega(omega, rot=rot)) * omegadotdot / omega
-        )
+        Omegadot = Omega * omegadot / omega
+        Omegadotdot = Omega * omegadotdot / omega
         op.integrate(
             ts,
             RotatingPotentialWrapperPotential(
@@ -1135,68 +1066,58 @@ def test_arbitraryaxisrotation_omegafunc():
         o_vTs = o.vT(ts)
         o_vzs = o.vz(ts)
         # and that computed in the non-inertial frame converted back to inertial
-        op_xs, op_ys, op_zs = [], [], []
-        op_vRs, op_vTs, op_vzs = [], [], []
-        for ii, t in enumerate(ts):
-            xyz = rotate_and_omega(
-                op.x(t),
-                op.y(t),
-                phi=op.z(t),
-                t=t,
-                rot=rot,
-                omega=omega,
-                omegadot=omegadot,
-                omegadotdot=omegadotdot,
-                rect=True,
-            )
-            op_xs.append(xyz[0])
-            op_ys.append(xyz[1])
-            op_zs.append(xyz[2])
-            vRTz = rotate_and_omega_vec(
-                op.vR(t),
-                op.vT(t),
-                op.vz(t),
-                op.R(t),
-                op.z(t),
-                phi=op.phi(t),
-                t=t,
-                rot=rot,
-                omega=omega,
-                omegadot=omegadot,
-                omegadotdot=omegadotdot,
-            )
-            op_vRs.append(vRTz[0])
-            op_vTs.append(vRTz[1])
-            op_vzs.append(vRTz[2])
+        op_zs = op.z(ts)
+        op_vRs, op_vTs, op_vzs = rotate_and_omega_vec(
+            op.vR(ts),
+            op.vT(ts),
+            op.vz(ts),
+            op.R(ts),
+            op_zs,
+            phi=op.phi(ts),
+            t=ts,
+            rot=rot,
+            omega=omega,
+            omegadot=omegadot,
+            omegadotdot=omegadotdot,
+        )
+        op_xs, op_ys, op_zs = rotate_and_omega(
+            op.x(ts),
+            op.y(ts),
+            phi=op_zs,
+            t=ts,
+            rot=rot,
+            omega=omega,
+            omegadot=omegadot,
+            omegadotdot=omegadotdot,
+            rect=True,
+        )
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vRs - op_vRs)) < tol
+            max_abs_diff(o_vRs, op_vRs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vTs - op_vTs)) < tol
+            max_abs_diff(o_vTs, op_vTs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vzs - op_vzs)) < tol
+            max_abs_diff(o_vzs, op_vzs) < tol
         ), f"Integrating an orbit in a rotating frame around an arbitrary axis does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(zvec=[2.0, 0.0, 1.0], omega=-1.1, method="dop853", tol=1e-5)
     return None
 
 
-def test_linacc_constantacc_z():
+def test_linacc_constantacc_z(disk_potentials):
     # Test that a linearly-accelerating frame along the z direction works
     # with a constant acceleration
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot, _ = disk_potentials
     az = 0.02
     # Trick to use a non-numba version, by causing numba compilation
     # to fail. Fails because scipy special is not supported in base
@@ -1214,11 +1135,14 @@ def test_linacc_constantacc_z():
         + framepot
     )
 
+    # The times and the frame's offsets are the same for all methods
+    ts = _TS
+    intaz_ts = intaz(ts)
+
     def check_orbit(method="odeint", tol=1e-9):
         o = Orbit()
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
         o.integrate(ts, diskpot, method=method)
         # Non-inertial frame
         op = o()
@@ -1229,15 +1153,15 @@ def test_linacc_constantacc_z():
         o_zs = o.z(ts)
         op_xs = op.x(ts)
         op_ys = op.y(ts)
-        op_zs = op.z(ts) + intaz(ts)
+        op_zs = op.z(ts) + intaz_ts
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-9)
@@ -1248,12 +1172,10 @@ def test_linacc_constantacc_z():
     return None
 
 
-def test_linacc_constantacc_x_2d():
+def test_linacc_constantacc_x_2d(disk_potentials):
     # Test that a linearly-accelerating frame along the x direction works
     # with a constant acceleration in 2D
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot, _ = disk_potentials
     ax = 0.02
     intax = lambda t: ax * t**2.0 / 2.0
     framepot = potential.NonInertialFrameForce(a0=[ax, 0.0, 0.0])
@@ -1264,11 +1186,14 @@ def test_linacc_constantacc_x_2d():
         + framepot
     )
 
+    # The times and the frame's offsets are the same for all methods
+    ts = _TS
+    intax_ts = intax(ts)
+
     def check_orbit(method="odeint", tol=1e-9):
         o = Orbit().toPlanar()
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
         o.integrate(ts, diskpot, method=method)
         # Non-inertial frame
         op = o()
@@ -1276,13 +1201,13 @@ def test_linacc_constantacc_x_2d():
         # Compare
         o_xs = o.x(ts)
         o_ys = o.y(ts)
-        op_xs = op.x(ts) + intax(ts)
+        op_xs = op.x(ts) + intax_ts
         op_ys = op.y(ts)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-5)
@@ -1293,12 +1218,10 @@ def test_linacc_constantacc_x_2d():
     return None
 
 
-def test_linacc_constantacc_xyz():
+def test_linacc_constantacc_xyz(disk_potentials):
     # Test that a linearly-accelerating frame along the z direction works
     # with a constant acceleration
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot, _ = disk_potentials
     ax, ay, az = -0.03, 0.04, 0.02
     inta = [
         lambda t: -0.03 * t**2.0 / 2.0,
@@ -1310,11 +1233,14 @@ def test_linacc_constantacc_xyz():
         AcceleratingPotentialWrapperPotential(pot=diskpot, x0=inta) + framepot
     )
 
+    # The times and the frame's offsets are the same for all methods
+    ts = _TS
+    inta_ts = [ia(ts) for ia in inta]
+
     def check_orbit(method="odeint", tol=1e-9):
         o = Orbit()
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
         o.integrate(ts, diskpot, method=method)
         # Non-inertial frame
         op = o()
@@ -1323,17 +1249,17 @@ def test_linacc_constantacc_xyz():
         o_xs = o.x(ts)
         o_ys = o.y(ts)
         o_zs = o.z(ts)
-        op_xs = op.x(ts) + inta[0](ts)
-        op_ys = op.y(ts) + inta[1](ts)
-        op_zs = op.z(ts) + inta[2](ts)
+        op_xs = op.x(ts) + inta_ts[0]
+        op_ys = op.y(ts) + inta_ts[1]
+        op_zs = op.z(ts) + inta_ts[2]
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-5)
@@ -1344,12 +1270,10 @@ def test_linacc_constantacc_xyz():
     return None
 
 
-def test_linacc_changingacc_z():
+def test_linacc_changingacc_z(disk_potentials):
     # Test that a linearly-accelerating frame along the z direction works
     # with a changing acceleration
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot, _ = disk_potentials
     az = lambda t: 0.02 + 0.03 * t / 20.0
     intaz = lambda t: 0.02 * t**2.0 / 2.0 + 0.03 * t**3.0 / 6.0 / 20.0
     framepot = potential.NonInertialFrameForce(a0=[lambda t: 0.0, lambda t: 0.0, az])
@@ -1360,11 +1284,14 @@ def test_linacc_changingacc_z():
         + framepot
     )
 
+    # The times and the frame's offsets are the same for all methods
+    ts = _TS
+    intaz_ts = intaz(ts)
+
     def check_orbit(method="odeint", tol=1e-9):
         o = Orbit()
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
         o.integrate(ts, diskpot, method=method)
         # Non-inertial frame
         op = o()
@@ -1375,15 +1302,15 @@ def test_linacc_changingacc_z():
         o_zs = o.z(ts)
         op_xs = op.x(ts)
         op_ys = op.y(ts)
-        op_zs = op.z(ts) + intaz(ts)
+        op_zs = op.z(ts) + intaz_ts
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-9)
@@ -1394,12 +1321,10 @@ def test_linacc_changingacc_z():
     return None
 
 
-def test_linacc_changingacc_xyz():
+def test_linacc_changingacc_xyz(disk_potentials):
     # Test that a linearly-accelerating frame along the z direction works
     # with a changing acceleration
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot, _ = disk_potentials
     ax, ay, az = (
         lambda t: -0.03 - 0.03 * t / 20.0,
         lambda t: 0.04 + 0.08 * t / 20.0,
@@ -1415,11 +1340,14 @@ def test_linacc_changingacc_xyz():
         AcceleratingPotentialWrapperPotential(pot=diskpot, x0=inta) + framepot
     )
 
+    # The times and the frame's offsets are the same for all methods
+    ts = _TS
+    inta_ts = [ia(ts) for ia in inta]
+
     def check_orbit(method="odeint", tol=1e-9):
         o = Orbit()
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
         o.integrate(ts, diskpot, method=method)
         # Non-inertial frame
         op = o()
@@ -1428,17 +1356,17 @@ def test_linacc_changingacc_xyz():
         o_xs = o.x(ts)
         o_ys = o.y(ts)
         o_zs = o.z(ts)
-        op_xs = op.x(ts) + inta[0](ts)
-        op_ys = op.y(ts) + inta[1](ts)
-        op_zs = op.z(ts) + inta[2](ts)
+        op_xs = op.x(ts) + inta_ts[0]
+        op_ys = op.y(ts) + inta_ts[1]
+        op_zs = op.z(ts) + inta_ts[2]
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a linearly-accelerating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-5)
@@ -1449,13 +1377,11 @@ def test_linacc_changingacc_xyz():
     return None
 
 
-def test_linacc_changingacc_xyz_accellsrframe_scalaromegaz():
+def test_linacc_changingacc_xyz_accellsrframe_scalaromegaz(bar_potentials):
     # Test that a linearly-accelerating frame along the z direction works
     # with a changing acceleration, also combining it with changing
-    # rotation around the z axis
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    # rotation around the z axis
+    lp, dp, diskpot = bar_potentials
     x0 = [
         lambda t: -0.03 * t**2.0 / 2.0 - 0.03 * t**3.0 / 6.0 / 20.0,
         lambda t: 0.04 * t**2.0 / 2.0 + 0.08 * t**3.0 / 6.0 / 20.0,
@@ -1483,14 +1409,22 @@ def test_linacc_changingacc_xyz_accellsrframe_scalaromegaz():
         + framepot
     )
 
+    # The times and the frame's offsets and velocities are the same for all
+    # methods
+    ts = _TS
+    x0_ts = [x(ts) for x in x0]
+    v0_ts = [v(ts) for v in v0]
+
     def check_orbit(method="odeint", tol=1e-9):
         o = Orbit()
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
         o.integrate(ts, diskpot, method=method)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.z(), o.vz(), o.phi()])
+        R0 = o.R()
+        op = Orbit(
+            numpy.array([R0, o.vR(), o.vT() - omega * R0, o.z(), o.vz(), o.phi()])
+        )
         op.integrate(ts, diskframepot, method=method)
         # Compare
         o_xs = o.x(ts)
@@ -1499,42 +1433,37 @@ def test_linacc_changingacc_xyz_accellsrframe_scalaromegaz():
         o_vxs = o.vx(ts)
         o_vys = o.vy(ts)
         o_vzs = o.vz(ts)
-        op_xs = op.x(ts) + x0[0](ts)
-        op_ys = op.y(ts) + x0[1](ts)
-        op_zs = op.z(ts) + x0[2](ts)
+        op_xs = op.x(ts) + x0_ts[0]
+        op_ys = op.y(ts) + x0_ts[1]
+        op_zs = op.z(ts) + x0_ts[2]
+        op_vxs = op.vx(ts) + v0_ts[0]
+        op_vys = op.vy(ts) + v0_ts[1]
+        op_vzs = op.vz(ts) + v0_ts[2]
         Rp, phip, _ = coords.rect_to_cyl(op_xs, op_ys, op_zs)
-        phip += omega * ts + omegadot * ts**2.0 / 2.0
-        op_xs, op_ys, _ = coords.cyl_to_rect(Rp, phip, op_zs)
-        op_vxs = op.vx(ts) + v0[0](ts)
-        op_vys = op.vy(ts) + v0[1](ts)
-        op_vzs = op.vz(ts) + v0[2](ts)
         vRp, vTp, _ = coords.rect_to_cyl_vec(
-            op_vxs,
-            op_vys,
-            op_vzs,
-            op.x(ts) + x0[0](ts),
-            op.y(ts) + x0[1](ts),
-            op.z(ts) + x0[2](ts),
+            op_vxs, op_vys, op_vzs, op_xs, op_ys, op_zs
         )
+        phip += omega * ts + omegadot * ts**2.0 / 2.0
+        op_xs, op_ys, _ = coords.cyl_to_rect(Rp, phip, op_zs)
         vTp += omega * Rp + omegadot * ts * Rp
         op_vxs, op_vys, _ = coords.cyl_to_rect_vec(vRp, vTp, op_vzs, phi=phip)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vxs - op_vxs)) < tol
+            max_abs_diff(o_vxs, op_vxs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vys - op_vys)) < tol
+            max_abs_diff(o_vys, op_vys) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vzs - op_vzs)) < tol
+            max_abs_diff(o_vzs, op_vzs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-5)
@@ -1545,13 +1474,11 @@ def test_linacc_changingacc_xyz_accellsrframe_scalaromegaz():
     return None
 
 
-def test_linacc_changingacc_xyz_accellsrframe_vecomegaz():
+def test_linacc_changingacc_xyz_accellsrframe_vecomegaz(bar_potentials):
     # Test that a linearly-accelerating frame along the z direction works
     # with a changing acceleration, also combining it with changing
     # rotation around the z axis
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot = bar_potentials
     x0 = [
         lambda t: -0.03 * t**2.0 / 2.0 - 0.03 * t**3.0 / 6.0 / 20.0,
         lambda t: 0.04 * t**2.0 / 2.0 + 0.08 * t**3.0 / 6.0 / 20.0,
@@ -1583,14 +1510,22 @@ def test_linacc_changingacc_xyz_accellsrframe_vecomegaz():
         + framepot
     )
 
+    # The times and the frame's offsets and velocities are the same for all
+    # methods
+    ts = _TS
+    x0_ts = [x(ts) for x in x0]
+    v0_ts = [v(ts) for v in v0]
+
     def check_orbit(method="odeint", tol=1e-9):
         o = Orbit()
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
         o.integrate(ts, diskpot, method=method)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.z(), o.vz(), o.phi()])
+        R0 = o.R()
+        op = Orbit(
+            numpy.array([R0, o.vR(), o.vT() - omega * R0, o.z(), o.vz(), o.phi()])
+        )
         op.integrate(ts, diskframepot, method=method)
         # Compare
         o_xs = o.x(ts)
@@ -1599,42 +1534,37 @@ def test_linacc_changingacc_xyz_accellsrframe_vecomegaz():
         o_vxs = o.vx(ts)
         o_vys = o.vy(ts)
         o_vzs = o.vz(ts)
-        op_xs = op.x(ts) + x0[0](ts)
-        op_ys = op.y(ts) + x0[1](ts)
-        op_zs = op.z(ts) + x0[2](ts)
+        op_xs = op.x(ts) + x0_ts[0]
+        op_ys = op.y(ts) + x0_ts[1]
+        op_zs = op.z(ts) + x0_ts[2]
+        op_vxs = op.vx(ts) + v0_ts[0]
+        op_vys = op.vy(ts) + v0_ts[1]
+        op_vzs = op.vz(ts) + v0_ts[2]
         Rp, phip, _ = coords.rect_to_cyl(op_xs, op_ys, op_zs)
-        phip += omega * ts + omegadot * ts**2.0 / 2.0
-        op_xs, op_ys, _ = coords.cyl_to_rect(Rp, phip, op_zs)
-        op_vxs = op.vx(ts) + v0[0](ts)
-        op_vys = op.vy(ts) + v0[1](ts)
-        op_vzs = op.vz(ts) + v0[2](ts)
         vRp, vTp, _ = coords.rect_to_cyl_vec(
-            op_vxs,
-            op_vys,
-            op_vzs,
-            op.x(ts) + x0[0](ts),
-            op.y(ts) + x0[1](ts),
-            op.z(ts) + x0[2](ts),
+            op_vxs, op_vys, op_vzs, op_xs, op_ys, op_zs
         )
+        phip += omega * ts + omegadot * ts**2.0 / 2.0
+        op_xs, op_ys, _ = coords.cyl_to_rect(Rp, phip, op_zs)
         vTp += omega * Rp + omegadot * ts * Rp
         op_vxs, op_vys, _ = coords.cyl_to_rect_vec(vRp, vTp, op_vzs, phi=phip)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vxs - op_vxs)) < tol
+            max_abs_diff(o_vxs, op_vxs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vys - op_vys)) < tol
+            max_abs_diff(o_vys, op_vys) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vzs - op_vzs)) < tol
+            max_abs_diff(o_vzs, op_vzs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-5)
@@ -1645,13 +1575,11 @@ def test_linacc_changingacc_xyz_accellsrframe_vecomegaz():
     return None
 
 
-def test_linacc_changingacc_xyz_accellsrframe_scalarfuncomegaz():
+def test_linacc_changingacc_xyz_accellsrframe_scalarfuncomegaz(bar_potentials):
     # Test that a linearly-accelerating frame along the z direction works
     # with a changing acceleration, also combining it with changing
     # rotation around the z axis
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot = bar_potentials
     x0 = [
         lambda t: -0.03 * t**2.0 / 2.0 - 0.03 * t**3.0 / 6.0 / 20.0,
         lambda t: 0.04 * t**2.0 / 2.0 + 0.08 * t**3.0 / 6.0 / 20.0,
@@ -1686,14 +1614,22 @@ def test_linacc_changingacc_xyz_accellsrframe_scalarfuncomegaz():
         + framepot
     )
 
+    # The times and the frame's offsets and velocities are the same for all
+    # methods
+    ts = _TS
+    x0_ts = [x(ts) for x in x0]
+    v0_ts = [v(ts) for v in v0]
+
     def check_orbit(method="odeint", tol=1e-9):
         o = Orbit()
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
         o.integrate(ts, diskpot, method=method)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.z(), o.vz(), o.phi()])
+        R0 = o.R()
+        op = Orbit(
+            numpy.array([R0, o.vR(), o.vT() - omega * R0, o.z(), o.vz(), o.phi()])
+        )
         op.integrate(ts, diskframepot, method=method)
         # Compare
         o_xs = o.x(ts)
@@ -1702,42 +1638,37 @@ def test_linacc_changingacc_xyz_accellsrframe_scalarfuncomegaz():
         o_vxs = o.vx(ts)
         o_vys = o.vy(ts)
         o_vzs = o.vz(ts)
-        op_xs = op.x(ts) + x0[0](ts)
-        op_ys = op.y(ts) + x0[1](ts)
-        op_zs = op.z(ts) + x0[2](ts)
+        op_xs = op.x(ts) + x0_ts[0]
+        op_ys = op.y(ts) + x0_ts[1]
+        op_zs = op.z(ts) + x0_ts[2]
+        op_vxs = op.vx(ts) + v0_ts[0]
+        op_vys = op.vy(ts) + v0_ts[1]
+        op_vzs = op.vz(ts) + v0_ts[2]
         Rp, phip, _ = coords.rect_to_cyl(op_xs, op_ys, op_zs)
-        phip += omega * ts + omegadot * ts**2.0 / 2.0 + omegadotdot * ts**3.0 / 6.0
-        op_xs, op_ys, _ = coords.cyl_to_rect(Rp, phip, op_zs)
-        op_vxs = op.vx(ts) + v0[0](ts)
-        op_vys = op.vy(ts) + v0[1](ts)
-        op_vzs = op.vz(ts) + v0[2](ts)
         vRp, vTp, _ = coords.rect_to_cyl_vec(
-            op_vxs,
-            op_vys,
-            op_vzs,
-            op.x(ts) + x0[0](ts),
-            op.y(ts) + x0[1](ts),
-            op.z(ts) + x0[2](ts),
+            op_vxs, op_vys, op_vzs, op_xs, op_ys, op_zs
         )
+        phip += omega * ts + omegadot * ts**2.0 / 2.0 + omegadotdot * ts**3.0 / 6.0
+        op_xs, op_ys, _ = coords.cyl_to_rect(Rp, phip, op_zs)
         vTp += omega * Rp + omegadot * ts * Rp + omegadotdot * ts**2.0 / 2.0 * Rp
         op_vxs, op_vys, _ = coords.cyl_to_rect_vec(vRp, vTp, op_vzs, phi=phip)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vxs - op_vxs)) < tol
+            max_abs_diff(o_vxs, op_vxs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vys - op_vys)) < tol
+            max_abs_diff(o_vys, op_vys) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vzs - op_vzs)) < tol
+            max_abs_diff(o_vzs, op_vzs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-5)
@@ -1748,13 +1679,11 @@ def test_linacc_changingacc_xyz_accellsrframe_scalarfuncomegaz():
     return None
 
 
-def test_linacc_changingacc_xyz_accellsrframe_funcomegaz():
+def test_linacc_changingacc_xyz_accellsrframe_funcomegaz(bar_potentials):
     # Test that a linearly-accelerating frame along the z direction works
     # with a changing acceleration, also combining it with changing
     # rotation around the z axis
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot = bar_potentials
     x0 = [
         lambda t: -0.03 * t**2.0 / 2.0 - 0.03 * t**3.0 / 6.0 / 20.0,
         lambda t: 0.04 * t**2.0 / 2.0 + 0.08 * t**3.0 / 6.0 / 20.0,
@@ -1793,14 +1722,22 @@ def test_linacc_changingacc_xyz_accellsrframe_funcomegaz():
         + framepot
     )
 
+    # The times and the frame's offsets and velocities are the same for all
+    # methods
+    ts = _TS
+    x0_ts = [x(ts) for x in x0]
+    v0_ts = [v(ts) for v in v0]
+
     def check_orbit(method="odeint", tol=1e-9):
         o = Orbit()
         o.turn_physical_off()
         # Inertial frame
-        ts = numpy.linspace(0.0, 20.0, 1001)
         o.integrate(ts, diskpot, method=method)
         # Non-inertial frame
-        op = Orbit([o.R(), o.vR(), o.vT() - omega * o.R(), o.z(), o.vz(), o.phi()])
+        R0 = o.R()
+        op = Orbit(
+            numpy.array([R0, o.vR(), o.vT() - omega * R0, o.z(), o.vz(), o.phi()])
+        )
         op.integrate(ts, diskframepot, method=method)
         # Compare
         o_xs = o.x(ts)
@@ -1809,42 +1746,37 @@ def test_linacc_changingacc_xyz_accellsrframe_funcomegaz():
         o_vxs = o.vx(ts)
         o_vys = o.vy(ts)
         o_vzs = o.vz(ts)
-        op_xs = op.x(ts) + x0[0](ts)
-        op_ys = op.y(ts) + x0[1](ts)
-        op_zs = op.z(ts) + x0[2](ts)
+        op_xs = op.x(ts) + x0_ts[0]
+        op_ys = op.y(ts) + x0_ts[1]
+        op_zs = op.z(ts) + x0_ts[2]
+        op_vxs = op.vx(ts) + v0_ts[0]
+        op_vys = op.vy(ts) + v0_ts[1]
+        op_vzs = op.vz(ts) + v0_ts[2]
         Rp, phip, _ = coords.rect_to_cyl(op_xs, op_ys, op_zs)
-        phip += omega * ts + omegadot * ts**2.0 / 2.0 + omegadotdot * ts**3.0 / 6.0
-        op_xs, op_ys, _ = coords.cyl_to_rect(Rp, phip, op_zs)
-        op_vxs = op.vx(ts) + v0[0](ts)
-        op_vys = op.vy(ts) + v0[1](ts)
-        op_vzs = op.vz(ts) + v0[2](ts)
         vRp, vTp, _ = coords.rect_to_cyl_vec(
-            op_vxs,
-            op_vys,
-            op_vzs,
-            op.x(ts) + x0[0](ts),
-            op.y(ts) + x0[1](ts),
-            op.z(ts) + x0[2](ts),
+            op_vxs, op_vys, op_vzs, op_xs, op_ys, op_zs
         )
+        phip += omega * ts + omegadot * ts**2.0 / 2.0 + omegadotdot * ts**3.0 / 6.0
+        op_xs, op_ys, _ = coords.cyl_to_rect(Rp, phip, op_zs)
         vTp += omega * Rp + omegadot * ts * Rp + omegadotdot * ts**2.0 / 2.0 * Rp
         op_vxs, op_vys, _ = coords.cyl_to_rect_vec(vRp, vTp, op_vzs, phi=phip)
         assert (
-            numpy.amax(numpy.fabs(o_xs - op_xs)) < tol
+            max_abs_diff(o_xs, op_xs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_ys - op_ys)) < tol
+            max_abs_diff(o_ys, op_ys) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_zs - op_zs)) < tol
+            max_abs_diff(o_zs, op_zs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vxs - op_vxs)) < tol
+            max_abs_diff(o_vxs, op_vxs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vys - op_vys)) < tol
+            max_abs_diff(o_vys, op_vys) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
         assert (
-            numpy.amax(numpy.fabs(o_vzs - op_vzs)) < tol
+            max_abs_diff(o_vzs, op_vzs) < tol
         ), f"Integrating an orbit in a linearly-accelerating, acceleratingly-rotating frame with constant acceleration does not agree with the equivalent orbit in the inertial frame for method {method}"
 
     check_orbit(method="odeint", tol=1e-5)
@@ -1855,250 +1787,76 @@ def test_linacc_changingacc_xyz_accellsrframe_funcomegaz():
     return None
 
 
-def test_python_vs_c_arbitraryaxisrotation():
-    # Integrate an orbit in both Python and C to check that they match
-    # We don't need to known the true answer here
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
-
-    def check_orbit(
-        zvec=[1.0, 0.0, 1.0],
-        omega=1.3,
-        py_method="dop853",
-        c_method="dop853_c",
-        tol=1e-9,
-    ):
-        # Set up the rotating frame's rotation matrix
-        rotpot = potential.RotateAndTiltWrapperPotential(pot=diskpot, zvec=zvec)
-        rot = rotpot._rot
-        # Now integrate an orbit in the rotating frame in Python
-        o = Orbit()
-        o.turn_physical_off()
-        # Rotating frame in Python
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(
-            ts,
-            diskpot
-            + potential.NonInertialFrameForce(
-                Omega=numpy.array(derive_noninert_omega(omega, rot=rot))
-            ),
-            method=py_method,
-        )
-        # In C
-        op = o()
-        op.integrate(
-            ts,
-            diskpot
-            + potential.NonInertialFrameForce(
-                Omega=numpy.array(derive_noninert_omega(omega, rot=rot))
-            ),
-            method=c_method,
-        )
-        assert (
-            numpy.amax(numpy.fabs(o.x(ts) - op.x(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.y(ts) - op.y(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.z(ts) - op.z(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.vx(ts) - op.vx(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.vy(ts) - op.vy(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.vz(ts) - op.vz(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        return None
-
-    check_orbit()
-    return None
-
-
-def test_python_vs_c_arbitraryaxisrotation_omegadot():
-    # Integrate an orbit in both Python and C to check that they match
-    # We don't need to known the true answer here
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
-
-    def check_orbit(
-        zvec=[1.0, 0.0, 1.0],
-        omega=1.3,
-        omegadot=0.03,
-        py_method="dop853",
-        c_method="dop853_c",
-        tol=1e-9,
-    ):
-        # Set up the rotating frame's rotation matrix
-        rotpot = potential.RotateAndTiltWrapperPotential(pot=diskpot, zvec=zvec)
-        rot = rotpot._rot
-        # Now integrate an orbit in the rotating frame in Python
-        o = Orbit()
-        o.turn_physical_off()
-        # Rotating frame in Python
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(
-            ts,
-            diskpot
-            + potential.NonInertialFrameForce(
-                Omega=numpy.array(derive_noninert_omega(omega, rot=rot)),
-                Omegadot=numpy.array(derive_noninert_omega(omega, rot=rot))
-                * omegadot
-                / omega,
-            ),
-            method=py_method,
-        )
-        # In C
-        op = o()
-        op.integrate(
-            ts,
-            diskpot
-            + potential.NonInertialFrameForce(
-                Omega=numpy.array(derive_noninert_omega(omega, rot=rot)),
-                Omegadot=numpy.array(derive_noninert_omega(omega, rot=rot))
-                * omegadot
-                / omega,
-            ),
-            method=c_method,
-        )
-        # Compare
-        assert (
-            numpy.amax(numpy.fabs(o.x(ts) - op.x(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.y(ts) - op.y(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.z(ts) - op.z(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.vx(ts) - op.vx(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.vy(ts) - op.vy(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.vz(ts) - op.vz(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        return None
-
-    check_orbit(tol=1e-8)
-    return None
-
-
-def test_python_vs_c_arbitraryaxisrotation_funcomega():
-    # Integrate an orbit in both Python and C to check that they match
+@pytest.mark.parametrize(
+    "frame,tol", [("constant", 1e-9), ("omegadot", 1e-8), ("omegafunc", 1e-8)]
+)
+def test_python_vs_c_arbitraryaxisrotation(frame, tol, bar_potentials):
+    # Integrate an orbit in both Python and C to check that they match, for a
+    # frame rotating around an arbitrary axis at a constant rate, at a
+    # constantly changing rate, or at a rate given by a function of time
     # We don't need to known the true answer here
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
-
-    def check_orbit(
-        zvec=[1.0, 0.0, 1.0],
-        omega=1.3,
-        omegadot=0.03,
-        omegadotdot=0.01,
-        py_method="dop853",
-        c_method="dop853_c",
-        tol=1e-9,
-    ):
-        # Set up the rotating frame's rotation matrix
-        rotpot = potential.RotateAndTiltWrapperPotential(pot=diskpot, zvec=zvec)
-        rot = rotpot._rot
-        # Now integrate an orbit in the rotating frame in Python
-        o = Orbit()
-        o.turn_physical_off()
-        # Rotating frame in Python
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        Omega = numpy.array(derive_noninert_omega(omega, rot=rot))
-        Omegadot = numpy.array(derive_noninert_omega(omega, rot=rot)) * omegadot / omega
-        Omegadotdot = (
-            numpy.array(derive_noninert_omega(omega, rot=rot)) * omegadotdot / omega
-        )
-        o.integrate(
-            ts,
-            diskpot
-            + potential.NonInertialFrameForce(
-                Omega=[
-                    lambda t: Omega[0]
-                    + Omegadot[0] * t
-                    + Omegadotdot[0] * t**2.0 / 2.0,
-                    lambda t: Omega[1]
-                    + Omegadot[1] * t
-                    + Omegadotdot[1] * t**2.0 / 2.0,
-                    lambda t: Omega[2]
-                    + Omegadot[2] * t
-                    + Omegadotdot[2] * t**2.0 / 2.0,
-                ],
-                Omegadot=[
-                    lambda t: Omegadot[0] + Omegadotdot[0] * t,
-                    lambda t: Omegadot[1] + Omegadotdot[1] * t,
-                    lambda t: Omegadot[2] + Omegadotdot[2] * t,
-                ],
-            ),
-            method=py_method,
+    lp, dp, diskpot = bar_potentials
+    zvec, omega, omegadot, omegadotdot = [1.0, 0.0, 1.0], 1.3, 0.03, 0.01
+    py_method, c_method = "dop853", "dop853_c"
+    # Set up the rotating frame's rotation matrix
+    rot = rot_for_zvec(tuple(zvec))
+    # and the corresponding angular frequency vector of the frame
+    Omega = numpy.array(derive_noninert_omega(omega, rot=rot))
+    Omegadot = Omega * omegadot / omega
+    Omegadotdot = Omega * omegadotdot / omega
+    if frame == "constant":
+        framepot = diskpot + potential.NonInertialFrameForce(Omega=Omega)
+    elif frame == "omegadot":
+        framepot = diskpot + potential.NonInertialFrameForce(
+            Omega=Omega, Omegadot=Omegadot
         )
-        # In C
-        op = o()
-        op.integrate(
-            ts,
-            diskpot
-            + potential.NonInertialFrameForce(
-                Omega=[
-                    lambda t: Omega[0]
-                    + Omegadot[0] * t
-                    + Omegadotdot[0] * t**2.0 / 2.0,
-                    lambda t: Omega[1]
-                    + Omegadot[1] * t
-                    + Omegadotdot[1] * t**2.0 / 2.0,
-                    lambda t: Omega[2]
-                    + Omegadot[2] * t
-                    + Omegadotdot[2] * t**2.0 / 2.0,
-                ],
-                Omegadot=[
-                    lambda t: Omegadot[0] + Omegadotdot[0] * t,
-                    lambda t: Omegadot[1] + Omegadotdot[1] * t,
-                    lambda t: Omegadot[2] + Omegadotdot[2] * t,
-                ],
-            ),
-            method=c_method,
+    else:
+        framepot = diskpot + potential.NonInertialFrameForce(
+            Omega=[
+                lambda t: Omega[0] + Omegadot[0] * t + Omegadotdot[0] * t**2.0 / 2.0,
+                lambda t: Omega[1] + Omegadot[1] * t + Omegadotdot[1] * t**2.0 / 2.0,
+                lambda t: Omega[2] + Omegadot[2] * t + Omegadotdot[2] * t**2.0 / 2.0,
+            ],
+            Omegadot=[
+                lambda t: Omegadot[0] + Omegadotdot[0] * t,
+                lambda t: Omegadot[1] + Omegadotdot[1] * t,
+                lambda t: Omegadot[2] + Omegadotdot[2] * t,
+            ],
         )
-        # Compare
-        assert (
-            numpy.amax(numpy.fabs(o.x(ts) - op.x(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.y(ts) - op.y(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.z(ts) - op.z(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.vx(ts) - op.vx(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.vy(ts) - op.vy(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        assert (
-            numpy.amax(numpy.fabs(o.vz(ts) - op.vz(ts))) < tol
-        ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
-        return None
-
-    check_orbit(tol=1e-8)
+    # Now integrate an orbit in the rotating frame in Python
+    o = Orbit()
+    o.turn_physical_off()
+    ts = _TS
+    o.integrate(ts, framepot, method=py_method)
+    # In C
+    op = o()
+    op.integrate(ts, framepot, method=c_method)
+    # Compare
+    assert (
+        max_abs_diff(o.x(ts), op.x(ts)) < tol
+    ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
+    assert (
+        max_abs_diff(o.y(ts), op.y(ts)) < tol
+    ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
+    assert (
+        max_abs_diff(o.z(ts), op.z(ts)) < tol
+    ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
+    assert (
+        max_abs_diff(o.vx(ts), op.vx(ts)) < tol
+    ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
+    assert (
+        max_abs_diff(o.vy(ts), op.vy(ts)) < tol
+    ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
+    assert (
+        max_abs_diff(o.vz(ts), op.vz(ts)) < tol
+    ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
     return None
 
 
-def test_python_vs_c_linacc_changingacc_xyz():
+def test_python_vs_c_linacc_changingacc_xyz(disk_potentials):
     # Integrate an orbit in both Python and C to check that they match
     # We don't need to known the true answer here
-    lp = potential.LogarithmicHaloPotential(normalize=1.0)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot, _ = disk_potentials
     ax, ay, az = (
         lambda t: -0.03 - 0.03 * t / 20.0,
         lambda t: 0.04 + 0.08 * t / 20.0,
@@ -2110,34 +1868,35 @@ def test_python_vs_c_linacc_changingacc_xyz():
         lambda t: 0.02 * t**2.0 / 2.0 + 0.03 * t**3.0 / 6.0 / 20.0,
     ]
     framepot = potential.NonInertialFrameForce(a0=[ax, ay, az])
+    diskframepot = diskpot + framepot
 
     def check_orbit(py_method="dop853", c_method="dop853_c", tol=1e-9):
         o = Orbit()
         o.turn_physical_off()
         # In Python
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot + framepot, method=py_method)
+        ts = _TS
+        o.integrate(ts, diskframepot, method=py_method)
         # In C
         op = o()
-        op.integrate(ts, diskpot + framepot, method=c_method)
+        op.integrate(ts, diskframepot, method=c_method)
         # Compare
         assert (
-            numpy.amax(numpy.fabs(o.x(ts) - op.x(ts))) < tol
+            max_abs_diff(o.x(ts), op.x(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.y(ts) - op.y(ts))) < tol
+            max_abs_diff(o.y(ts), op.y(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.z(ts) - op.z(ts))) < tol
+            max_abs_diff(o.z(ts), op.z(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vx(ts) - op.vx(ts))) < tol
+            max_abs_diff(o.vx(ts), op.vx(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vy(ts) - op.vy(ts))) < tol
+            max_abs_diff(o.vy(ts), op.vy(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vz(ts) - op.vz(ts))) < tol
+            max_abs_diff(o.vz(ts), op.vz(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         return None
 
@@ -2145,12 +1904,10 @@ def test_python_vs_c_linacc_changingacc_xyz():
     return None
 
 
-def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalaromegaz():
+def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalaromegaz(bar_potentials):
     # Integrate an orbit in both Python and C to check that they match
     # We don't need to known the true answer here
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot = bar_potentials
     x0 = [
         lambda t: -0.03 * t**2.0 / 2.0 - 0.03 * t**3.0 / 6.0 / 20.0,
         lambda t: 0.04 * t**2.0 / 2.0 + 0.08 * t**3.0 / 6.0 / 20.0,
@@ -2171,34 +1928,35 @@ def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalaromegaz():
     framepot = potential.NonInertialFrameForce(
         x0=x0, v0=v0, a0=a0, Omega=omega, Omegadot=omegadot
     )
+    diskframepot = diskpot + framepot
 
     def check_orbit(py_method="dop853", c_method="dop853_c", tol=1e-9):
         # Now integrate an orbit in the rotating frame in Python
         o = Orbit()
         o.turn_physical_off()
         # Rotating frame in Python
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot + framepot, method=py_method)
+        ts = _TS
+        o.integrate(ts, diskframepot, method=py_method)
         # In C
         op = o()
-        op.integrate(ts, diskpot + framepot, method=c_method)
+        op.integrate(ts, diskframepot, method=c_method)
         assert (
-            numpy.amax(numpy.fabs(o.x(ts) - op.x(ts))) < tol
+            max_abs_diff(o.x(ts), op.x(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.y(ts) - op.y(ts))) < tol
+            max_abs_diff(o.y(ts), op.y(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.z(ts) - op.z(ts))) < tol
+            max_abs_diff(o.z(ts), op.z(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vx(ts) - op.vx(ts))) < tol
+            max_abs_diff(o.vx(ts), op.vx(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vy(ts) - op.vy(ts))) < tol
+            max_abs_diff(o.vy(ts), op.vy(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vz(ts) - op.vz(ts))) < tol
+            max_abs_diff(o.vz(ts), op.vz(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         return None
 
@@ -2206,12 +1964,12 @@ def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalaromegaz():
     return None
 
 
-def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalaromegaz_2d():
+def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalaromegaz_2d(
+    bar_potentials,
+):
     # Integrate an orbit in both Python and C to check that they match in 2D
     # We don't need to known the true answer here
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot = bar_potentials
     x0 = [
         lambda t: -0.03 * t**2.0 / 2.0 - 0.03 * t**3.0 / 6.0 / 20.0,
         lambda t: 0.04 * t**2.0 / 2.0 + 0.08 * t**3.0 / 6.0 / 20.0,
@@ -2232,28 +1990,29 @@ def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalaromegaz_2d():
     framepot = potential.NonInertialFrameForce(
         x0=x0, v0=v0, a0=a0, Omega=omega, Omegadot=omegadot
     )
+    diskframepot = diskpot + framepot
 
     def check_orbit(py_method="dop853", c_method="dop853_c", tol=1e-8):
         # Now integrate an orbit in the rotating frame in Python
         o = Orbit().toPlanar()
         o.turn_physical_off()
         # Rotating frame in Python
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot + framepot, method=py_method)
+        ts = _TS
+        o.integrate(ts, diskframepot, method=py_method)
         # In C
         op = o()
-        op.integrate(ts, diskpot + framepot, method=c_method)
+        op.integrate(ts, diskframepot, method=c_method)
         assert (
-            numpy.amax(numpy.fabs(o.x(ts) - op.x(ts))) < tol
+            max_abs_diff(o.x(ts), op.x(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.y(ts) - op.y(ts))) < tol
+            max_abs_diff(o.y(ts), op.y(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vx(ts) - op.vx(ts))) < tol
+            max_abs_diff(o.vx(ts), op.vx(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vy(ts) - op.vy(ts))) < tol
+            max_abs_diff(o.vy(ts), op.vy(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         return None
 
@@ -2261,12 +2020,10 @@ def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalaromegaz_2d():
     return None
 
 
-def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_vecomegaz():
+def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_vecomegaz(bar_potentials):
     # Integrate an orbit in both Python and C to check that they match
     # We don't need to known the true answer here
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot = bar_potentials
     x0 = [
         lambda t: -0.03 * t**2.0 / 2.0 - 0.03 * t**3.0 / 6.0 / 20.0,
         lambda t: 0.04 * t**2.0 / 2.0 + 0.08 * t**3.0 / 6.0 / 20.0,
@@ -2291,34 +2048,35 @@ def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_vecomegaz():
         Omega=numpy.array([0.0, 0.0, omega]),
         Omegadot=numpy.array([0.0, 0.0, omegadot]),
     )
+    diskframepot = diskpot + framepot
 
     def check_orbit(py_method="dop853", c_method="dop853_c", tol=1e-9):
         # Now integrate an orbit in the rotating frame in Python
         o = Orbit()
         o.turn_physical_off()
         # Rotating frame in Python
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot + framepot, method=py_method)
+        ts = _TS
+        o.integrate(ts, diskframepot, method=py_method)
         # In C
         op = o()
-        op.integrate(ts, diskpot + framepot, method=c_method)
+        op.integrate(ts, diskframepot, method=c_method)
         assert (
-            numpy.amax(numpy.fabs(o.x(ts) - op.x(ts))) < tol
+            max_abs_diff(o.x(ts), op.x(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.y(ts) - op.y(ts))) < tol
+            max_abs_diff(o.y(ts), op.y(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.z(ts) - op.z(ts))) < tol
+            max_abs_diff(o.z(ts), op.z(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vx(ts) - op.vx(ts))) < tol
+            max_abs_diff(o.vx(ts), op.vx(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vy(ts) - op.vy(ts))) < tol
+            max_abs_diff(o.vy(ts), op.vy(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vz(ts) - op.vz(ts))) < tol
+            max_abs_diff(o.vz(ts), op.vz(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         return None
 
@@ -2326,12 +2084,12 @@ def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_vecomegaz():
     return None
 
 
-def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalarfuncomegaz():
+def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalarfuncomegaz(
+    bar_potentials,
+):
     # Integrate an orbit in both Python and C to check that they match
     # We don't need to known the true answer here
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot = bar_potentials
     x0 = [
         lambda t: -0.03 * t**2.0 / 2.0 - 0.03 * t**3.0 / 6.0 / 20.0,
         lambda t: 0.04 * t**2.0 / 2.0 + 0.08 * t**3.0 / 6.0 / 20.0,
@@ -2355,34 +2113,35 @@ def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalarfuncomegaz():
     framepot = potential.NonInertialFrameForce(
         x0=x0, v0=v0, a0=a0, Omega=omega_func, Omegadot=omegadot_func
     )
+    diskframepot = diskpot + framepot
 
     def check_orbit(py_method="dop853", c_method="dop853_c", tol=1e-8):
         # Now integrate an orbit in the rotating frame in Python
         o = Orbit()
         o.turn_physical_off()
         # Rotating frame in Python
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot + framepot, method=py_method)
+        ts = _TS
+        o.integrate(ts, diskframepot, method=py_method)
         # In C
         op = o()
-        op.integrate(ts, diskpot + framepot, method=c_method)
+        op.integrate(ts, diskframepot, method=c_method)
         assert (
-            numpy.amax(numpy.fabs(o.x(ts) - op.x(ts))) < tol
+            max_abs_diff(o.x(ts), op.x(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.y(ts) - op.y(ts))) < tol
+            max_abs_diff(o.y(ts), op.y(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.z(ts) - op.z(ts))) < tol
+            max_abs_diff(o.z(ts), op.z(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vx(ts) - op.vx(ts))) < tol
+            max_abs_diff(o.vx(ts), op.vx(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vy(ts) - op.vy(ts))) < tol
+            max_abs_diff(o.vy(ts), op.vy(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vz(ts) - op.vz(ts))) < tol
+            max_abs_diff(o.vz(ts), op.vz(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         return None
 
@@ -2390,12 +2149,10 @@ def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_scalarfuncomegaz():
     return None
 
 
-def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_vecomegaz():
+def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_vecomegaz(bar_potentials):
     # Integrate an orbit in both Python and C to check that they match
     # We don't need to known the true answer here
-    lp = potential.MiyamotoNagaiPotential(normalize=1.0, a=1.0, b=0.2)
-    dp = potential.DehnenBarPotential(omegab=1.8, rb=0.5, Af=0.03)
-    diskpot = lp + dp
+    lp, dp, diskpot = bar_potentials
     x0 = [
         lambda t: -0.03 * t**2.0 / 2.0 - 0.03 * t**3.0 / 6.0 / 20.0,
         lambda t: 0.04 * t**2.0 / 2.0 + 0.08 * t**3.0 / 6.0 / 20.0,
@@ -2423,34 +2180,35 @@ def test_python_vs_c_linacc_changingacc_xyz_accellsrframe_vecomegaz():
     framepot = potential.NonInertialFrameForce(
         x0=x0, v0=v0, a0=a0, Omega=omega_func, Omegadot=omegadot_func
     )
+    diskframepot = diskpot + framepot
 
     def check_orbit(py_method="dop853", c_method="dop853_c", tol=1e-8):
         # Now integrate an orbit in the rotating frame in Python
         o = Orbit()
         o.turn_physical_off()
         # Rotating frame in Python
-        ts = numpy.linspace(0.0, 20.0, 1001)
-        o.integrate(ts, diskpot + framepot, method=py_method)
+        ts = _TS
+        o.integrate(ts, diskframepot, method=py_method)
         # In C
         op = o()
-        op.integrate(ts, diskpot + framepot, method=c_method)
+        op.integrate(ts, diskframepot, method=c_method)
         assert (
-            numpy.amax(numpy.fabs(o.x(ts) - op.x(ts))) < tol
+            max_abs_diff(o.x(ts), op.x(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.y(ts) - op.y(ts))) < tol
+            max_abs_diff(o.y(ts), op.y(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.z(ts) - op.z(ts))) < tol
+            max_abs_diff(o.z(ts), op.z(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vx(ts) - op.vx(ts))) < tol
+            max_abs_diff(o.vx(ts), op.vx(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vy(ts) - op.vy(ts))) < tol
+            max_abs_diff(o.vy(ts), op.vy(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         assert (
-            numpy.amax(numpy.fabs(o.vz(ts) - op.vz(ts))) < tol
+            max_abs_diff(o.vz(ts), op.vz(ts)) < tol
         ), f"Integrating an orbit in a rotating frame in Python does not agree with integrating the same orbit in C; using methods {py_method} and {c_method}"
         return None
 
@@ -2468,6 +2226,23 @@ from galpy.potential.Potential import (
 from galpy.potential.WrapperPotential import parentWrapperPotential
 
 
+def _remember_last_force(force_xyz):
+    # The orbit integrators evaluate _Rforce, _phitorque, and _zforce one
+    # after the other at the same point, so remember the forces at the last
+    # (scalar) point to only compute them once for all three
+    @functools.wraps(force_xyz)
+    def wrapper(self, R, z, phi=0.0, t=0.0):
+        point = (R, z, phi, t)
+        if not all(isinstance(x, numbers.Number) for x in point):
+            return force_xyz(self, R, z, phi=phi, t=t)
+        if point != self._last_point:
+            self._last_point = point
+            self._last_force = force_xyz(self, R, z, phi=phi, t=t)
+        return self._last_force
+
+    return wrapper
+
+
 class AcceleratingPotentialWrapperPotential(parentWrapperPotential):
     def __init__(
         self,
@@ -2487,60 +2262,155 @@ class AcceleratingPotentialWrapperPotential(parentWrapperPotential):
         self._omegaz = omegaz
         self._omegazdot = omegazdot
         self._omegazdotdot = omegazdotdot
+        self._last_point = None
 
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         Fxyz = self._force_xyz(R, z, phi=phi, t=t)
-        return numpy.cos(phi) * Fxyz[0] + numpy.sin(phi) * Fxyz[1]
+        cosphi, sinphi = _cos_sin(phi)
+        return cosphi * Fxyz[0] + sinphi * Fxyz[1]
 
     def _phitorque(self, R, z, phi=0.0, t=0.0):
         Fxyz = self._force_xyz(R, z, phi=phi, t=t)
-        return R * (-numpy.sin(phi) * Fxyz[0] + numpy.cos(phi) * Fxyz[1])
+        cosphi, sinphi = _cos_sin(phi)
+        return R * (-sinphi * Fxyz[0] + cosphi * Fxyz[1])
 
     def _zforce(self, R, z, phi=0.0, t=0.0):
         return self._force_xyz(R, z, phi=phi, t=t)[2]
 
+    @_remember_last_force
     def _force_xyz(self, R, z, phi=0.0, t=0.0):
         """Get the rectangular forces in the transformed frame"""
-        x, y, _ = coords.cyl_to_rect(R, phi, z)
-        xp = x + self._x0[0](t)
-        yp = y + self._x0[1](t)
+        # Shift to the accelerated origin, converting to and from rectangular
+        # coordinates inline rather than through coords
+        cosphi, sinphi = _cos_sin(phi)
+        xp = R * cosphi + self._x0[0](t)
+        yp = R * sinphi + self._x0[1](t)
         zp = z + self._x0[2](t)
-        Rp, phip, zp = coords.rect_to_cyl(xp, yp, zp)
+        Rp, phip = numpy.sqrt(xp**2.0 + yp**2.0), numpy.arctan2(yp, xp)
         if not self._omegaz is None:
-            phip += self._omegaz * t
+            rotphi = self._omegaz * t
             if not self._omegazdot is None:
-                phip += self._omegazdot * t**2.0 / 2.0
+                rotphi += self._omegazdot * t**2.0 / 2.0
             if not self._omegazdotdot is None:
-                phip += self._omegazdotdot * t**3.0 / 6.0
+                rotphi += self._omegazdotdot * t**3.0 / 6.0
+            phip = phip + rotphi
         Rforcep = _evaluateRforces(self._pot, Rp, zp, phi=phip, t=t)
         phitorquep = _evaluatephitorques(self._pot, Rp, zp, phi=phip, t=t)
         zforcep = _evaluatezforces(self._pot, Rp, zp, phi=phip, t=t)
-        xforcep = numpy.cos(phip) * Rforcep - numpy.sin(phip) * phitorquep / Rp
-        yforcep = numpy.sin(phip) * Rforcep + numpy.cos(phip) * phitorquep / Rp
+        cosphip, sinphip = _cos_sin(phip)
+        xforcep = cosphip * Rforcep - sinphip * phitorquep / Rp
+        yforcep = sinphip * Rforcep + cosphip * phitorquep / Rp
         if not self._omegaz is None:
-            rotphi = self._omegaz * t
-            if not self._omegazdot is None:
-                rotphi += self._omegazdot * t**2.0 / 2.0
-            if not self._omegazdotdot is None:
-                rotphi += self._omegazdotdot * t**3.0 / 6.0
-            return numpy.dot(
-                numpy.array(
-                    [
-                        [numpy.cos(rotphi), numpy.sin(rotphi), 0.0],
-                        [-numpy.sin(rotphi), numpy.cos(rotphi), 0.0],
-                        [0.0, 0.0, 1.0],
-                    ]
-                ),
-                numpy.array([xforcep, yforcep, zforcep]),
+            # Rotate the forces back by -rotphi
+            cosrotphi, sinrotphi = _cos_sin(rotphi)
+            return numpy.array(
+                [
+                    cosrotphi * xforcep + sinrotphi * yforcep,
+                    -sinrotphi * xforcep + cosrotphi * yforcep,
+                    zforcep,
+                ]
             )
         else:
             return numpy.array([xforcep, yforcep, zforcep])
 
 
+def max_abs_diff(a, b):
+    # Maximum absolute difference between two trajectories, taking the
+    # absolute value in place to avoid a second temporary array
+    diff = numpy.subtract(a, b)
+    numpy.fabs(diff, out=diff)
+    return numpy.amax(diff)
+
+
+def _cos_sin(phi):
+    # cos and sin of phi; the wrappers below are evaluated for a single phi
+    # during orbit integration, for which math is much faster than numpy
+    if isinstance(phi, (float, numpy.floating)):
+        return math.cos(phi), math.sin(phi)
+    return numpy.cos(phi), numpy.sin(phi)
+
+
 # Functions and wrappers for rotation around an arbitrary axis
 # Rotation happens around an axis that is rotated by rot
 # So transformation from rotating to inertial is
 # rot.T x omega-rotation x rot
+@functools.lru_cache(maxsize=None)
+def rot_for_zvec(zvec):
+    # Rotation matrix that rotates zvec to the z axis; only depends on zvec,
+    # not on the wrapped potential, so it can be shared between tests
+    rot = potential.RotateAndTiltWrapperPotential(
+        pot=potential.NullPotential(), zvec=list(zvec)
+    )._rot
+    rot.setflags(write=False)
+    return rot
+
+
+def _rotate_around_axis(x, y, z, rot, theta):
+    # Apply rot.T x (rotation by theta around the z axis) x rot to (x,y,z);
+    # compiled with numba when available, because this is called for every
+    # force evaluation when integrating in RotatingPotentialWrapperPotential
+    xp = rot[0, 0] * x + rot[0, 1] * y + rot[0, 2] * z
+    yp = rot[1, 0] * x + rot[1, 1] * y + rot[1, 2] * z
+    zp = rot[2, 0] * x + rot[2, 1] * y + rot[2, 2] * z
+    costheta, sintheta = numpy.cos(theta), numpy.sin(theta)
+    xp, yp = costheta * xp - sintheta * yp, sintheta * xp + costheta * yp
+    return (
+        rot[0, 0] * xp + rot[1, 0] * yp + rot[2, 0] * zp,
+        rot[0, 1] * xp + rot[1, 1] * yp + rot[2, 1] * zp,
+        rot[0, 2] * xp + rot[1, 2] * yp + rot[2, 2] * zp,
+    )
+
+
+if _NUMBA_LOADED:
+    _rotate_around_axis = numba.njit(_rotate_around_axis)
+
+
+def _rotate_cyl_around_axis(R, z, phi, rot, theta):
+    # Same as _rotate_around_axis, but for cylindrical coordinates; does the
+    # conversions to and from rectangular coordinates of coords.cyl_to_rect
+    # and coords.rect_to_cyl inline, so they get compiled as well
+    xr, yr, zr = _rotate_around_axis(
+        R * numpy.cos(phi), R * numpy.sin(phi), z, rot, theta
+    )
+    return numpy.sqrt(xr**2.0 + yr**2.0), numpy.arctan2(yr, xr), zr
+
+
+if _NUMBA_LOADED:
+    _rotate_cyl_around_axis = numba.njit(_rotate_cyl_around_axis)
+
+
+def _rotate_cyl_vec_around_axis(vR, vT, vz, R, z, phi, rot, theta, thetadot):
+    # Same as _rotate_cyl_around_axis, but for a velocity (vR,vT,vz) at
+    # (R,z,phi) in a frame rotating at the rate thetadot; the velocity of the
+    # rotating frame in the inertial frame is thetadot n x r, with
+    # n = rot.T x zhat = rot[2] the rotation axis
+    cosphi, sinphi = numpy.cos(phi), numpy.sin(phi)
+    xr, yr, zr = _rotate_around_axis(R * cosphi, R * sinphi, z, rot, theta)
+    vxr, vyr, vzr = _rotate_around_axis(
+        vR * cosphi - vT * sinphi, vR * sinphi + vT * cosphi, vz, rot, theta
+    )
+    vx = vxr + thetadot * (rot[2, 1] * zr - rot[2, 2] * yr)
+    vy = vyr + thetadot * (rot[2, 2] * xr - rot[2, 0] * zr)
+    vzout = vzr + thetadot * (rot[2, 0] * yr - rot[2, 1] * xr)
+    phir = numpy.arctan2(yr, xr)
+    cosphir, sinphir = numpy.cos(phir), numpy.sin(phir)
+    return vx * cosphir + vy * sinphir, -vx * sinphir + vy * cosphir, vzout
+
+
+if _NUMBA_LOADED:
+    _rotate_cyl_vec_around_axis = numba.njit(_rotate_cyl_vec_around_axis)
+
+
+def _rotation_angle(t, omega, omegadot=None, omegadotdot=None):
+    # Angle by which the frame has rotated around its rotated z axis at time t
+    theta = omega * t
+    if not omegadot is None:
+        theta = theta + omegadot * t**2.0 / 2.0
+    if not omegadotdot is None:
+        theta = theta + omegadotdot * t**3.0 / 6.0
+    return theta
+
+
 def rotate_and_omega(
     R,
     z,
@@ -2553,24 +2423,11 @@ def rotate_and_omega(
     rect=False,
 ):
     # From the rotating frame to the inertial frame
+    # (inputs can be arrays, e.g., along an orbit at times t)
+    theta = _rotation_angle(t, omega, omegadot, omegadotdot)
     if rect:
-        x, y, z = R, z, phi
-    else:
-        x, y, z = coords.cyl_to_rect(R, phi, z)
-    xyzp = numpy.dot(rot, numpy.array([x, y, z]))
-    Rp, phip, zp = coords.rect_to_cyl(xyzp[0], xyzp[1], xyzp[2])
-    phip += omega * t
-    if not omegadot is None:
-        phip += omegadot * t**2.0 / 2.0
-    if not omegadotdot is None:
-        phip += omegadotdot * t**3.0 / 6.0
-    xp, yp, zp = coords.cyl_to_rect(Rp, phip, zp)
-    xyz = numpy.dot(rot.T, numpy.array([xp, yp, zp]))
-    if rect:
-        R, phi, z = xyz[0], xyz[1], xyz[2]
-    else:
-        R, phi, z = coords.rect_to_cyl(xyz[0], xyz[1], xyz[2])
-    return R, phi, z
+        return _rotate_around_axis(R, z, phi, rot, theta)
+    return _rotate_cyl_around_axis(R, z, phi, rot, theta)
 
 
 def rotate_and_omega_vec(
@@ -2587,72 +2444,24 @@ def rotate_and_omega_vec(
     omegadotdot=None,
 ):
     # From the rotating frame to the inertial frame, for vectors
-    x, y, z = coords.cyl_to_rect(R, phi, z)
-    vx, vy, vz = coords.cyl_to_rect_vec(vR, vT, vz, phi=phi)
-    xyzp = numpy.dot(rot, numpy.array([x, y, z]))
-    Rp, phip, zp = coords.rect_to_cyl(xyzp[0], xyzp[1], xyzp[2])
-    vxyzp = numpy.dot(rot, numpy.array([vx, vy, vz]))
-    vRp, vTp, vzp = coords.rect_to_cyl_vec(
-        vxyzp[0], vxyzp[1], vxyzp[2], xyzp[0], xyzp[1], xyzp[2]
-    )
-    phip += omega * t
-    vTp += omega * Rp
+    # (inputs can be arrays, e.g., along an orbit at times t)
+    # Rotation angle and rotation rate around the rotated z axis
+    theta, thetadot = omega * t, omega
     if not omegadot is None:
-        phip += omegadot * t**2.0 / 2.0
-        vTp += omegadot * t * Rp
+        theta = theta + omegadot * t**2.0 / 2.0
+        thetadot = thetadot + omegadot * t
     if not omegadotdot is None:
-        phip += omegadotdot * t**3.0 / 6.0
-        vTp += omegadotdot * t**2.0 / 2.0 * Rp
-    xp, yp, zp = coords.cyl_to_rect(Rp, phip, zp)
-    vxp, vyp, vzp = coords.cyl_to_rect_vec(vRp, vTp, vzp, phi=phip)
-    xyz = numpy.dot(rot.T, numpy.array([xp, yp, zp]))
-    vxyz = numpy.dot(rot.T, numpy.array([vxp, vyp, vzp]))
-    vR, vT, vz = coords.rect_to_cyl_vec(
-        vxyz[0], vxyz[1], vxyz[2], xyz[0], xyz[1], xyz[2]
-    )
-    return vR, vT, vz
+        theta = theta + omegadotdot * t**3.0 / 6.0
+        thetadot = thetadot + omegadotdot * t**2.0 / 2.0
+    return _rotate_cyl_vec_around_axis(vR, vT, vz, R, z, phi, rot, theta, thetadot)
 
 
-def derive_noninert_omega(
-    omega, rot=None, x=1.0, y=2.0, z=3.0, x2=-1.0, y2=2.0, z2=-5.0, t=0.0
-):
-    # Numerically compute Omega of the non-inertial frame
-    # Need to use the rotation of two arbitrary (non-parallel) vectors
-    # To fully describe the rotation
-    # Then can solve for it
-    # See https://en.wikipedia.org/wiki/Rotation_formalisms_in_three_dimensions#Conversion_formulae_for_derivatives
-    # Let's begin
-    # Compute d r / d t, numerically
-    eps = 1e-6
-    r11 = rotate_and_omega(x, y, phi=z, t=t, rot=rot, omega=omega, rect=True)
-    r12 = rotate_and_omega(x, y, phi=z, t=t + eps, rot=rot, omega=omega, rect=True)
-    dr1dt = (numpy.array(r12) - numpy.array(r11)) / eps
-    r21 = rotate_and_omega(x2, y2, phi=z2, t=t, rot=rot, omega=omega, rect=True)
-    r22 = rotate_and_omega(x2, y2, phi=z2, t=t + eps, rot=rot, omega=omega, rect=True)
-    dr2dt = (numpy.array(r22) - numpy.array(r21)) / eps
-    # Solve
-    # dxdt= -omegaz * y + omegay * z
-    # dydt=  omegaz * x - omegax * z
-    # dzdt= -omegay * x + omegax * y
-    # with the two given points. Use
-    # dy1dt= omegaz * x1 - omegax * z1
-    # dy2dt= omegaz * x2 - omegax * z2
-    # dy1dt * x2 - dy2dt * x1 = -omegax * ( z1 * x2 - z2 * x1)
-    # and
-    # dx1dt= -omegaz * y1 + omegay * z1
-    # dx2dt= -omegaz * y2 + omegay * z2
-    # dx1dt * y2 - dx2dt * y1 =  omegay * ( z1 * y2 - z2 * y1 )
-    # dx1dt * z2 - dx2dt * z1 = -omegaz * ( y1 * z2 - y2 * z1 )
-    omegax = -(dr1dt[1] * r21[0] - dr2dt[1] * r11[0]) / (
-        r11[2] * r21[0] - r21[2] * r11[0]
-    )
-    omegay = (dr1dt[0] * r21[1] - dr2dt[0] * r11[1]) / (
-        r11[2] * r21[1] - r21[2] * r11[1]
-    )
-    omegaz = -(dr1dt[0] * r21[2] - dr2dt[0] * r11[2]) / (
-        r11[1] * r21[2] - r21[1] * r11[2]
-    )
-    return (omegax, omegay, omegaz)
+def derive_noninert_omega(omega, rot=None):
+    # Omega of the non-inertial frame: the frame rotates as
+    # rot.T x (rotation by omega t around the z axis) x rot, so its angular
+    # velocity vector is that around the z axis rotated back by rot.T, i.e.,
+    # rot.T x (0,0,omega) = omega x (the last row of rot)
+    return tuple(omega * rot[2])
 
 
 class RotatingPotentialWrapperPotential(parentWrapperPotential):
@@ -2672,79 +2481,34 @@ class RotatingPotentialWrapperPotential(parentWrapperPotential):
         self._omega = omega
         self._omegadot = omegadot
         self._omegadotdot = omegadotdot
+        self._last_point = None
 
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         Fxyz = self._force_xyz(R, z, phi=phi, t=t)
-        return numpy.cos(phi) * Fxyz[0] + numpy.sin(phi) * Fxyz[1]
+        cosphi, sinphi = _cos_sin(phi)
+        return cosphi * Fxyz[0] + sinphi * Fxyz[1]
 
     def _phitorque(self, R, z, phi=0.0, t=0.0):
         Fxyz = self._force_xyz(R, z, phi=phi, t=t)
-        return R * (-numpy.sin(phi) * Fxyz[0] + numpy.cos(phi) * Fxyz[1])
+        cosphi, sinphi = _cos_sin(phi)
+        return R * (-sinphi * Fxyz[0] + cosphi * Fxyz[1])
 
     def _zforce(self, R, z, phi=0.0, t=0.0):
         return self._force_xyz(R, z, phi=phi, t=t)[2]
 
+    @_remember_last_force
     def _force_xyz(self, R, z, phi=0.0, t=0.0):
         """Get the rectangular forces in the transformed frame"""
-        Rp, phip, zp = rotate_and_omega(
-            R,
-            z,
-            phi=phi,
-            t=t,
-            rot=self._rot,
-            omega=self._omega,
-            omegadot=self._omegadot,
-            omegadotdot=self._omegadotdot,
-        )
+        theta = _rotation_angle(t, self._omega, self._omegadot, self._omegadotdot)
+        Rp, phip, zp = _rotate_cyl_around_axis(R, z, phi, self._rot, theta)
         Rforcep = _evaluateRforces(self._pot, Rp, zp, phi=phip, t=t)
         phitorquep = _evaluatephitorques(self._pot, Rp, zp, phi=phip, t=t)
         zforcep = _evaluatezforces(self._pot, Rp, zp, phi=phip, t=t)
-        xforcep = numpy.cos(phip) * Rforcep - numpy.sin(phip) * phitorquep / Rp
-        yforcep = numpy.sin(phip) * Rforcep + numpy.cos(phip) * phitorquep / Rp
-        # Now figure out the inverse rotation matrix to rotate the forces
-        # The way this is written, we effectively compute the transpose of the
-        # rotation matrix, which is its inverse
-        inv_rot = numpy.array(
-            [
-                list(
-                    rotate_and_omega(
-                        1.0,
-                        0.0,
-                        phi=0.0,
-                        t=t,
-                        rot=self._rot,
-                        omega=self._omega,
-                        omegadot=self._omegadot,
-                        omegadotdot=self._omegadotdot,
-                        rect=True,
-                    )
-                ),
-                list(
-                    rotate_and_omega(
-                        0.0,
-                        1.0,
-                        phi=0.0,
-                        t=t,
-                        rot=self._rot,
-                        omega=self._omega,
-                        omegadot=self._omegadot,
-                        omegadotdot=self._omegadotdot,
-                        rect=True,
-                    )
-                ),
-                list(
-                    rotate_and_omega(
-                        0.0,
-                        0.0,
-                        phi=1.0,
-                        t=t,
-                        rot=self._rot,
-                        omega=self._omega,
-                        omegadot=self._omegadot,
-                        omegadotdot=self._omegadotdot,
-                        rect=True,
-                    )
-                ),
-            ]
+        cosphip, sinphip = _cos_sin(phip)
+        xforcep = cosphip * Rforcep - sinphip * phitorquep / Rp
+        yforcep = sinphip * Rforcep + cosphip * phitorquep / Rp
+        # Rotate the forces back with the inverse, i.e., the transpose, of the
+        # rotation matrix, which is the same rotation by -theta
+        return numpy.array(
+            _rotate_around_axis(xforcep, yforcep, zforcep, self._rot, -theta)
         )
-        return numpy.dot(inv_rot, numpy.array([xforcep, yforcep, zforcep]))
@@ -1532,7 +1532,6 @@ def test_potential_array_input():
     rmpots.append("RazorThinExponentialDiskPotential")
     rmpots.append("AnyAxisymmetricRazorThinDiskPotential")
     rmpots.append("AnySphericalPotential")
-    rmpots.append("SphericalShellPotential")
     rmpots.append("HomogeneousSpherePotential")
     rmpots.append("TriaxialGaussianPotential")
     rmpots.append("PowerTriaxialPotential")
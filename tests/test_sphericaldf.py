@@ -711,6 +711,32 @@ def test_osipkovmerritt_hernquist_beta_directint():
     return None
 
 
+# Test that the compiled velocity-moment integrand agrees with the general one
+def test_osipkovmerritt_hernquist_vmoment_compiled():
+    pytest.importorskip("numba")
+    from galpy.df.osipkovmerrittdf import _osipkovmerrittdf
+    from galpy.potential.Potential import _evaluatePotentials
+
+    pot = potential.HernquistPotential(amp=2.3, a=1.3)
+    dfh = osipkovmerrittHernquistdf(pot=pot, ra=2.3, numba=True)
+    assert dfh._numba, "numba=True should use the compiled integrand"
+    assert not osipkovmerrittHernquistdf(
+        pot=pot, ra=2.3
+    )._numba, "The compiled integrand should only be used with numba=True"
+    for r in [0.1, 1.3, 13.0]:
+        Pot = _evaluatePotentials(pot, r, 0.0)
+        vmax = dfh._vmax_at_r(pot, r)
+        for k in [2.0, 4.0, 6.0]:
+            assert (
+                numpy.fabs(
+                    dfh._vmoment_vintegral(Pot, vmax, k)
+                    - _osipkovmerrittdf._vmoment_vintegral(dfh, Pot, vmax, k)
+                )
+                < 1e-8
+            ), "Compiled velocity-moment integral of osipkovmerrittHernquistdf does not agree with the general one"
+    return None
+
+
 # Test that the differential energy distribution approaches the isotropic one at
 # E=Emin and the radial one at E=Emax
 def test_osipkovmerritt_hernquist_dMdE_limits():
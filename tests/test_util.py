@@ -1,5 +1,6 @@
 # Test the functions in galpy/util/__init__.py
 import numpy
+import pytest
 
 
 def test_save_pickles():
@@ -101,3 +102,55 @@ def test_quadpack():
         numpy.fabs(int[0] - 1.0) < int[1]
     ), "galpy.util.quadpack.dblquad did not work as expected"
     return None
+
+
+def test_leapfrog_numba():
+    # Test that leapfrog with a numba-compiled force agrees with the Python
+    # loop and with the analytic solution for a harmonic oscillator
+    from galpy.util import symplecticode
+
+    numba = pytest.importorskip("numba")
+
+    def force(q, omega, t=0.0):
+        return -omega * omega * q
+
+    yo = numpy.array([1.0, 0.5, 0.0, 0.2])
+    t = numpy.linspace(0.0, 10.0, 101)
+    out_py = symplecticode.leapfrog(force, yo, t, args=(1.3,), rtol=1e-8)
+    out_nb = symplecticode.leapfrog(numba.njit(force), yo, t, args=(1.3,), rtol=1e-8)
+    assert numpy.all(
+        numpy.fabs(out_py - out_nb) < 10.0**-12.0
+    ), "leapfrog with a numba-compiled force does not agree with the Python version"
+    assert numpy.all(
+        numpy.fabs(out_nb[:, 0] - numpy.cos(1.3 * t)) < 10.0**-4.0
+    ), "leapfrog with a numba-compiled force does not agree with the analytic solution"
+    return None
+
+
+def test_leapfrog_dt_fixed():
+    # Test that leapfrog with dt_fixed=True uses the spacing of t as the step
+    # size, and that ndt_max caps the estimated number of steps
+    from galpy.util import symplecticode
+
+    ncalls = [0]
+
+    def force(q, omega, t=0.0):
+        ncalls[0] += 1
+        return -omega * omega * q
+
+    yo = numpy.array([1.0, 0.5, 0.0, 0.2])
+    t = numpy.linspace(0.0, 10.0, 10001)
+    out = symplecticode.leapfrog(force, yo, t, args=(1.3,), dt_fixed=True)
+    assert (
+        ncalls[0] == len(t) - 1
+    ), "leapfrog with dt_fixed=True does not take a single step per interval"
+    assert numpy.all(
+        numpy.fabs(out[:, 0] - numpy.cos(1.3 * t)) < 10.0**-6.0
+    ), "leapfrog with dt_fixed=True does not agree with the analytic solution"
+    # With ndt_max=1, the estimated step cannot be smaller than the spacing
+    out_max = symplecticode.leapfrog(force, yo, t[:11], args=(1.3,), ndt_max=1.0)
+    out_fixed = symplecticode.leapfrog(force, yo, t[:11], args=(1.3,), dt_fixed=True)
+    assert numpy.all(
+        numpy.fabs(out_max - out_fixed) < 10.0**-14.0
+    ), "leapfrog with ndt_max=1 does not take a single step per interval"
+    return None